@@ -7,11 +7,13 @@ from tcex.api.tc.ti_transform.ti_predefined_functions import (
 )
 from tcex.api.tc.ti_transform.ti_transform import TiTransform, TiTransforms
 from tcex.api.tc.ti_transform.transform_abc import TransformException
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
 
 __all__ = [
     'ProcessingFunctions',
     'TiTransform',
     'TiTransforms',
     'TransformException',
+    'TransformPlan',
     'transform_builder_to_model',
 ]
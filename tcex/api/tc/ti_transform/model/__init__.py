@@ -4,6 +4,7 @@
 from tcex.api.tc.ti_transform.model.transform_model import (
     AttributeTransformModel,
     DatetimeTransformModel,
+    DispatchTransformModel,
     GroupTransformModel,
     IndicatorTransformModel,
     MetadataTransformModel,
@@ -16,6 +17,7 @@ from tcex.api.tc.ti_transform.model.transform_model import (
 __all__ = [
     'AttributeTransformModel',
     'DatetimeTransformModel',
+    'DispatchTransformModel',
     'GroupTransformModel',
     'IndicatorTransformModel',
     'MetadataTransformModel',
@@ -89,6 +89,25 @@ class MetadataTransformModel(PathTransformModel, extra=Extra.forbid):
     _transform_array = validator('transform', allow_reuse=True, pre=True)(_always_array)
 
 
+class DispatchTransformModel(BaseModel, extra=Extra.forbid):
+    """."""
+
+    path: str = Field(..., description='')
+    values: list[str] = Field(..., description='')
+
+    # validators
+    _values_array = validator('values', allow_reuse=True, pre=True)(_always_array)
+
+    @validator('path')
+    def _validate_path(cls, v):
+        """Validate path."""
+        try:
+            _ = jmespath_compile(v)
+        except Exception:
+            raise ValueError('A valid path must be provided.')
+        return v
+
+
 class ValueTransformModel(BaseModel, extra=Extra.forbid):
     """."""
 
@@ -138,6 +157,7 @@ class TiTransformModel(BaseModel, extra=Extra.forbid):
     associated_groups: list[AssociatedGroupTransform] = Field([], description='')
     attributes: list[AttributeTransformModel] = Field([], description='')
     date_added: DatetimeTransformModel | None = Field(None, description='')
+    dispatch: DispatchTransformModel | None = Field(None, description='')
     external_date_added: DatetimeTransformModel | None = Field(None, description='')
     external_date_expires: DatetimeTransformModel | None = Field(None, description='')
     external_last_modified: DatetimeTransformModel | None = Field(None, description='')
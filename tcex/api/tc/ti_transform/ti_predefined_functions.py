@@ -4,9 +4,9 @@
 import hashlib
 import json
 import uuid
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from inspect import _empty, signature
-from typing import TypedDict
+from typing import Any, TypedDict
 
 # first-party
 # first-part
@@ -97,6 +97,9 @@ def custom_function_definition(definition: FunctionDefinition):
 class ProcessingFunctions:
     """Predefined functions to use in transforms."""
 
+    # the max number of values cached by a parsed function before the cache is cleared
+    _parsed_cache_size = 10_000
+
     def __init__(self, tcex) -> None:
         """."""
         self.tcex = tcex
@@ -134,6 +137,41 @@ class ProcessingFunctions:
             raise NotImplementedError(f'Custom function not implemented: {description}')
         return fn(value, ti_dict=ti_dict, transform=transform, **kwargs)
 
+    def batch_fn(self, fn: Callable, kwargs: dict | None = None) -> Callable[[list], list] | None:
+        """Return the batch variant of a predefined function with its arguments parsed once.
+
+        The batch variant takes a list of values and returns the results in the same order
+        (e.g., batch_fn(self.value_in, {'values': 'a, b'})(['a', 'c']) returns ['a', None]).
+        None is returned for functions without a parsed variant (e.g., custom).
+
+        Args:
+            fn: The predefined function (a method of this instance).
+            kwargs: The keyword arguments for the function.
+        """
+        parsed_fn = self.parsed_fn(fn, kwargs)
+        if parsed_fn is None:
+            return None
+        return lambda values: [parsed_fn(value) for value in values]
+
+    def parsed_fn(self, fn: Callable, kwargs: dict | None = None) -> Callable[[Any], Any] | None:
+        """Return a predefined function that takes only the value, with its arguments parsed once.
+
+        For example, parsed_fn(self.value_in, {'values': 'a, b'})('c') returns None without
+        parsing the values again. None is returned for functions without a parsed variant
+        (e.g., custom).
+
+        Args:
+            fn: The predefined function (a method of this instance).
+            kwargs: The keyword arguments for the function.
+        """
+        if getattr(fn, '__self__', None) is not self:
+            return None
+
+        factory = getattr(self, f'_parsed_{fn.__name__}', None)
+        if factory is None:
+            return None
+        return factory(**(kwargs or {}))
+
     def static_map(self, value, mapping: dict):
         """Map values to static values.
 
@@ -279,13 +317,11 @@ class ProcessingFunctions:
         def _is_function(obj):
             return type(obj).__name__ == 'method'
 
+        helpers = ('batch_fn', 'get_function_definitions', 'parsed_fn', 'translate_def_to_fn')
         fns = [
             fn
             for fn in (
-                getattr(self, n)
-                for n in dir(self)
-                if not n.startswith('_')
-                and n not in ('get_function_definitions', 'translate_def_to_fn')
+                getattr(self, n) for n in dir(self) if not n.startswith('_') and n not in helpers
             )
             if _is_function(fn)
         ]
@@ -303,6 +339,89 @@ class ProcessingFunctions:
 
         return specs  # type: ignore
 
+    def _parsed_append(self, suffix: str) -> Callable[[Any], Any]:
+        """Return append with its arguments parsed."""
+        return lambda value: f'{value}{suffix}'
+
+    def _parsed_convert_to_MITRE_tag(self) -> Callable[[Any], Any]:
+        """Return convert_to_MITRE_tag with repeated tags looked up once."""
+        tags: dict[Any, str | None] = {}
+
+        def _convert(value: Any) -> str | None:
+            """Return the MITRE tag for the value."""
+            try:
+                return tags[value]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable values are not cached
+                return self.convert_to_MITRE_tag(value)
+
+            if len(tags) >= self._parsed_cache_size:
+                tags.clear()
+            tag = tags[value] = self.convert_to_MITRE_tag(value)
+            return tag
+
+        return _convert
+
+    def _parsed_hash(self) -> Callable[[Any], Any]:
+        """Return hash with its arguments parsed."""
+        return lambda value: hashlib.sha256(str(value).encode('utf-8')).hexdigest()
+
+    def _parsed_prepend(self, prefix: str) -> Callable[[Any], Any]:
+        """Return prepend with its arguments parsed."""
+        return lambda value: f'{prefix}{value}'
+
+    def _parsed_remove_surrounding_whitespace(self) -> Callable[[Any], Any]:
+        """Return remove_surrounding_whitespace with its arguments parsed."""
+        return lambda value: value.strip()
+
+    def _parsed_replace(self, old_value: str, new_value: str = '') -> Callable[[Any], Any]:
+        """Return replace with its arguments parsed."""
+        return lambda value: value.replace(old_value, new_value)
+
+    def _parsed_split(self, delimiter: str = ',') -> Callable[[Any], Any]:
+        """Return split with its arguments parsed."""
+        return lambda value: [v.strip() for v in value.split(delimiter)]
+
+    def _parsed_static_map(self, mapping: dict) -> Callable[[Any], Any]:
+        """Return static_map with the mapping parsed once."""
+        if not isinstance(mapping, dict):
+            mapping = json.loads(mapping)
+        return lambda value: mapping.get(str(value), value)
+
+    def _parsed_to_lowercase(self) -> Callable[[Any], Any]:
+        """Return to_lowercase with its arguments parsed."""
+        return str.lower
+
+    def _parsed_to_titlecase(self) -> Callable[[Any], Any]:
+        """Return to_titlecase with its arguments parsed."""
+        return str.title
+
+    def _parsed_to_uppercase(self) -> Callable[[Any], Any]:
+        """Return to_uppercase with its arguments parsed."""
+        return str.upper
+
+    def _parsed_uuid5(self, namespace=None) -> Callable[[Any], Any]:
+        """Return uuid5 with its arguments parsed."""
+        namespace = namespace or uuid.NAMESPACE_DNS
+        return lambda value: str(uuid.uuid5(namespace, value))
+
+    def _parsed_value_in(self, values: str, delimiter: str = ',') -> Callable[[Any], Any]:
+        """Return value_in with the values parsed once into a set."""
+        if not values.startswith('"'):
+            values = f'"{values}"'
+        allowed = frozenset(v.strip() for v in json.loads(values).split(delimiter))
+
+        def _value_in(value):
+            """Return the value if it is in the allowed values, else return None."""
+            try:
+                return value if value in allowed else None
+            except TypeError:  # unhashable values are never in the allowed values
+                return None
+
+        return _value_in
+
     @staticmethod
     def _snake_to_titlecase(name):
         return name.replace('_', ' ').title()
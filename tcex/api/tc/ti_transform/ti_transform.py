@@ -1,7 +1,13 @@
 """TcEx Framework Module"""
 
 # standard library
+import json
+import multiprocessing
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
 
 # first-party
 from tcex.api.tc.ti_transform.model import GroupTransformModel, IndicatorTransformModel
@@ -16,11 +22,84 @@ from tcex.api.tc.ti_transform.transform_abc import (
 class TiTransforms(TransformsABC):
     """Mappings"""
 
+    def _batch_add(self, batch: dict, t: 'TiTransform'):
+        """Add the batch data of the transform (and any adhoc groups/indicators) to the batch."""
+        # batch must be called so that the transform type is selected
+        try:
+            data = t.batch
+        except NoValidTransformException:
+            self.log.exception('feature=ti-transforms, event=runtime-error')
+            return
+        except TransformException as e:
+            self.log.warning(
+                f'feature=ti-transforms, event=transform-error, field="{e.field}", '
+                f'cause="{e.cause}", context="{e.context}"'
+            )
+            if self.raise_exceptions:
+                raise
+            return
+        except Exception:
+            self.log.exception('feature=ti-transforms, event=transform-error')
+            if self.raise_exceptions:
+                raise
+            return
+
+        # now that batch is called we can identify the ti type
+        if isinstance(t.transform, GroupTransformModel):
+            batch['group'].append(data)
+        elif isinstance(t.transform, IndicatorTransformModel):
+            batch['indicator'].append(data)
+
+        # append adhoc groups and indicators
+        batch['group'].extend(t.adhoc_groups)
+        batch['indicator'].extend(t.adhoc_indicators)
+
+    def _batch_chunk(self, ti_dicts: list[dict]) -> dict:
+        """Return the data in batch format for a chunk of TI dicts."""
+        batch = {
+            'group': [],
+            'indicator': [],
+        }
+        for ti_dict in ti_dicts:
+            self._batch_add(batch, TiTransform(ti_dict, self.transforms, self.plan))
+        return batch
+
+    def _stream_pool(
+        self, chunks: Iterator[list[dict]], processes: int
+    ) -> Generator[dict, None, None]:
+        """Yield the batch data for each chunk, transformed by a pool of processes."""
+        # the fork start method doesn't require the transforms (e.g., lambdas) to be picklable
+        mp_context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+
+        futures: deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.transforms, self.raise_exceptions),
+        ) as executor:
+            try:
+                for chunk in islice(chunks, processes * 2):
+                    futures.append(executor.submit(_worker_batch_chunk, chunk))
+
+                while futures:
+                    batch = futures.popleft().result()
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        futures.append(executor.submit(_worker_batch_chunk, chunk))
+                    yield batch
+            finally:
+                # consumer stopped early or a chunk failed, don't transform any queued chunks
+                for future in futures:
+                    future.cancel()
+
     def process(self):
         """Process the mapping."""
         self.transformed_collection: list[TiTransform] = []
         for ti_dict in self.ti_dicts:
-            self.transformed_collection.append(TiTransform(ti_dict, self.transforms))
+            self.transformed_collection.append(TiTransform(ti_dict, self.transforms, self.plan))
 
     @property
     def batch(self) -> dict:
@@ -36,37 +115,54 @@ class TiTransforms(TransformsABC):
             if index and index % 1_000 == 0:
                 self.log.trace(f'feature=ti-transform-batch, items={index}')
 
-            # batch must be called so that the transform type is selected
-            try:
-                data = t.batch
-            except NoValidTransformException:
-                self.log.exception('feature=ti-transforms, event=runtime-error')
-                continue
-            except TransformException as e:
-                self.log.warning(
-                    f'feature=ti-transforms, event=transform-error, field="{e.field}", '
-                    f'cause="{e.cause}", context="{e.context}"'
-                )
-                if self.raise_exceptions:
-                    raise
-                continue
-            except Exception:
-                self.log.exception('feature=ti-transforms, event=transform-error')
-                if self.raise_exceptions:
-                    raise
-                continue
-
-            # now that batch is called we can identify the ti type
-            if isinstance(t.transform, GroupTransformModel):
-                batch['group'].append(data)
-            elif isinstance(t.transform, IndicatorTransformModel):
-                batch['indicator'].append(data)
-
-            # append adhoc groups and indicators
-            batch['group'].extend(t.adhoc_groups)
-            batch['indicator'].extend(t.adhoc_indicators)
+            self._batch_add(batch, t)
+
+        self.log.trace(
+            f'feature=ti-transform-batch, dispatch-hits={self.plan.dispatch_hits}, '
+            f'dispatch-misses={self.plan.dispatch_misses}'
+        )
         return batch
 
+    def stream(
+        self,
+        ti_dicts: Iterable[dict] | None = None,
+        chunk_size: int = 1_000,
+        processes: int = 0,
+    ) -> Generator[dict, None, None]:
+        """Yield the data in batch format for each chunk of TI dicts.
+
+        Unlike batch, the TI dicts are consumed (e.g., from a generator reading a feed) and
+        transformed in chunks, so neither the TI data nor the transformed data are held in
+        memory as a whole. Each yielded dict has the format of batch and can be added to a
+        batch job as it is yielded.
+
+        When processes is greater than 0, the chunks are transformed by a pool of processes
+        (for CPU bound transforms). The transforms are sent to each process once and the
+        chunks are yielded in order. On platforms without the fork start method the transforms
+        (including any callables) must be picklable.
+
+        .. code-block:: python
+
+            transforms = tcex.api.tc.ti_transforms([], [transform])
+            for batch in transforms.stream(read_feed(), processes=4):
+                batch_writer.add_groups(batch['group'], save=True)
+                batch_writer.add_indicators(batch['indicator'], save=True)
+
+        Args:
+            ti_dicts: The TI dicts to transform, defaults to the ti_dicts of this instance.
+            chunk_size: The number of TI dicts transformed per chunk.
+            processes: The number of worker processes, 0 transforms in the current process.
+        """
+        ti_dicts = iter(self.ti_dicts if ti_dicts is None else ti_dicts)
+        chunks = iter(lambda: list(islice(ti_dicts, chunk_size)), [])
+
+        if processes > 0:
+            yield from self._stream_pool(chunks, processes)
+            return
+
+        for chunk in chunks:
+            yield self._batch_chunk(chunk)
+
 
 class TiTransform(TransformABC):
     """Threat Intelligence Transform Module"""
@@ -200,3 +296,25 @@ class TiTransform(TransformABC):
         """Return the data in batch format."""
         self._process()
         return dict(sorted(self.transformed_item.items()))
+
+
+# the transforms of a worker process (see TiTransforms.stream)
+_worker_transforms: TiTransforms | None = None
+
+
+def _init_worker(
+    transforms: list[GroupTransformModel | IndicatorTransformModel], raise_exceptions: bool
+):
+    """Compile the transforms once for the worker process."""
+    global _worker_transforms  # pylint: disable=global-statement
+    _worker_transforms = TiTransforms([], transforms, raise_exceptions)
+
+
+def _worker_batch_chunk(ti_dicts: list[dict]) -> dict:
+    """Return the data in batch format for a chunk of TI dicts (in a worker process)."""
+    try:
+        return _worker_transforms._batch_chunk(ti_dicts)  # type: ignore
+    except TransformException as e:
+        # the context can include callables (e.g., lambdas) that can't be sent to the parent
+        context = json.loads(json.dumps(e.context, default=str))
+        raise TransformException(e.field, e.cause, context) from None
@@ -1,17 +1,14 @@
 """TcEx Framework Module"""
 
 # standard library
-import collections
 import logging
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import datetime
-from inspect import signature
+from functools import lru_cache
 from typing import Any, cast
 
-# third-party
-import jmespath
-
 # first-party
 from tcex.api.tc.ti_transform import ti_predefined_functions
 from tcex.api.tc.ti_transform.model import AttributeTransformModel  # TYPE-CHECKING
@@ -27,14 +24,37 @@ from tcex.api.tc.ti_transform.model.transform_model import (
     DatetimeTransformModel,
     FileOccurrenceTransformModel,
     PredefinedFunctionModel,
+    TransformModel,
 )
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
 from tcex.logger.trace_logger import TraceLogger
-from tcex.pleb.jmespath_custom import TcFunctions
-from tcex.util import Util
+from tcex.util.datetime_operation import DatetimeOperation
 
 # get tcex logger
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
+# an ISO 8601 date/datetime or a numeric epoch, the only values whose parsed datetime doesn't
+# depend on the current date (e.g., "2024" or "Monday 2024" are filled in from today)
+_absolute_datetime = re.compile(
+    r'^(?:\d{9,}(?:\.\d+)?'
+    r'|\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?)$'
+)
+
+
+def _datetime_cache_key(value: Any) -> str | None:
+    """Return the cache key for an absolute datetime value or None if it is not absolute."""
+    if isinstance(value, (int, float, str)):
+        key = str(value)
+        if _absolute_datetime.match(key):
+            return key
+    return None
+
+
+@lru_cache(maxsize=8_192)
+def _format_datetime(value: str) -> str:
+    """Return the absolute datetime value as a TC datetime string (cached)."""
+    return DatetimeOperation.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 
 class TransformException(Exception):
     """Base exception for transform errors."""
@@ -46,6 +66,10 @@ class TransformException(Exception):
         self.cause = cause
         self.context = context
 
+    def __reduce__(self) -> tuple:
+        """Support pickling (e.g., when raised in a worker process)."""
+        return self.__class__, (self.field, self.cause, self.context, *self.args)
+
     def __str__(self) -> str:
         """."""
         return f'Error transforming {self.field}: {self.cause}'
@@ -76,26 +100,52 @@ class TransformsABC(ABC):
         # validate transforms
         self._validate_transforms()
 
+        # compile the transforms once for all TI dicts
+        self.plan = TransformPlan(self.transforms)
+
     def _validate_transforms(self):
         """Validate the transform model."""
         if len(self.transforms) > 1:
             for transform in self.transforms:
-                if not callable(transform.applies):
+                if not callable(transform.applies) and transform.dispatch is None:
                     raise ValueError(
                         'If more than one transform is provided, each '
-                        'provided transform must provide an apply field.',
+                        'provided transform must provide an apply or dispatch field.',
                     )
 
 
 class TransformABC(ABC):
     """Transform Abstract Base Class"""
 
+    # the TC datetime fields and the transform model field they are processed from
+    _datetime_fields = (
+        ('dateAdded', 'date_added'),
+        ('lastModified', 'last_modified'),
+        ('firstSeen', 'first_seen'),
+        ('lastSeen', 'last_seen'),
+        ('externalDateAdded', 'external_date_added'),
+        ('externalDateExpires', 'external_date_expires'),
+        ('externalLastModified', 'external_last_modified'),
+    )
+
     def __init__(
         self,
         ti_dict: dict,
-        transforms: list[GroupTransformModel | IndicatorTransformModel],
+        transforms: (
+            list[GroupTransformModel | IndicatorTransformModel]
+            | GroupTransformModel
+            | IndicatorTransformModel
+        ),
+        plan: TransformPlan | None = None,
     ):
-        """Initialize instance properties."""
+        """Initialize instance properties.
+
+        Args:
+            ti_dict: The TI data to transform.
+            transforms: The transform models, the first that applies to the TI data is used.
+            plan: The compiled plan for the transforms, shared when transforming many TI dicts.
+                A single TI dict uses a lazy plan that only compiles what it uses.
+        """
         self.ti_dict = ti_dict
         self.transforms = transforms if isinstance(transforms, list) else [transforms]
 
@@ -103,13 +153,12 @@ class TransformABC(ABC):
         self.adhoc_groups: list[dict] = []
         self.adhoc_indicators: list[dict] = []
         self.log = _logger
+        self.plan = plan or TransformPlan(self.transforms, lazy=True)
         # the current active transform
         self.transform: GroupTransformModel | IndicatorTransformModel
         self.transformed_item = {}
-        self.util = Util()
-        self.jmespath_options = jmespath.Options(
-            custom_functions=TcFunctions(), dict_cls=collections.OrderedDict
-        )
+        self.util = self.plan.util
+        self.jmespath_options = self.plan.jmespath_options
 
         # validate transforms
         self._validate_transforms()
@@ -130,13 +179,25 @@ class TransformABC(ABC):
         """Build the Indicator summary using available values."""
         return ' : '.join([value for value in [val1, val2, val3] if value is not None])
 
+    def _format_datetime(self, value: Any) -> str:
+        """Return the value as a TC datetime string.
+
+        Feeds repeat the same timestamps heavily, so absolute timestamps (ISO 8601 or numeric
+        epoch) are parsed once and cached. Any other expression (e.g., "now", "2 days ago", or
+        "Jan 12") may depend on the current date and is parsed every time.
+        """
+        key = _datetime_cache_key(value)
+        if key is not None:
+            return _format_datetime(key)
+        return self.util.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ')
+
     def _path_search(self, path: str) -> Any:
         """Return the value of the provided path.
 
         Path can return any type of data from the TI dict.
         """
         if path is not None:
-            value = jmespath.search(path, self.ti_dict, options=self.jmespath_options)
+            value = self.plan.search(path, self.ti_dict)
             # self.log.trace(f'feature=transform, action=path-search, path={path}, value={value}')
             return value
         return None
@@ -162,23 +223,8 @@ class TransformABC(ABC):
         self._process_tags(self.transform.tags or [])
 
         # date fields
-        # date fields
-        self._process_metadata_datetime('dateAdded', self.transform.date_added)
-        self._process_metadata_datetime('lastModified', self.transform.last_modified)
-        self._process_metadata_datetime('firstSeen', self.transform.first_seen)
-        self._process_metadata_datetime('lastSeen', self.transform.first_seen)
-        self._process_metadata_datetime('externalDateAdded', self.transform.external_date_added)
-        self._process_metadata_datetime('externalDateExpires', self.transform.external_date_expires)
-        self._process_metadata_datetime(
-            'externalLastModified', self.transform.external_last_modified
-        )
-        self._process_metadata_datetime('firstSeen', self.transform.first_seen)
-        self._process_metadata_datetime('lastSeen', self.transform.first_seen)
-        self._process_metadata_datetime('externalDateAdded', self.transform.external_date_added)
-        self._process_metadata_datetime('externalDateExpires', self.transform.external_date_expires)
-        self._process_metadata_datetime(
-            'externalLastModified', self.transform.external_last_modified
-        )
+        for key, field in self._datetime_fields:
+            self._process_metadata_datetime(key, getattr(self.transform, field))
 
         # xid
         self._process_metadata('xid', self.transform.xid)
@@ -416,9 +462,7 @@ class TransformABC(ABC):
             if metadata is not None and metadata.path is not None:
                 value = self._path_search(metadata.path)
                 if value is not None:
-                    self.add_metadata(
-                        key, self.util.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ')
-                    )
+                    self.add_metadata(key, self._format_datetime(value))
         except Exception as e:
             raise TransformException(key, e, context=metadata.dict() if metadata else None)
 
@@ -483,13 +527,28 @@ class TransformABC(ABC):
             raise TransformException('Type', e, context=self.transform.type.dict())
 
     def _select_transform(self):
-        """Select the correct transform based on the "applies" field."""
-        for transform in self.transforms:
-            if transform.applies is None or transform.applies(self.ti_dict) is True:
-                self.transform = transform
-                break
-        else:
+        """Select the correct transform based on the "dispatch" or "applies" field."""
+        transform = self.plan.select(self.ti_dict)
+        if transform is None:
             raise NoValidTransformException('No transform found for TI data')
+        self.transform = transform
+
+    def _transform_for_each(self, values: list, c: Callable, t: TransformModel) -> list:
+        """Transform each value that is not None using the for_each callable of the transform."""
+        parsed_fn = self.plan.parsed_fn(t)
+        if parsed_fn is None:
+            return [
+                self._transform_value_callable(v, c, t.kwargs) if v is not None else v
+                for v in values
+            ]
+        return [parsed_fn(v) if v is not None else v for v in values]
+
+    def _transform_method(self, value: Any, c: Callable, t: TransformModel) -> Any:
+        """Transform the value using the method callable of the transform."""
+        parsed_fn = self.plan.parsed_fn(t)
+        if parsed_fn is None:
+            return self._transform_value_callable(value, c, t.kwargs)
+        return parsed_fn(value)
 
     def _transform_value(self, metadata: MetadataTransformModel | None) -> str | None:
         """Pass value to series transforms."""
@@ -517,7 +576,7 @@ class TransformABC(ABC):
             elif t.static_map is not None:
                 value = self._transform_value_map(value, t.static_map)
             elif callable(t.method):
-                value = self._transform_value_callable(value, t.method, t.kwargs)
+                value = self._transform_method(value, t.method, t)
 
         # ensure only a string value or None is returned (set to default if required)
         if value is None:
@@ -539,14 +598,9 @@ class TransformABC(ABC):
             return getattr(ti_predefined_functions, c.name)(value, **normalized_params)
 
         kwargs = kwargs or {}
-        try:
-            sig = signature(c, follow_wrapped=True)
-            if 'ti_dict' in sig.parameters:
-                kwargs.update({'ti_dict': self.ti_dict})
-            if 'transform' in sig.parameters:
-                kwargs.update({'transform': self})
-        except ValueError:  # signature doesn't work for many built-in methods/functions
-            pass
+        # the signature of the callable is resolved once by the plan
+        for param in self.plan.callable_params(c):
+            kwargs[param] = self.ti_dict if param == 'ti_dict' else self
 
         # pass value to transform callable/method, which should always return a string
         return c(value, **kwargs)
@@ -616,12 +670,9 @@ class TransformABC(ABC):
                 value = _values
             # PYRIGHT-MISS - None check for value already performed above
             elif callable(t.method) and value is not None:
-                value = self._transform_value_callable(value, t.method, t.kwargs)
+                value = self._transform_method(value, t.method, t)
             elif callable(t.for_each):
-                value = [
-                    self._transform_value_callable(v, t.for_each, t.kwargs) if v is not None else v
-                    for v in self._always_array(value)
-                ]
+                value = self._transform_for_each(self._always_array(value), t.for_each, t)
 
         # the output should be an array of strings or empty array
         _value = []
@@ -641,10 +692,10 @@ class TransformABC(ABC):
         """Validate the transform model."""
         if len(self.transforms) > 1:
             for transform in self.transforms:
-                if transform.applies is None:
+                if transform.applies is None and transform.dispatch is None:
                     raise ValueError(
                         'If more than one transform is provided, each '
-                        'provided transform must provide an apply field.',
+                        'provided transform must provide an apply or dispatch field.',
                     )
 
     @abstractmethod
@@ -0,0 +1,191 @@
+"""TcEx Framework Module"""
+
+# standard library
+import collections
+from collections.abc import Callable
+from inspect import signature
+from typing import Any
+
+# third-party
+import jmespath
+from pydantic.v1 import BaseModel
+
+# first-party
+from tcex.api.tc.ti_transform.model import GroupTransformModel, IndicatorTransformModel
+from tcex.api.tc.ti_transform.model.transform_model import PathTransformModel, TransformModel
+from tcex.api.tc.ti_transform.ti_predefined_functions import ProcessingFunctions
+from tcex.pleb.jmespath_custom import TcFunctions
+from tcex.util import Util
+
+
+class TransformPlan:
+    """Compiled Execution Plan for a List of TI Transforms
+
+    The plan is compiled once and shared by every TiTransform created for the transforms.
+    Each jmespath path is compiled once, the signature of each callable transform is resolved
+    once, and the jmespath options and Util instance are shared by all records. Predefined
+    functions (see ProcessingFunctions) are resolved to their parsed variant, so that their
+    arguments are parsed once rather than for every value.
+
+    Transforms with a dispatch key are indexed on the dispatch path and values, so the
+    transform for a record is selected with a single lookup per dispatch path. Records that
+    don't match any dispatch value fall back to the applies callable of each transform (in
+    order). The dispatch_hits and dispatch_misses counters can be used to tune the keys.
+
+    A lazy plan (e.g., for a single TiTransform) doesn't compile the transforms up front, each
+    path, callable, and parsed variant is resolved the first time it is used.
+
+    Args:
+        transforms: The transform models applied to each TI dict.
+        lazy: If True, the transforms are compiled on first use instead of up front.
+    """
+
+    # the optional keyword arguments passed to callable transforms that accept them
+    context_params = ('ti_dict', 'transform')
+
+    def __init__(
+        self,
+        transforms: (
+            list[GroupTransformModel | IndicatorTransformModel]
+            | GroupTransformModel
+            | IndicatorTransformModel
+        ),
+        lazy: bool = False,
+    ):
+        """Initialize instance properties."""
+        self.transforms = transforms if isinstance(transforms, list) else [transforms]
+        self.lazy = lazy
+
+        # properties
+        self._callable_params: dict[Any, tuple[str, ...]] = {}
+        # the transform for each dispatch value keyed on the dispatch path
+        self._dispatch_index: dict[str, dict[str, Any]] = {}
+        self._expressions: dict[str, Any] = {}
+        self._fallback_transforms: list[GroupTransformModel | IndicatorTransformModel] = []
+        # the parsed variant (or None) of the predefined function of each transform model
+        self._parsed_fns: dict[int, Callable[[Any], Any] | None] = {}
+        self.dispatch_hits = 0
+        self.dispatch_misses = 0
+        self.jmespath_options = jmespath.Options(
+            custom_functions=TcFunctions(), dict_cls=collections.OrderedDict
+        )
+        self.util = Util()
+
+        # compile the paths and callables of all transforms
+        for transform in self.transforms:
+            if lazy is False:
+                self._compile(transform)
+            self._index(transform)
+
+    def _compile(self, model: Any):
+        """Compile the paths and resolve the callable signatures of the model (recursive)."""
+        if isinstance(model, list):
+            for item in model:
+                self._compile(item)
+            return
+
+        if not isinstance(model, BaseModel):
+            return
+
+        if isinstance(model, PathTransformModel) and model.path is not None:
+            self.expression(model.path)
+
+        if isinstance(model, TransformModel):
+            for c in (model.method, model.for_each):
+                if callable(c):
+                    self.callable_params(c)
+            self._compile_parsed_fn(model)
+
+        for field in model.__fields__:
+            self._compile(getattr(model, field))
+
+    def _compile_parsed_fn(self, model: TransformModel) -> Callable[[Any], Any] | None:
+        """Resolve the parsed variant of a predefined function with its arguments parsed once."""
+        parsed_fn = None
+        c = model.method if callable(model.method) else model.for_each
+        processing_functions = getattr(c, '__self__', None)
+        if callable(c) and isinstance(processing_functions, ProcessingFunctions):
+            try:
+                parsed_fn = processing_functions.parsed_fn(c, model.kwargs)
+            except Exception:
+                # invalid arguments raise the error when the value is transformed
+                parsed_fn = None
+
+        self._parsed_fns[id(model)] = parsed_fn
+        return parsed_fn
+
+    def _index(self, transform: GroupTransformModel | IndicatorTransformModel):
+        """Add the transform to the dispatch index or to the fallback transforms."""
+        if transform.dispatch is None:
+            self._fallback_transforms.append(transform)
+            return
+
+        self.expression(transform.dispatch.path)
+        index = self._dispatch_index.setdefault(transform.dispatch.path, {})
+        for value in transform.dispatch.values:
+            # the first transform for a value is selected, matching the order of the transforms
+            index.setdefault(value, transform)
+
+        # a transform with a dispatch key and an applies callable is also a fallback
+        if transform.applies is not None:
+            self._fallback_transforms.append(transform)
+
+    @classmethod
+    def _resolve_params(cls, c: Callable) -> tuple[str, ...]:
+        """Return the context params accepted by the callable."""
+        try:
+            parameters = signature(c, follow_wrapped=True).parameters
+        except (TypeError, ValueError):  # signature doesn't work for many built-in methods
+            return ()
+        return tuple(p for p in cls.context_params if p in parameters)
+
+    def callable_params(self, c: Callable) -> tuple[str, ...]:
+        """Return the context params (ti_dict and/or transform) accepted by the callable."""
+        try:
+            params = self._callable_params.get(c)
+        except TypeError:  # unhashable callable
+            return self._resolve_params(c)
+
+        if params is None:
+            params = self._callable_params[c] = self._resolve_params(c)
+        return params
+
+    def expression(self, path: str) -> Any:
+        """Return the compiled jmespath expression for the path."""
+        expression = self._expressions.get(path)
+        if expression is None:
+            expression = self._expressions[path] = jmespath.compile(path)
+        return expression
+
+    def parsed_fn(self, model: TransformModel) -> Callable[[Any], Any] | None:
+        """Return the parsed variant of the predefined function of the transform, if any."""
+        key = id(model)
+        if key in self._parsed_fns:
+            return self._parsed_fns[key]
+        if self.lazy is True:
+            return self._compile_parsed_fn(model)
+        return None
+
+    def search(self, path: str, data: dict) -> Any:
+        """Return the result of the path search on the data."""
+        return self.expression(path).search(data, options=self.jmespath_options)
+
+    def select(self, ti_dict: dict) -> GroupTransformModel | IndicatorTransformModel | None:
+        """Return the transform for the TI dict or None if no transform applies."""
+        for path, index in self._dispatch_index.items():
+            value = self.search(path, ti_dict)
+            if value is None:
+                continue
+
+            transform = index.get(value if isinstance(value, str) else str(value))
+            if transform is not None:
+                self.dispatch_hits += 1
+                return transform
+
+        if self._dispatch_index:
+            self.dispatch_misses += 1
+
+        for transform in self._fallback_transforms:
+            if transform.applies is None or transform.applies(ti_dict) is True:
+                return transform
+        return None
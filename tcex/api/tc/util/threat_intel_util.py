@@ -3,6 +3,7 @@
 # standard library
 import logging
 import re
+from collections.abc import Iterable
 from urllib.parse import quote
 
 # third-party
@@ -10,6 +11,7 @@ import jmespath
 from requests import Session
 
 # first-party
+from tcex.api.tc.util.ti_catalog import ti_catalog
 from tcex.exit.error_code import handle_error
 from tcex.logger.trace_logger import TraceLogger
 from tcex.pleb.cached_property import cached_property
@@ -17,6 +19,20 @@ from tcex.pleb.cached_property import cached_property
 # get tcex logger
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
+# pattern to split multi-valued indicators (file hashes and custom indicators)
+MULTI_VALUE_PATTERN = re.compile(
+    # group 1 - lazy capture everything to first <space>:<space> or end of line
+    r'^(.*?(?=\s\:\s|$))?'
+    r'(?:\s\:\s)?'  # remove <space>:<space>
+    # group 2 - look behind for <space>:<space>, lazy capture everything
+    # to look ahead (optional <space>):<space> or end of line
+    r'((?<=\s\:\s).*?(?=(?:\s)?\:\s|$))?'
+    r'(?:(?:\s)?\:\s)?'  # remove (optional <space>):<space>
+    # group 3 - look behind for <space>:<space>, lazy capture everything
+    # to look ahead end of line
+    r'((?<=\s\:\s).*?(?=$))?$'
+)
+
 
 class ThreatIntelUtil:
     """Threat Intelligence Common Methods"""
@@ -24,6 +40,10 @@ class ThreatIntelUtil:
     INDICATOR = 'Indicator'
     GROUP = 'Group'
 
+    # variables resolved from the static type catalogs, which are shared and persisted by the
+    # TI catalog. other lookups (e.g., users and owners) depend on the identity of the session.
+    catalog_variables = ('${ARTIFACT_TYPES}', '${ATTRIBUTES}', '${INDICATOR_TYPES}')
+
     def __init__(self, session_tc: Session):
         """Initialize instance properties."""
         self.session_tc = session_tc
@@ -71,32 +91,59 @@ class ThreatIntelUtil:
         Returns:
             A list of indicators split on " : ".
         """
-        if indicator.count(' : ') > 0:
-            # handle all multi-valued indicators types (file hashes and custom indicators)
-            indicator_list = []
-
-            iregx_pattern = (
-                # group 1 - lazy capture everything to first <space>:<space> or end of line
-                r'^(.*?(?=\s\:\s|$))?'
-                r'(?:\s\:\s)?'  # remove <space>:<space>
-                # group 2 - look behind for <space>:<space>, lazy capture everything
-                # to look ahead (optional <space>):<space> or end of line
-                r'((?<=\s\:\s).*?(?=(?:\s)?\:\s|$))?'
-                r'(?:(?:\s)?\:\s)?'  # remove (optional <space>):<space>
-                # group 3 - look behind for <space>:<space>, lazy capture everything
-                # to look ahead end of line
-                r'((?<=\s\:\s).*?(?=$))?$'
-            )
-            iregx = re.compile(iregx_pattern)
-
-            indicators = iregx.search(indicator)
-            if indicators is not None:
-                indicator_list = list(indicators.groups())
-        else:
+        if ' : ' not in indicator:
             # handle all single valued indicator types (address, host, etc)
-            indicator_list = [indicator]
+            return [indicator]
+
+        # handle all multi-valued indicators types (file hashes and custom indicators)
+        if ':' not in indicator.replace(' : ', '') and '\n' not in indicator:
+            # fast path - when the only colons are the " : " delimiters a split returns the
+            # same values as the pattern (anything after the second delimiter is value 3)
+            values: list = indicator.split(' : ', 2)
+            if len(values) == 2:
+                # a trailing delimiter results in an empty (not None) value 3
+                values.append('' if values[1] == '' else None)
+            return values
+
+        indicators = MULTI_VALUE_PATTERN.search(indicator)
+        if indicators is None:
+            return []
+        return list(indicators.groups())
+
+    @staticmethod
+    def expand_indicators_bulk(indicators: Iterable[str]) -> dict[str, list[str | None]]:
+        """Process many indicators returning columnar value arrays.
+
+        Single valued indicators have None for value2 and value3.
+
+        .. code-block:: python
 
-        return indicator_list
+            {
+                'value1': ['hash1', '1.1.1.1'],
+                'value2': ['hash2', None],
+                'value3': [None, None],
+            }
+
+        Args:
+            indicators: An iterable of " : " delimited strings.
+
+        Returns:
+            A dict with a list of values for each of value1, value2, and value3.
+        """
+        value1, value2, value3 = [], [], []
+        for indicator in indicators:
+            if ' : ' not in indicator:
+                values: list = [indicator, None, None]
+            elif ':' not in indicator.replace(' : ', '') and '\n' not in indicator:
+                values = indicator.split(' : ', 2)
+                if len(values) == 2:
+                    values.append('' if values[1] == '' else None)
+            else:
+                values = ThreatIntelUtil.expand_indicators(indicator) or [None, None, None]
+            value1.append(values[0])
+            value2.append(values[1])
+            value3.append(values[2])
+        return {'value1': value1, 'value2': value2, 'value3': value3}
 
     @property
     def group_types(self) -> list[str]:
@@ -151,26 +198,19 @@ class ThreatIntelUtil:
     def indicator_associations_types_data(self) -> dict[str, dict]:
         """Return ThreatConnect associations type data.
 
-        Retrieve the data from the API if it hasn't already been retrieved.
+        Retrieve the data from the shared catalog, which calls the API if the data hasn't
+        already been retrieved or has expired.
 
         Returns:
             (dict): A dictionary of ThreatConnect associations types.
         """
         _association_types = {}
 
-        # Dynamically create custom indicator class
-        r = self.session_tc.get('/v2/types/associationTypes')
+        # the catalog is shared by all instances and only downloaded when expired
+        data: dict | None = ti_catalog.get(self.session_tc, '/v2/types/associationTypes')
 
-        # check for bad status code and response that is not JSON
-        if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
-            self.log.warning(
-                'feature=threat-intel-common, event=association-types-download, status=failure'
-            )
-            return _association_types
-
-        # validate successful API results
-        data: dict = r.json()
-        if data.get('status') != 'Success':
+        # check for bad status code, response that is not JSON, or unsuccessful API results
+        if data is None or data.get('status') != 'Success':
             self.log.warning(
                 'feature=threat-intel-common, event=association-types-download, status=failure'
             )
@@ -179,9 +219,8 @@ class ThreatIntelUtil:
         # TODO: [low] make an Model for this data and return model?
         try:
             # Association Type Name is not a unique value at this time, but should be.
-            association_types = {}
             for association in data.get('data', {}).get('associationType', []):
-                association_types[association.get('name')] = association
+                _association_types[association.get('name')] = dict(association)
         except Exception as e:
             handle_error(code=200, message_values=[e])
         return _association_types
@@ -228,15 +267,19 @@ class ThreatIntelUtil:
             # get variable settings
             resolvable_variable_details = self.resolvable_variables[input_]
 
-            # make API call to retrieve variable data
-            r = self.session_tc.get(
-                resolvable_variable_details.get('url'), params={'resultLimit': 10_000}
-            )
-
-            if not r.ok:
+            url = resolvable_variable_details.get('url')
+            params = {'resultLimit': 10_000}
+            if input_ in self.catalog_variables:
+                # retrieve type data from the shared catalog (the API is called when expired)
+                json_ = ti_catalog.get(self.session_tc, url, params)
+            else:
+                # make API call to retrieve variable data
+                r = self.session_tc.get(url, params=params)
+                json_ = r.json() if r.ok else None
+
+            if json_ is None:
                 raise RuntimeError(f'Could not retrieve {input_} from ThreatConnect API.')
 
-            json_ = r.json()
             for item in jmespath.search(resolvable_variable_details.get('jmspath'), json_):
                 resolved_inputs.append(str(item))
 
@@ -246,21 +289,23 @@ class ThreatIntelUtil:
     def indicator_types_data(self) -> dict[str, dict]:
         """Return ThreatConnect indicator types data.
 
-        Retrieve the data from the API if it hasn't already been retrieved.
+        Retrieve the data from the shared catalog, which calls the API if the data hasn't
+        already been retrieved or has expired.
 
         Returns:
             (dict): A dictionary of ThreatConnect Indicator data.
         """
-        # retrieve data from API
-        r = self.session_tc.get('/v2/types/indicatorTypes')
+        # retrieve data from the shared catalog (the API is called when expired)
+        data = ti_catalog.get(self.session_tc, '/v2/types/indicatorTypes')
 
         # TODO: [low] use handle error instead
-        if not r.ok:
+        if data is None:
             raise RuntimeError('Could not retrieve indicator types from ThreatConnect API.')
 
+        # entries are copied as callers update them (e.g., BatchWriter custom flag)
         _indicator_types = {}
-        for itd in r.json().get('data', {}).get('indicatorType'):
-            _indicator_types[itd.get('name')] = itd
+        for itd in data.get('data', {}).get('indicatorType'):
+            _indicator_types[itd.get('name')] = dict(itd)
         return _indicator_types
 
     @staticmethod
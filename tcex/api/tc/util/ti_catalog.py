@@ -0,0 +1,149 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class TiCatalog:
+    """Process-Wide Cache of Threat Intel Type Catalogs
+
+    The indicator/association/attribute type catalogs rarely change, but were downloaded by
+    every ThreatIntelUtil instance. Responses are cached for all instances and threads, keyed
+    on the session base URL, url, and params. The key does not include the identity of the
+    session, so only data that is the same for every user (not e.g., users or owners) should
+    be retrieved using the catalog.
+
+    Entries expire after ttl seconds. When the response for an expired entry included an ETag
+    the request is revalidated with If-None-Match and a 304 response extends the entry. When
+    cache_file is set (e.g., in the tc_temp_path directory) the cache is loaded from and saved
+    to the file. Failed requests are not cached.
+
+    Args:
+        ttl: The number of seconds a cached entry is valid.
+        cache_file: The optional fully qualified filename used to persist the cache.
+    """
+
+    def __init__(self, ttl: int = 3_600, cache_file: str | None = None):
+        """Initialize instance properties."""
+        self.cache_file = cache_file
+        self.ttl = ttl
+
+        # properties
+        self._data: dict[str, dict] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._loaded_file: str | None = None
+        self._lock = threading.RLock()
+        self.log = _logger
+
+    @staticmethod
+    def _key(session: Session, url: str, params: dict | None) -> str:
+        """Return the cache key."""
+        base_url = getattr(session, 'base_url', None) or ''
+        return f'{base_url}{url}?{json.dumps(params or {}, sort_keys=True)}'
+
+    def _load(self):
+        """Load the cache file once, skipping any unreadable file."""
+        if self.cache_file is None or self._loaded_file == self.cache_file:
+            return
+
+        self._loaded_file = self.cache_file
+        if not os.path.isfile(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, encoding='utf-8') as fh:
+                for key, entry in json.load(fh).items():
+                    self._data.setdefault(key, entry)
+        except (OSError, ValueError):
+            self.log.warning(
+                f'feature=threat-intel-common, event=catalog-file-invalid, file={self.cache_file}'
+            )
+
+    @staticmethod
+    def _request(session: Session, url: str, params: dict | None, etag: str | None):
+        """Return the response, sending the ETag of the cached entry for revalidation."""
+        headers = {'If-None-Match': etag} if etag else None
+        return session.get(url, params=params, headers=headers)
+
+    def _save(self):
+        """Write the cache to the cache file."""
+        if self.cache_file is None:
+            return
+
+        temp_file = f'{self.cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as fh:
+                json.dump(self._data, fh)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            self.log.warning(
+                f'feature=threat-intel-common, event=catalog-file-write-failed, '
+                f'file={self.cache_file}'
+            )
+
+    def clear(self):
+        """Remove all entries from the cache (the cache file is left in place)."""
+        with self._lock:
+            self._data.clear()
+
+    def get(self, session: Session, url: str, params: dict | None = None) -> Any:
+        """Return the JSON response for the url, or None if the request failed.
+
+        Args:
+            session: An configured instance of request.Session with TC API Auth.
+            url: The API url (e.g., /v2/types/indicatorTypes).
+            params: The query params for the request.
+        """
+        key = self._key(session, url, params)
+        with self._lock:
+            self._load()
+            entry = self._data.get(key)
+            if entry is not None and entry['expires'] > time.time():
+                return entry['data']
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # only one thread sends the request for a key, other threads wait for the result
+        with key_lock:
+            with self._lock:
+                entry = self._data.get(key)
+                if entry is not None and entry['expires'] > time.time():
+                    return entry['data']
+
+            r = self._request(session, url, params, (entry or {}).get('etag'))
+            if r.status_code == 304 and entry is not None:
+                self.log.debug(f'feature=threat-intel-common, event=catalog-revalidated, url={url}')
+                data = entry['data']
+            elif r.ok:
+                try:
+                    data = r.json()
+                except ValueError:
+                    return None
+            else:
+                return None
+
+            with self._lock:
+                self._data[key] = {
+                    'data': data,
+                    'etag': r.headers.get('ETag') or (entry or {}).get('etag'),
+                    'expires': time.time() + self.ttl,
+                }
+                self._save()
+            return data
+
+
+# the catalog shared by all ThreatIntelUtil instances
+ti_catalog = TiCatalog()
@@ -11,7 +11,7 @@ from tcex.util import Util
 class Attribute:
     """ThreatConnect Batch Attribute Object"""
 
-    __slots__ = ['_attribute_data', '_valid', 'util']
+    __slots__ = ['_attribute_data', '_on_change', '_valid', 'util']
 
     def __init__(
         self,
@@ -20,6 +20,7 @@ class Attribute:
         displayed: bool = False,
         source: str | None = None,
         formatter: Callable[[str], str] | None = None,
+        on_change: Callable[[], None] | None = None,
     ):
         """Initialize instance properties.
 
@@ -30,7 +31,9 @@ class Attribute:
             source: The source value for this attribute.
             formatter: A callable that take a single attribute
                 value and return a single formatted value.
+            on_change: A callable that is called when the Attribute is modified.
         """
+        self._on_change = on_change
         self._attribute_data: dict[str, bool | str] = {'type': attr_type}
         if displayed:
             self._attribute_data['displayed'] = displayed
@@ -54,6 +57,11 @@ class Attribute:
         # properties
         self.util = Util()
 
+    def _modified(self):
+        """Notify the owner (e.g., an Indicator) that the Attribute was modified."""
+        if self._on_change is not None:
+            self._on_change()
+
     @property
     def data(self) -> dict:
         """Return Attribute data."""
@@ -68,6 +76,7 @@ class Attribute:
     def displayed(self, displayed: bool):
         """Set Attribute displayed."""
         self._attribute_data['displayed'] = displayed
+        self._modified()
 
     @property
     def source(self) -> str | None:
@@ -78,6 +87,7 @@ class Attribute:
     def source(self, source: str):
         """Set Attribute source."""
         self._attribute_data['source'] = source
+        self._modified()
 
     @property
     def type(self) -> str:
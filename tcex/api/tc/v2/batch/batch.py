@@ -3,15 +3,17 @@
 # standard library
 import gzip
 import json
+import logging
 import os
-import shelve  # nosec
-import sys
+import shutil
+import tempfile
 import threading
 import time
 import traceback
 from collections import deque
 from collections.abc import Callable
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any
 
 # third-party
 from requests import Response, Session
@@ -19,6 +21,7 @@ from requests import Response, Session
 # first-party
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter, GroupType, IndicatorType
+from tcex.api.tc.v2.batch.poll_strategy_abc import PollStrategyABC
 from tcex.exit.error_code import handle_error
 from tcex.input.input import Input
 
@@ -36,6 +39,9 @@ class Batch(BatchWriter, BatchSubmit):
         playbook_triggers_enabled: If True, Playbook will be triggered when TI data is created.
         security_label_write_type: Write type for labels ['Append', 'Replace'].
         tag_write_type: Write type for tags ['Append', 'Replace'].
+        store_type: The on-disk store used for saved TI data ("segment" or "sqlite").
+        poll_strategy: The strategy used to schedule batch status requests.
+        file_upload_workers: The max number of concurrent Document/Report file uploads.
     """
 
     def __init__(
@@ -49,9 +55,14 @@ class Batch(BatchWriter, BatchSubmit):
         playbook_triggers_enabled: bool = False,
         tag_write_type: str = 'Replace',
         security_label_write_type: str = 'Replace',
+        store_type: str = 'segment',
+        poll_strategy: PollStrategyABC | None = None,
+        file_upload_workers: int = 4,
     ):
         """Initialize instance properties."""
-        BatchWriter.__init__(self, inputs=inputs, session_tc=session_tc, output_dir='')
+        BatchWriter.__init__(
+            self, inputs=inputs, session_tc=session_tc, output_dir='', store_type=store_type
+        )
         BatchSubmit.__init__(
             self,
             inputs=inputs,
@@ -63,6 +74,7 @@ class Batch(BatchWriter, BatchSubmit):
             playbook_triggers_enabled=playbook_triggers_enabled,
             tag_write_type=tag_write_type,
             security_label_write_type=security_label_write_type,
+            poll_strategy=poll_strategy,
         )
 
         self._action = action
@@ -76,10 +88,28 @@ class Batch(BatchWriter, BatchSubmit):
         # properties
         self._batch_max_chunk = 5_000
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._progress_log_interval = 2_500
+        self._progress_log_level = logging.INFO
+        self._file_executor: ThreadPoolExecutor | None = None
+        self._file_futures: list[Future] = []
+        self._file_lock = threading.Lock()
         self._file_merge_mode = None
-        self._file_threads = []
+        self._file_upload_report = {
+            'total': 0,
+            'uploaded': 0,
+            'failed': 0,
+            'retries': 0,
+            'seconds': 0.0,
+        }
         self._hash_collision_mode = None
-        self._submit_thread = None
+        self._submit_threads: list[threading.Thread] = []
+
+        # file upload settings
+        self.file_spool_size = 8_000_000  # max in-memory size in bytes for chunked content
+        self.file_upload_back_off = 2.0  # seconds before the first retry, doubled on each retry
+        self.file_upload_retries = 3
+        self.file_upload_retry_status = [429, 500, 502, 503, 504]
+        self.file_upload_workers = file_upload_workers
 
         # global overrides on batch/file errors
         self._halt_on_batch_error = None
@@ -94,8 +124,6 @@ class Batch(BatchWriter, BatchSubmit):
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
         self._poll_timeout = 3600
 
         # batch debug/replay variables
@@ -130,8 +158,8 @@ class Batch(BatchWriter, BatchSubmit):
         if self.groups.get(xid) is not None:
             # return existing group from memory
             group_data = self.groups[xid]
-        elif self.groups_shelf.get(xid) is not None:
-            # return existing group from shelf
+        elif xid in self.groups_shelf:
+            # return existing group from store
             group_data = self.groups_shelf[xid]
         else:
             # store new group
@@ -160,8 +188,8 @@ class Batch(BatchWriter, BatchSubmit):
         if self.indicators.get(xid) is not None:
             # return existing indicator from memory
             indicator_data = self.indicators[xid]
-        elif self.indicators_shelf.get(xid) is not None:
-            # return existing indicator from shelf
+        elif xid in self.indicators_shelf:
+            # return existing indicator from store
             indicator_data = self.indicators_shelf[xid]
         else:
             # store new indicators
@@ -170,208 +198,28 @@ class Batch(BatchWriter, BatchSubmit):
 
     def close(self):
         """Cleanup batch job."""
-        # allow pol thread to complete before wrapping up
-        if self._submit_thread and hasattr(self._submit_thread, 'is_alive'):
-            self._submit_thread.join()
-
-        # allow file threads to complete before wrapping up job
-        for t in self._file_threads:
+        # allow poll threads to complete before wrapping up
+        for t in self._submit_threads:
             t.join()
 
-        self.groups_shelf.close()
-        self.indicators_shelf.close()
-        if not self.debug and not self.enable_saved_file:
-            # delete saved files
-            if os.path.isfile(self.group_shelf_fqfn):
-                os.remove(self.group_shelf_fqfn)
-            if os.path.isfile(self.group_shelf_fqfn):
-                os.remove(self.indicator_shelf_fqfn)
-
-    @property
-    def data(self) -> dict:
-        """Return the batch indicator/group and file data to be sent to the ThreatConnect API.
-
-        **Processing Order:**
-        * Process groups in memory up to max batch size.
-        * Process groups in shelf to max batch size.
-        * Process indicators in memory up to max batch size.
-        * Process indicators in shelf up to max batch size.
-
-        This method will remove the group/indicator from memory and/or shelf.
-
-        Returns:
-            dict: A dictionary of group, indicators, and/or file data.
-        """
-        data = {'file': {}, 'group': [], 'indicator': []}
-        tracker = {'count': 0, 'bytes': 0}
-
-        # process group from memory, returning if max values have been reached
-        if self.data_groups(data, self.groups, tracker) is True:
-            return data
-
-        # process group from shelf file, returning if max values have been reached
-        if self.data_groups(data, self.groups_shelf, tracker) is True:
-            return data
-
-        # process indicator from memory, returning if max values have been reached
-        if self.data_indicators(data, self.indicators, tracker) is True:
-            return data
-
-        # process indicator from shelf file, returning if max values have been reached
-        if self.data_indicators(data, self.indicators_shelf, tracker) is True:
-            return data
-
-        return data
-
-    def data_group_association(self, data: dict, tracker: dict, xid: str):
-        """Return group dict array following all associations.
-
-        The *data* dict is passed by reference to make it easier to update both the group data
-        and file data inline versus passing the data all the way back up to the calling methods.
-
-        Args:
-            data: The data dict to update with group and file data.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-            xid: The xid of the group to retrieve associations.
-        """
-        xids = deque()
-        xids.append(xid)
-
-        while xids:
-            xid = xids.popleft()  # remove current xid
-            group_data = None
-
-            if xid in self.groups:
-                group_data = self.groups.get(xid)
-                del self.groups[xid]
-            elif xid in self.groups_shelf:
-                group_data = self.groups_shelf.get(xid)
-                del self.groups_shelf[xid]
-
-            if group_data:
-                file_data, group_data = self.data_group_type(group_data)
-                data['group'].append(group_data)
-                if file_data:
-                    data['file'][xid] = file_data
-
-                # update entity trackers
-                tracker['count'] += 1
-                tracker['bytes'] += sys.getsizeof(json.dumps(group_data))
-
-                # extend xids with any groups associated with the same GroupType
-                xids.extend(group_data.get('associatedGroupXid', []))
-
-    @staticmethod
-    def data_group_type(group_data: dict | GroupType) -> tuple[dict, dict]:
-        """Return dict representation of group data and file data.
-
-        Args:
-            group_data: The group data dict or GroupType.
-
-        Returns:
-            Tuple[dict, dict]: A tuple containing file_data and group_data.
-        """
-        file_data = {}
-        if isinstance(group_data, dict):
-            # process file content
-            file_content = group_data.pop('fileContent', None)
-            if file_content is not None:
-                file_data = {
-                    'fileContent': file_content,
-                    'fileName': group_data.get('fileName'),
-                    'type': group_data.get('type'),
-                }
-        else:
-            # get the file data from the GroupType and return dict format of GroupType
-            if group_data.data.get('type') in ['Document', 'Report']:
-                file_data = group_data.file_data
-            group_data = group_data.data
-
-        return file_data, group_data
-
-    def data_groups(self, data: dict, groups: dict | shelve.Shelf[Any], tracker: dict) -> bool:
-        """Process Group data.
-
-        Args:
-            data: The data dict to update with group and file data.
-            groups: The list of groups to process.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-
-        Returns:
-            bool: True if max values have been hit, else False.
-        """
-        # convert groups.keys() to a list to prevent dictionary change error caused by
-        # the data_group_association function deleting items from the GroupType.
-
-        # process the group
-        for xid in list(groups.keys()):
-            # get association from group data
-            self.data_group_association(data, tracker, xid)
-
-            if tracker['count'] % 2_500 == 0:
-                # log count/size at a sane level
-                self.log.info(
-                    '''feature=batch, action=data-groups, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-
-            if (
-                tracker['count'] >= self._batch_max_chunk
-                or tracker['bytes'] >= self._batch_max_size
-            ):
-                # stop processing xid once max limit are reached
-                self.log.info(
-                    '''feature=batch, event=max-value-reached, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-                return True
-        return False
-
-    def data_indicators(
-        self, data: dict, indicators: dict | shelve.Shelf[Any], tracker: dict
-    ) -> bool:
-        """Process Indicator data.
-
-        Args:
-            data: The data dict to update with group and file data.
-            indicators: The list of indicators to process.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-
-        Returns:
-            bool: True if max values have been hit, else False.
-        """
-        # process the indicators
-        for xid, indicator_data in list(indicators.items()):
-            if not isinstance(indicator_data, dict):
-                indicator_data = indicator_data.data
-            data['indicator'].append(indicator_data)
-            del indicators[xid]
-
-            # update entity trackers
-            tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(indicator_data))
-
-            if tracker['count'] % 2_500 == 0:
-                # log count/size at a sane level
-                self.log.info(
-                    '''feature=batch, action=data-indicators, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-
-            if (
-                tracker['count'] >= self._batch_max_chunk
-                or tracker['bytes'] >= self._batch_max_size
-            ):
-                # stop processing xid once max limit are reached
-                self.log.info(
-                    '''feature=batch, event=max-value-reached, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
+        # allow file uploads to complete before wrapping up job
+        for future in self._file_futures:
+            if future.exception() is not None:
+                self.log.error(
+                    f'feature=batch, event=file-upload-error, error="""{future.exception()}"""'
                 )
-                return True
-        return False
+        self._file_futures.clear()
+        if self._file_executor is not None:
+            self._file_executor.shutdown(wait=True)
+            self._file_executor = None
+        if self._file_upload_report['total'] > 0:
+            report = ', '.join(f'{k}={v}' for k, v in self.file_upload_report.items())
+            self.log.info(f'feature=batch, event=file-upload-report, {report}')
+
+        # delete saved files unless debugging
+        delete = not self.debug and not self.enable_saved_file
+        self.groups_shelf.close(delete=delete)
+        self.indicators_shelf.close(delete=delete)
 
     @property
     def debug(self):
@@ -395,6 +243,33 @@ class Batch(BatchWriter, BatchSubmit):
                 self._debug = True
         return self._debug
 
+    @property
+    def file_executor(self) -> ThreadPoolExecutor:
+        """Return the bounded worker pool used for file uploads."""
+        with self._file_lock:
+            if self._file_executor is None:
+                self._file_executor = ThreadPoolExecutor(
+                    max_workers=self.file_upload_workers, thread_name_prefix='submit-files'
+                )
+            return self._file_executor
+
+    @property
+    def file_upload_report(self) -> dict:
+        """Return the aggregate upload status of all file uploads.
+
+        .. code-block:: javascript
+
+            {
+                "total": 10,
+                "uploaded": 9,
+                "failed": 1,
+                "retries": 2,
+                "seconds": 42.5
+            }
+        """
+        with self._file_lock:
+            return dict(self._file_upload_report)
+
     @property
     def halt_on_file_error(self) -> bool:
         """Return halt on file post error value."""
@@ -412,11 +287,8 @@ class Batch(BatchWriter, BatchSubmit):
         Args:
             process_files: Send any document or report attachments to the API.
         """
-        while True:
-            content = self.data
+        for content in self.data_chunks():
             file_data = content.pop('file', {})
-            if not content.get('group') and not content.get('indicator'):
-                break
 
             # special code for debugging App using batchV2.
             self.write_batch_json(content)
@@ -431,8 +303,8 @@ class Batch(BatchWriter, BatchSubmit):
                 f'''count={len(content['indicator']):,}'''
             )
 
-        if process_files:
-            self.process_files(file_data)
+            if process_files:
+                self.process_files(file_data)
 
     def process_files(self, file_data: dict):
         """Process Files for Documents and Reports to ThreatConnect API.
@@ -574,7 +446,11 @@ class Batch(BatchWriter, BatchSubmit):
             if poll:
                 # poll for status
                 batch_data = (
-                    self.poll(batch_id=batch_id, halt_on_error=halt_on_error)
+                    self.poll(
+                        batch_id=batch_id,
+                        halt_on_error=halt_on_error,
+                        count=self._content_count(content),
+                    )
                     .get('data', {})
                     .get('batchStatus', {})
                 )
@@ -590,16 +466,7 @@ class Batch(BatchWriter, BatchSubmit):
 
         if process_files:
             # submit file data after batch job is complete
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
         return batch_data
 
     def submit_all(
@@ -608,6 +475,7 @@ class Batch(BatchWriter, BatchSubmit):
         errors: bool = True,
         process_files: bool = True,
         halt_on_error: bool = True,
+        max_in_flight: int = 1,
     ) -> list[dict]:
         """Submit Batch request to ThreatConnect API.
 
@@ -623,28 +491,37 @@ class Batch(BatchWriter, BatchSubmit):
         Each of these methods can also be called on their own for greater control of the submit
         process.
 
+        When max_in_flight is greater than 1 (and poll is enabled) the submission is pipelined.
+        Each batch job is polled in a worker thread while the next chunk is built and uploaded,
+        with up to max_in_flight jobs being polled at once. The batch status is returned in the
+        same order the chunks were submitted.
+
         Args:
             poll: If True poll batch for status.
             errors: If True retrieve any batch errors (only if poll is True).
             process_files: If true send any document or report attachments to the API.
             halt_on_error: If True any exception will raise an error.
+            max_in_flight: The max number of batch jobs to poll concurrently.
 
         Returns.
             dict: The Batch Status from the ThreatConnect API.
         """
+        if max_in_flight > 1 and poll is True and self.action.lower() != 'delete':
+            return self.submit_all_pipelined(
+                errors=errors,
+                process_files=process_files,
+                halt_on_error=halt_on_error,
+                max_in_flight=max_in_flight,
+            )
+
         batch_data_array = []
         file_data = {}
-        while True:
+
+        # get file, group, and indicator data one bounded chunk at a time
+        for content in self.data_chunks():
             batch_data: dict[str, int | list | str] | None = {}
             batch_id: int | None = None
 
-            # get file, group, and indicator data
-            content = self.data
-
-            # break loop when end of data is reached
-            if not content.get('group') and not content.get('indicator'):
-                break
-
             if self.action.lower() == 'delete':
                 # no need to process files on a delete batch job
                 process_files = False
@@ -670,50 +547,121 @@ class Batch(BatchWriter, BatchSubmit):
                 batch_id = batch_data.get('id')  # type: ignore
 
             if batch_id is not None:
-                self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
                 # job hit queue
                 if poll:
-                    # poll for status
-                    batch_data = (
-                        self.poll(batch_id, halt_on_error=halt_on_error)
-                        .get('data', {})
-                        .get('batchStatus', {})
+                    # poll for status and retrieve errors
+                    batch_data = self.submit_poll(
+                        batch_id,
+                        batch_data or {},
+                        errors,
+                        halt_on_error,
+                        count=self._content_count(content),
                     )
-                    if errors and batch_data is not None:
-                        # retrieve errors
-                        error_count = batch_data.get('errorCount', 0)
-                        error_groups = batch_data.get('errorGroupCount', 0)
-                        error_indicators = batch_data.get('errorIndicatorCount', 0)
-                        if (
-                            isinstance(error_count, int)
-                            and isinstance(error_groups, int)
-                            and isinstance(error_indicators, int)
-                        ):
-                            if error_count > 0 or error_groups > 0 or error_indicators > 0:
-                                batch_data['errors'] = self.errors(batch_id)
                 else:
                     # can't process files if status is unknown (polling must be enabled)
                     process_files = False
 
-            if process_files:
-                # submit file data after batch job is complete
-                self._file_threads.append(
-                    self.submit_thread(
-                        name='submit-files',
-                        target=self.submit_files,
-                        args=(
-                            file_data,
-                            halt_on_error,
-                        ),
-                    )
+            batch_data_array.append(
+                self._submit_all_complete(batch_data, file_data, process_files, halt_on_error)
+            )
+
+        return batch_data_array
+
+    @staticmethod
+    def _content_count(content: dict) -> int:
+        """Return the number of groups and indicators in the batch content."""
+        return len(content.get('group', [])) + len(content.get('indicator', []))
+
+    def _submit_all_complete(
+        self, batch_data: dict | None, file_data: dict, process_files: bool, halt_on_error: bool
+    ) -> dict | None:
+        """Submit file data and write any errors for a completed batch job.
+
+        Args:
+            batch_data: The batch status for the completed batch job.
+            file_data: The file data for the batch job.
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+        """
+        if process_files:
+            # submit file data after batch job is complete
+            self.submit_files_async(file_data, halt_on_error)
+
+        # write errors for debugging
+        if isinstance(batch_data, dict):
+            batch_errors = batch_data.get('errors', [])
+            if isinstance(batch_errors, list) and len(batch_errors) > 0:
+                self.write_error_json(batch_errors)
+
+        return batch_data
+
+    def submit_all_pipelined(
+        self,
+        errors: bool = True,
+        process_files: bool = True,
+        halt_on_error: bool = True,
+        max_in_flight: int = 2,
+    ) -> list[dict]:
+        """Submit all batch data with upload, poll, and chunk building overlapped.
+
+        The main thread builds and uploads each chunk, while a pool of worker threads poll the
+        batch jobs and retrieve any errors. Once max_in_flight jobs are being polled the main
+        thread waits on the oldest job before building the next chunk, so results are returned
+        in the order the chunks were submitted. Any error raised while polling (e.g., when
+        halt_on_error is True) is raised in the calling thread when the job result is collected.
+
+        Args:
+            errors: If True retrieve any batch errors.
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+            max_in_flight: The max number of batch jobs to poll concurrently.
+
+        Returns.
+            list[dict]: The Batch Status from the ThreatConnect API for each batch job.
+        """
+        batch_data_array = []
+        in_flight: deque[tuple[Future, dict]] = deque()
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='submit-poll')
+        try:
+            for content in self.data_chunks():
+                # pop any file content to pass to submit_files
+                file_data = content.pop('file', {})
+                batch_data = (
+                    self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
+                    .get('data', {})
+                    .get('batchStatus', {})
+                )
+                future = executor.submit(
+                    self.submit_poll,
+                    batch_data.get('id'),
+                    batch_data,
+                    errors,
+                    halt_on_error,
+                    count=self._content_count(content),
                 )
-            batch_data_array.append(batch_data)
+                in_flight.append((future, file_data))
+                self.log.debug(f'feature=batch, event=submit-pipelined, in-flight={len(in_flight)}')
+
+                # wait on the oldest job once the max number of jobs are in flight
+                while len(in_flight) >= max_in_flight:
+                    future, file_data = in_flight.popleft()
+                    batch_data_array.append(
+                        self._submit_all_complete(
+                            future.result(), file_data, process_files, halt_on_error
+                        )
+                    )
 
-            # write errors for debugging
-            if isinstance(batch_data, dict):
-                batch_errors = batch_data.get('errors', [])
-                if isinstance(batch_errors, list) and len(batch_errors) > 0:
-                    self.write_error_json(batch_errors)
+            # collect the remaining jobs in submission order
+            while in_flight:
+                future, file_data = in_flight.popleft()
+                batch_data_array.append(
+                    self._submit_all_complete(
+                        future.result(), file_data, process_files, halt_on_error
+                    )
+                )
+        finally:
+            # on error do not wait on or start any other poll
+            executor.shutdown(wait=not in_flight, cancel_futures=True)
 
         return batch_data_array
 
@@ -722,20 +670,23 @@ class Batch(BatchWriter, BatchSubmit):
         callback: Callable[..., Any],
         content: dict | None = None,
         halt_on_error: bool = True,
+        max_in_flight: int = 1,
     ) -> bool:
         """Submit batch data to ThreatConnect and poll in a separate thread.
 
         The "normal" submit methods run in serial which will block when the batch poll is running.
         Using this method the submit is done in serial, but the poll method is run in a thread,
         which should allow the App to continue downloading and processing data while the batch
-        poll process is running. Only one batch submission is allowed at a time so that any
-        critical errors returned from batch can be handled before submitting a new batch job.
+        poll process is running. By default only one batch submission is allowed at a time so
+        that any critical errors returned from batch can be handled before submitting a new batch
+        job. Setting max_in_flight allows more batch jobs to be polled at the same time.
 
         Args:
             callback: The callback method that will handle
                 the batch status when polling is complete.
             content: The dict of groups and indicator data (e.g., {"group": [], "indicator": []}).
             halt_on_error: If True the process should halt if any errors are encountered.
+            max_in_flight: The max number of batch jobs to poll concurrently.
 
         Raises:
             RuntimeError: Raised on invalid callback method.
@@ -755,16 +706,18 @@ class Batch(BatchWriter, BatchSubmit):
         if not content.get('group') and not content.get('indicator'):
             return False
 
-        # block here is there is already a batch submission being processed
-        if self._submit_thread and hasattr(self._submit_thread, 'is_alive'):
+        # block here if the max number of batch submissions are already being processed
+        self._submit_threads = [t for t in self._submit_threads if t.is_alive()]
+        while len(self._submit_threads) >= max_in_flight:
+            submit_thread = self._submit_threads.pop(0)
             self.log.info(
                 'feature=batch, event=progress, status=blocked, '
-                f'is-alive={self._submit_thread.is_alive()}'
+                f'is-alive={submit_thread.is_alive()}'
             )
-            self._submit_thread.join()
+            submit_thread.join()
             self.log.debug(
                 'feature=batch, event=progress, status=released, '
-                f'is-alive={self._submit_thread.is_alive()}'
+                f'is-alive={submit_thread.is_alive()}'
             )
 
         # submit the data and collect the response
@@ -776,11 +729,14 @@ class Batch(BatchWriter, BatchSubmit):
         self.log.trace(f'feature=batch, event=submit-callback, batch-data={batch_data}')
 
         # launch batch polling in a thread
-        self._submit_thread = self.submit_thread(
+        submit_thread = self.submit_thread(
             name='submit-poll',
             target=self.submit_callback_thread,
             args=(batch_data, callback, file_data),
+            kwargs={'count': self._content_count(content)},
         )
+        if submit_thread is not None:
+            self._submit_threads.append(submit_thread)
 
         return True
 
@@ -790,43 +746,18 @@ class Batch(BatchWriter, BatchSubmit):
         callback: Callable[..., Any],
         file_data: dict,
         halt_on_error: bool = True,
+        count: int | None = None,
     ):
         """Submit data in a thread."""
-        batch_id = batch_data.get('id')
-        self.log.info(f'feature=batch, event=progress, batch-id={batch_id}')
-        if batch_id:
-            # when batch_id is None it indicates that batch submission was small enough to be
-            # processed inline (without being queued)
-
-            # poll for status
-            batch_status = (
-                self.poll(batch_id, halt_on_error=halt_on_error).get('data', {}).get('batchStatus')
-            )
-
-            # retrieve errors
-            if batch_status is not None:
-                error_count = batch_status.get('errorCount', 0)
-                error_groups = batch_status.get('errorGroupCount', 0)
-                error_indicators = batch_status.get('errorIndicatorCount', 0)
-                if error_count > 0 or error_groups > 0 or error_indicators > 0:
-                    batch_status['errors'] = self.errors(batch_id)
-        else:
-            batch_status = batch_data
+        # poll for status and retrieve errors
+        batch_status = self.submit_poll(
+            batch_data.get('id'), batch_data, True, halt_on_error, count=count
+        )
 
-        # launch file upload in a thread *after* batch status is returned. while only one batch
-        # submission thread is allowed, there is no limit on file upload threads. the upload
-        # status returned by file upload will be ignored when running in a thread.
+        # queue file uploads to the file upload worker pool *after* batch status is returned.
+        # the upload status is available in file_upload_report once the batch is closed.
         if file_data:
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
 
         # send batch_status to callback
         if callable(callback):
@@ -864,7 +795,10 @@ class Batch(BatchWriter, BatchSubmit):
         )
 
         try:
-            files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+            files = (
+                ('config', json.dumps(self.settings)),
+                ('content', self.encode_content(content)),
+            )
             params = {'includeAdditional': 'true'}
             r = self.session_tc.post('/v2/batch/createAndUpload', files=files, params=params)
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
@@ -879,58 +813,74 @@ class Batch(BatchWriter, BatchSubmit):
 
         return {}
 
-    def submit_files(self, file_data: dict, halt_on_error: bool = True) -> list[dict] | None:
-        """Submit Files for Documents and Reports to ThreatConnect API.
+    def _file_content_stream(self, content: Any) -> bytearray | bytes | IO:
+        """Return file content as bytes or a file object that can be re-read for retries.
 
-        Critical Errors
+        Args:
+            content: The file content as bytes, str, a file object, or an iterable of chunks.
+        """
+        if isinstance(content, str):
+            return content.encode()
+        if isinstance(content, (bytes, bytearray)) or hasattr(content, 'read'):
+            return content
+
+        # spool chunked content (e.g., a generator) so that large content is not held in memory
+        spool = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+            max_size=self.file_spool_size
+        )
+        for chunk in content:
+            spool.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        spool.seek(0)
+        return spool
 
-        * There is insufficient document storage allocated to this account.
+    def submit_file(self, xid: str, content_data: dict, halt_on_error: bool = True) -> dict | None:
+        """Submit a File for a Document or Report to ThreatConnect API.
 
         Args:
+            xid: The xid of the Document or Report.
+            content_data: The file data (fileContent, fileName, and type) for the xid.
             halt_on_error: If True any exception will raise an error.
-            file_data: The file data to be submitted.
 
         Returns:
-            dict: The upload status for each xid.
+            dict: The upload status for the xid.
         """
         # check global setting for override
         if self.halt_on_file_error is not None:
             halt_on_error = self.halt_on_file_error
 
-        upload_status = []
-        self.log.info(f'feature=batch, action=submit-files, count={len(file_data)}')
-        for xid, content_data in list(file_data.items()):
-            del file_data[xid]  # win or loose remove the entry
-            status = True
+        # used for debug/testing to prevent upload of previously uploaded file
+        if self.debug and xid in self.saved_xids:
+            self.log.debug(
+                f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
+            )
+            return None
 
-            # used for debug/testing to prevent upload of previously uploaded file
-            if self.debug and xid in self.saved_xids:
-                self.log.debug(
-                    f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
-                )
-                continue
+        start = time.monotonic()
 
-            # process the file content
-            content = content_data.get('fileContent')
-            if callable(content):
-                try:
-                    content_callable_name = getattr(content, '__name__', repr(content))
-                    self.log.trace(
-                        f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
-                    )
-                    content = content_data.get('fileContent')(xid)
-                except Exception as e:
-                    self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+        # process the file content
+        content = content_data.get('fileContent')
+        if callable(content):
+            try:
+                content_callable_name = getattr(content, '__name__', repr(content))
+                self.log.trace(
+                    f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
+                )
+                content = content_data.get('fileContent')(xid)
+            except Exception as e:
+                self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
 
-            if content is None:
-                upload_status.append({'uploaded': False, 'xid': xid})
-                self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
-                continue
+        if content is None:
+            self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
+            self._file_upload_complete(False, start)
+            return {'uploaded': False, 'xid': xid}
 
-            api_branch = 'documents'
-            if content_data.get('type') == 'Report':
-                api_branch = 'reports'
+        api_branch = 'documents'
+        if content_data.get('type') == 'Report':
+            api_branch = 'reports'
 
+        content = self._file_content_stream(content)
+        r = None
+        try:
             if self.debug and content_data.get('fileName'):
                 # special code for debugging App using batchV2.
                 fqfn = os.path.join(
@@ -939,55 +889,116 @@ class Batch(BatchWriter, BatchSubmit):
                 )
                 if os.path.isdir(os.path.dirname(fqfn)):
                     with open(fqfn, 'wb') as fh:
-                        if not isinstance(content, bytes):
-                            content = content.encode()
-                        fh.write(content)
+                        if isinstance(content, (bytes, bytearray)):
+                            fh.write(content)
+                        elif content.seekable():
+                            position = content.tell()
+                            shutil.copyfileobj(content, fh)
+                            content.seek(position)
 
             # Post File
             url = f'/v2/groups/{api_branch}/{xid}/upload'
             headers = {'Content-Type': 'application/octet-stream'}
             params = {'owner': self._owner, 'updateIfExists': 'true'}
             r = self.submit_file_content('POST', url, content, headers, params, halt_on_error)
-            if r is None:
-                return None
 
-            if r.status_code == 401:
+            if r is not None and r.status_code == 401:
                 # use PUT method if file already exists
                 self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
                 r = self.submit_file_content('PUT', url, content, headers, params, halt_on_error)
-                if r is None:
-                    return None
+        finally:
+            if isinstance(content, tempfile.SpooledTemporaryFile):
+                content.close()
 
-            if not r.ok:
-                status = False
-                handle_error(
-                    code=585,
-                    message_values=[r.status_code, r.text],
-                    raise_error=halt_on_error,
-                )
-            elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
-                # save xid "if" successfully uploaded and not already saved
-                self.saved_xids = xid
+        status = r is not None and r.ok
+        self._file_upload_complete(status, start)
+        if r is None:
+            return {'uploaded': False, 'xid': xid}
 
-            self.log.info(
-                f'feature=batch, event=file-upload, status={r.status_code}, '
-                f'xid={xid}, remaining={len(file_data)}'
+        self.log.info(f'feature=batch, event=file-upload, status={r.status_code}, xid={xid}')
+        if not r.ok:
+            handle_error(
+                code=585,
+                message_values=[r.status_code, r.text],
+                raise_error=halt_on_error,
             )
-            upload_status.append({'uploaded': status, 'xid': xid})
+        elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
+            # save xid "if" successfully uploaded and not already saved
+            with self._file_lock:
+                self.saved_xids = xid
+
+        return {'uploaded': status, 'xid': xid}
 
+    def _file_upload_complete(self, status: bool, start: float):
+        """Update the aggregate file upload report."""
+        with self._file_lock:
+            self._file_upload_report['total'] += 1
+            self._file_upload_report['uploaded' if status else 'failed'] += 1
+            self._file_upload_report['seconds'] += time.monotonic() - start
+
+    def submit_files(self, file_data: dict, halt_on_error: bool = True) -> list[dict] | None:
+        """Submit Files for Documents and Reports to ThreatConnect API.
+
+        The files are uploaded concurrently by the file upload worker pool and this method
+        blocks until all files have been uploaded.
+
+        Critical Errors
+
+        * There is insufficient document storage allocated to this account.
+
+        Args:
+            halt_on_error: If True any exception will raise an error.
+            file_data: The file data to be submitted.
+
+        Returns:
+            dict: The upload status for each xid.
+        """
+        self.log.info(f'feature=batch, action=submit-files, count={len(file_data)}')
+        upload_status = []
+        for future in self.submit_files_async(file_data, halt_on_error):
+            status = future.result()
+            if status is not None:
+                upload_status.append(status)
         return upload_status
 
+    def submit_files_async(self, file_data: dict, halt_on_error: bool = True) -> list[Future]:
+        """Queue Files for Documents and Reports to be uploaded by the file upload worker pool.
+
+        The number of concurrent uploads is bounded by file_upload_workers. All queued uploads
+        are waited on when the batch is closed.
+
+        Args:
+            file_data: The file data to be submitted.
+            halt_on_error: If True any exception will raise an error.
+
+        Returns:
+            list[Future]: A future for each file upload that resolves to the upload status.
+        """
+        futures = []
+        for xid, content_data in list(file_data.items()):
+            del file_data[xid]  # win or loose remove the entry
+            futures.append(
+                self.file_executor.submit(self.submit_file, xid, content_data, halt_on_error)
+            )
+
+        with self._file_lock:
+            self._file_futures.extend(futures)
+        return futures
+
     def submit_file_content(
         self,
         method: str,
         url: str,
-        data: bytes | str,
+        data: bytearray | bytes | str | IO,
         headers: dict,
         params: dict,
         halt_on_error: bool = True,
     ) -> Response | None:
         """Submit File Content for Documents and Reports to ThreatConnect API.
 
+        Connection errors and transient status codes (e.g., 429 or 503) are retried with an
+        exponential back-off. File object data is rewound before each retry.
+
         Args:
             method: The HTTP method for the request (POST, PUT).
             url: The URL for the request.
@@ -999,11 +1010,37 @@ class Batch(BatchWriter, BatchSubmit):
         Returns:
             Response: The response from the request.
         """
+        seekable = hasattr(data, 'seekable') and data.seekable()  # type: ignore
+        position = data.tell() if seekable else None  # type: ignore
+
         r = None
-        try:
-            r = self.session_tc.request(method, url, data=data, headers=headers, params=params)
-        except Exception as e:
-            handle_error(code=580, message_values=[e], raise_error=halt_on_error)
+        attempt = 0
+        while True:
+            attempt += 1
+            retry = attempt <= self.file_upload_retries and (seekable or not hasattr(data, 'read'))
+            r = None
+            try:
+                if position is not None:
+                    data.seek(position)  # type: ignore
+                r = self.session_tc.request(method, url, data=data, headers=headers, params=params)
+                if r.status_code not in self.file_upload_retry_status or not retry:
+                    break
+                self.log.warning(
+                    f'feature=batch, event=file-upload-retry, status={r.status_code}, '
+                    f'attempt={attempt}, url={url}'
+                )
+            except Exception as e:
+                if not retry:
+                    handle_error(code=580, message_values=[e], raise_error=halt_on_error)
+                    break
+                self.log.warning(
+                    f'feature=batch, event=file-upload-retry, err="""{e}""", '
+                    f'attempt={attempt}, url={url}'
+                )
+
+            with self._file_lock:
+                self._file_upload_report['retries'] += 1
+            time.sleep(self.file_upload_back_off * 2 ** (attempt - 1))
         return r
 
     def submit_job(self, halt_on_error: bool = True) -> int | None:
@@ -1041,6 +1078,53 @@ class Batch(BatchWriter, BatchSubmit):
         self.log.debug(f'feature=batch, event=submit-job, status={data}')
         return data.get('data', {}).get('batchId')
 
+    def submit_poll(
+        self,
+        batch_id: int | None,
+        batch_data: dict,
+        errors: bool = True,
+        halt_on_error: bool = True,
+        count: int | None = None,
+    ) -> dict:
+        """Poll a submitted batch job for status and retrieve any errors.
+
+        Args:
+            batch_id: The batch id of the submitted batch job.
+            batch_data: The batch status returned when the batch job was submitted.
+            errors: If True retrieve any batch errors.
+            halt_on_error: If True any exception will raise an error.
+            count: The number of entities (groups and indicators) in the batch job.
+
+        Returns.
+            dict: The Batch Status from the ThreatConnect API.
+        """
+        self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
+        if batch_id is None:
+            # when batch_id is None it indicates that batch submission was small enough to be
+            # processed inline (without being queued)
+            return batch_data
+
+        # poll for status
+        batch_status = (
+            self.poll(batch_id, halt_on_error=halt_on_error, count=count)
+            .get('data', {})
+            .get('batchStatus', {})
+        )
+
+        # retrieve errors
+        if errors and batch_status:
+            error_count = batch_status.get('errorCount', 0)
+            error_groups = batch_status.get('errorGroupCount', 0)
+            error_indicators = batch_status.get('errorIndicatorCount', 0)
+            if (
+                isinstance(error_count, int)
+                and isinstance(error_groups, int)
+                and isinstance(error_indicators, int)
+            ):
+                if error_count > 0 or error_groups > 0 or error_indicators > 0:
+                    batch_status['errors'] = self.errors(batch_id)
+        return batch_status
+
     def submit_thread(
         self,
         name: str,
@@ -1087,8 +1171,8 @@ class Batch(BatchWriter, BatchSubmit):
             # get timestamp as a string without decimal place and consistent length
             timestamp = str(int(time.time() * 10000000))
             batch_json_file = os.path.join(self.debug_path_batch, f'batch-{timestamp}.json.gz')
-            with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            with gzip.open(batch_json_file, mode='wb') as fh:
+                fh.write(self.encode_content(content))
 
     @property
     def group_len(self) -> int:
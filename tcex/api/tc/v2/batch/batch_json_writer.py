@@ -0,0 +1,212 @@
+"""TcEx Framework Module"""
+
+# standard library
+import gzip
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+try:
+    # third-party
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    # third-party
+    import lz4.frame  # type: ignore
+except ImportError:  # pragma: no cover
+    lz4 = None
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class BatchJsonWriter:
+    """Streaming Batch JSON Writer
+
+    Writes batch JSON ({"group": [...], "indicator": [...]}) incrementally from pre-encoded
+    group and indicator entities, so the full batch content never has to exist in memory.
+    Groups must be written before indicators in each file.
+
+    When the max count or max size (uncompressed bytes) is reached, the rollover method closes
+    the current file and the next write starts a new file. Rollover is only performed when
+    requested by the caller, so a group association closure is never split across files.
+
+    Args:
+        output_dir: The directory to write the batch JSON files.
+        compression: The compression type ("gzip", "zstd", "lz4", or None).
+        compression_level: The compression level, defaults to the compression type default.
+        max_count: The max number of entities per file.
+        max_size: The max size in uncompressed bytes per file.
+        output_extension: Append this extension to output files.
+        callback: A callback method called with the fqfn and stats of each completed file.
+    """
+
+    extensions = {'gzip': '.json.gz', 'lz4': '.json.lz4', 'zstd': '.json.zst', None: '.json'}
+
+    def __init__(
+        self,
+        output_dir: str,
+        compression: str | None = 'gzip',
+        compression_level: int | None = None,
+        max_count: int | None = None,
+        max_size: int | None = None,
+        output_extension: str | None = None,
+        callback: Callable[[str, dict], Any] | None = None,
+    ):
+        """Initialize instance properties."""
+        self.output_dir = output_dir
+        self.compression = compression
+        self.compression_level = compression_level
+        self.max_count = max_count
+        self.max_size = max_size
+        self.output_extension = output_extension
+        self.callback = callback
+
+        # properties
+        self._fh: IO[bytes] | None = None
+        self._fqfn: str | None = None
+        self._section: str | None = None
+        self._start = 0.0
+        self.log = _logger
+        self.stats: dict = {}
+
+        if compression not in self.extensions:
+            raise RuntimeError(f'Invalid batch compression type provided ({compression}).')
+        if compression == 'zstd' and zstandard is None:
+            raise RuntimeError('The zstandard package is required for zstd batch compression.')
+        if compression == 'lz4' and lz4 is None:
+            raise RuntimeError('The lz4 package is required for lz4 batch compression.')
+
+    def _open(self, fqfn: str) -> IO[bytes]:
+        """Return a writable (compressed) file handle."""
+        if self.compression == 'gzip':
+            level = 9 if self.compression_level is None else self.compression_level
+            return gzip.open(fqfn, mode='wb', compresslevel=level)
+        if self.compression == 'zstd':
+            level = 3 if self.compression_level is None else self.compression_level
+            compressor = zstandard.ZstdCompressor(level=level)  # type: ignore
+            return compressor.stream_writer(open(fqfn, 'wb'))  # pylint: disable=consider-using-with
+        if self.compression == 'lz4':
+            level = 0 if self.compression_level is None else self.compression_level
+            return lz4.frame.open(fqfn, mode='wb', compression_level=level)  # type: ignore
+        return open(fqfn, 'wb')  # pylint: disable=consider-using-with
+
+    def _write(self, data: bytes):
+        """Write data to the current file, tracking the uncompressed size."""
+        self._fh.write(data)  # type: ignore
+        self.stats['bytes'] += len(data)
+
+    @property
+    def filename(self) -> str:
+        """Return a new unique batch JSON filename."""
+        while True:
+            # get timestamp as a string without decimal place and consistent length
+            filename = f'{str(round(time.time() * 10000000))}{self.extensions[self.compression]}'
+            if self.output_extension is not None:
+                # add any additional extension provided
+                filename += self.output_extension
+            if not os.path.isfile(os.path.join(self.output_dir, filename)):
+                return filename
+
+    @property
+    def rollover_required(self) -> bool:
+        """Return True if the current file has reached the max count or max size."""
+        if self._fh is None:
+            return False
+        count = self.stats['group'] + self.stats['indicator']
+        return (self.max_count is not None and count >= self.max_count) or (
+            self.max_size is not None and self.stats['bytes'] >= self.max_size
+        )
+
+    def close(self):
+        """Complete the current file and call the callback with the file stats."""
+        if self._fh is None:
+            return
+
+        if self._section == 'group':
+            self._write(b'], "indicator": [')
+        self._write(b']}')
+        self._fh.close()
+        self._fh = None
+        self._section = None
+
+        fqfn = self._fqfn
+        self.stats['file_bytes'] = os.path.getsize(fqfn)  # type: ignore
+        self.stats['seconds'] = round(time.perf_counter() - self._start, 3)
+        self.log.info(
+            f'''feature=batch, event=batch-json-written, filename={self.stats['filename']}, '''
+            f'''groups={self.stats['group']:,}, indicators={self.stats['indicator']:,}, '''
+            f'''bytes={self.stats['bytes']:,}, file-bytes={self.stats['file_bytes']:,}'''
+        )
+        if callable(self.callback):
+            self.callback(fqfn, dict(self.stats))  # type: ignore
+
+    def open(self):
+        """Start a new file, if a file is not already open.
+
+        Files are started by the first write, a file that is opened and closed without any
+        writes contains an empty batch ({"group": [], "indicator": []}).
+        """
+        if self._fh is not None:
+            return
+
+        filename = self.filename
+        self._fqfn = os.path.join(self.output_dir, filename)
+        self._fh = self._open(self._fqfn)
+        self._start = time.perf_counter()
+        self.stats = {
+            'bytes': 0,
+            'compression': self.compression,
+            'filename': filename,
+            'group': 0,
+            'indicator': 0,
+        }
+        self._write(b'{"group": [')
+        self._section = 'group'
+
+    def rollover(self) -> bool:
+        """Close the current file if the max count or max size has been reached.
+
+        Returns:
+            bool: True if the current file was closed.
+        """
+        if self.rollover_required is True:
+            self.close()
+            return True
+        return False
+
+    def write(self, section: str, encoded: bytes):
+        """Write a JSON encoded group or indicator to the current file.
+
+        Args:
+            section: The entity type ("group" or "indicator").
+            encoded: The JSON encoded group or indicator.
+        """
+        if self._fh is None:
+            self.open()
+
+        if section != self._section:
+            if section != 'indicator':
+                raise RuntimeError('Groups must be written before indicators in a batch file.')
+            self._write(b'], "indicator": [')
+            self._section = 'indicator'
+        elif self.stats[section] > 0:
+            self._write(b', ')
+
+        self._write(encoded)
+        self.stats[section] += 1
+
+    def __enter__(self) -> 'BatchJsonWriter':
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context manager, completing the current file."""
+        self.close()
@@ -0,0 +1,322 @@
+"""TcEx Framework Module"""
+
+# standard library
+import os
+import sqlite3
+import struct
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# first-party
+from tcex.api.tc.v2.batch.batch_store_abc import BatchStoreABC
+
+
+class SegmentStore(BatchStoreABC):
+    """Append-Only Segment File Batch Store
+
+    Every write appends a record to the segment file and updates an in-memory xid -> offset
+    index. Lookups are a single seek and read, deletes only remove the xid from the index,
+    and iteration is a sequential read of the segment file that skips any record that was
+    deleted or superseded by a later write.
+
+    Record layout: codec (1 byte), xid length (2 bytes), payload length (4 bytes), xid, payload.
+
+    Args:
+        fqfn: The fully qualified filename of the segment file.
+    """
+
+    header = struct.Struct('>cHI')
+    read_buffer = 1_048_576
+
+    def __init__(self, fqfn: str):
+        """Initialize instance properties."""
+        super().__init__(fqfn)
+
+        # properties
+        self._fh = None
+        self._index: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._size = 0
+
+    @property
+    def fh(self):
+        """Return the segment file handle, creating the file on first use.
+
+        If the segment file already exists (e.g., copied in for debugging) the index is rebuilt
+        from the existing records, with the last record for any xid taking precedence.
+        """
+        if self._fh is None:
+            if os.path.isfile(self.fqfn):
+                self._fh = open(self.fqfn, 'r+b')  # pylint: disable=consider-using-with
+                self._load_index()
+            else:
+                self._fh = open(self.fqfn, 'w+b')  # pylint: disable=consider-using-with
+        return self._fh
+
+    def _load_index(self):
+        """Rebuild the xid index from an existing segment file."""
+        with open(self.fqfn, 'rb', buffering=self.read_buffer) as fh:
+            while True:
+                header = fh.read(self.header.size)
+                if len(header) < self.header.size:
+                    break
+                _, xid_len, payload_len = self.header.unpack(header)
+                xid = fh.read(xid_len).decode()
+                fh.seek(payload_len, os.SEEK_CUR)
+                self._index[xid] = self._size
+                self._size += self.header.size + xid_len + payload_len
+
+    def _read(self, offset: int) -> Any:
+        """Return the decoded value of the record at the provided offset."""
+        with self._lock:
+            self.fh.seek(offset)
+            codec, xid_len, payload_len = self.header.unpack(self.fh.read(self.header.size))
+            self.fh.seek(xid_len, os.SEEK_CUR)
+            payload = self.fh.read(payload_len)
+        return self.decode(codec, payload)
+
+    def _scan(self, decode: bool = True) -> Iterator[tuple[str, Any]]:
+        """Yield live xid and value pairs by reading the segment file sequentially."""
+        with self._lock:
+            if not self.index or self._fh is None:
+                return
+            self._fh.flush()
+            # records appended after the scan starts are not included
+            end = self._size
+
+        with open(self.fqfn, 'rb', buffering=self.read_buffer) as fh:
+            position = 0
+            while position < end:
+                codec, xid_len, payload_len = self.header.unpack(fh.read(self.header.size))
+                xid = fh.read(xid_len).decode()
+                offset = position
+                position += self.header.size + xid_len + payload_len
+
+                if self._index.get(xid) != offset:
+                    # skip records that have been deleted or superseded
+                    fh.seek(payload_len, os.SEEK_CUR)
+                    continue
+
+                if decode is True:
+                    yield xid, self.decode(codec, fh.read(payload_len))
+                else:
+                    fh.seek(payload_len, os.SEEK_CUR)
+                    yield xid, None
+
+    @property
+    def index(self) -> dict[str, int]:
+        """Return the xid -> offset index, loading any existing segment file."""
+        if self._fh is None and os.path.isfile(self.fqfn):
+            with self._lock:
+                _ = self.fh
+        return self._index
+
+    def close(self, delete: bool = True):
+        """Close the store and optionally remove the segment file."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            self._index.clear()
+            self._size = 0
+            if delete is True and os.path.isfile(self.fqfn):
+                os.remove(self.fqfn)
+
+    def items(self) -> Iterator[tuple[str, Any]]:  # type: ignore
+        """Yield all xid and value pairs sequentially in insertion order."""
+        yield from self._scan()
+
+    def keys(self) -> Iterator[str]:  # type: ignore
+        """Yield all xids sequentially in insertion order without decoding values."""
+        for xid, _ in self._scan(decode=False):
+            yield xid
+
+    def set_many(self, records: Iterable[tuple[str, Any]]):
+        """Append all records to the segment file with a single write."""
+        buffer = bytearray()
+        offsets: dict[str, int] = {}
+        for xid, value in records:
+            codec, payload = self.encode(value)
+            xid_bytes = xid.encode()
+            offsets[xid] = len(buffer)
+            buffer += self.header.pack(codec, len(xid_bytes), len(payload))
+            buffer += xid_bytes
+            buffer += payload
+
+        with self._lock:
+            self.fh.seek(self._size)
+            self.fh.write(buffer)
+            for xid, offset in offsets.items():
+                self._index[xid] = self._size + offset
+            self._size += len(buffer)
+
+    def __contains__(self, xid: object) -> bool:
+        """Return True if xid is in the store."""
+        return xid in self.index
+
+    def __delitem__(self, xid: str):
+        """Remove the xid from the index (the record is left in the segment file)."""
+        with self._lock:
+            del self._index[xid]
+
+    def __getitem__(self, xid: str) -> Any:
+        """Return the value for the provided xid."""
+        return self._read(self.index[xid])
+
+    def __len__(self) -> int:
+        """Return the number of live records."""
+        return len(self.index)
+
+    def __setitem__(self, xid: str, value: Any):
+        """Append a record to the segment file and index the xid."""
+        codec, payload = self.encode(value)
+        xid_bytes = xid.encode()
+        with self._lock:
+            self.fh.seek(self._size)
+            self.fh.write(self.header.pack(codec, len(xid_bytes), len(payload)))
+            self.fh.write(xid_bytes)
+            self.fh.write(payload)
+            self._index[xid] = self._size
+            self._size += self.header.size + len(xid_bytes) + len(payload)
+
+
+class SqliteStore(BatchStoreABC):
+    """SQLite Batch Store
+
+    Records are stored in a single table with an autoincrement sequence that provides
+    insertion ordering and a unique xid column that provides indexed lookups.
+
+    Args:
+        fqfn: The fully qualified filename of the SQLite database.
+    """
+
+    page_size = 1_000
+
+    def __init__(self, fqfn: str):
+        """Initialize instance properties."""
+        super().__init__(fqfn)
+
+        # properties
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Return the SQLite connection, creating the database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.fqfn, check_same_thread=False, isolation_level=None)
+            # the store is temporary, trade durability for write throughput
+            self._conn.execute('PRAGMA journal_mode=OFF')
+            self._conn.execute('PRAGMA synchronous=OFF')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS store ('
+                'seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'xid TEXT UNIQUE NOT NULL, '
+                'codec BLOB NOT NULL, '
+                'payload BLOB NOT NULL)'
+            )
+        return self._conn
+
+    @property
+    def _connected(self) -> bool:
+        """Return True if the database is open or exists on disk."""
+        return self._conn is not None or os.path.isfile(self.fqfn)
+
+    def close(self, delete: bool = True):
+        """Close the store and optionally remove the database file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if delete is True and os.path.isfile(self.fqfn):
+                os.remove(self.fqfn)
+
+    def items(self) -> Iterator[tuple[str, Any]]:  # type: ignore
+        """Yield all xid and value pairs sequentially in insertion order.
+
+        Rows are read in pages so that rows can safely be deleted while iterating.
+        """
+        if self._connected is False:
+            return
+
+        with self._lock:
+            # rows inserted after the scan starts are not included
+            end = self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM store').fetchone()[0]
+
+        seq = 0
+        while True:
+            with self._lock:
+                rows = self.conn.execute(
+                    'SELECT seq, xid, codec, payload FROM store '
+                    'WHERE seq > ? AND seq <= ? ORDER BY seq LIMIT ?',
+                    (seq, end, self.page_size),
+                ).fetchall()
+            if not rows:
+                break
+
+            for seq, xid, codec, payload in rows:
+                if xid not in self:
+                    # skip rows deleted since the page was read
+                    continue
+                yield xid, self.decode(codec, payload)
+
+    def set_many(self, records: Iterable[tuple[str, Any]]):
+        """Insert or replace all records in a single transaction."""
+        rows = [(xid, *self.encode(value)) for xid, value in records]
+        with self._lock:
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO store (xid, codec, payload) VALUES (?, ?, ?)', rows
+                )
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.conn.execute('COMMIT')
+
+    def __contains__(self, xid: object) -> bool:
+        """Return True if xid is in the store."""
+        if self._connected is False:
+            return False
+
+        with self._lock:
+            row = self.conn.execute('SELECT 1 FROM store WHERE xid = ?', (xid,)).fetchone()
+        return row is not None
+
+    def __delitem__(self, xid: str):
+        """Delete the row for the provided xid."""
+        with self._lock:
+            cursor = self.conn.execute('DELETE FROM store WHERE xid = ?', (xid,))
+        if cursor.rowcount == 0:
+            raise KeyError(xid)
+
+    def __getitem__(self, xid: str) -> Any:
+        """Return the value for the provided xid."""
+        if self._connected is False:
+            raise KeyError(xid)
+
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT codec, payload FROM store WHERE xid = ?', (xid,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(xid)
+        return self.decode(row[0], row[1])
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        if self._connected is False:
+            return 0
+
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM store').fetchone()[0]
+
+    def __setitem__(self, xid: str, value: Any):
+        """Insert or replace the row for the provided xid."""
+        codec, payload = self.encode(value)
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO store (xid, codec, payload) VALUES (?, ?, ?)',
+                (xid, codec, payload),
+            )
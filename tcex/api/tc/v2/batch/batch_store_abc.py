@@ -0,0 +1,76 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import pickle  # nosec
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any
+
+
+class BatchStoreABC(MutableMapping, ABC):
+    """Batch Store Abstract Base Class
+
+    A batch store is a dict-like container, keyed by xid, used by BatchWriter and Batch to
+    hold group and indicator data on disk. Implementations must support O(1) lookup by xid
+    and a sequential read of all records in insertion order (via items/keys/values). Records
+    deleted during iteration are skipped, so consumers can drain the store while iterating.
+
+    Records are encoded as JSON when the value is a dict and pickled when the value is a
+    GroupType or IndicatorType object (which may hold callables or sub-objects).
+
+    Args:
+        fqfn: The fully qualified filename of the backing file.
+    """
+
+    codec_json = b'j'
+    codec_pickle = b'p'
+
+    def __init__(self, fqfn: str):
+        """Initialize instance properties."""
+        self.fqfn = fqfn
+
+    @classmethod
+    def decode(cls, codec: bytes, payload: bytes) -> Any:
+        """Return the value for an encoded record payload."""
+        if codec == cls.codec_json:
+            return json.loads(payload)
+        return pickle.loads(payload)  # nosec
+
+    @classmethod
+    def encode(cls, value: Any) -> tuple[bytes, bytes]:
+        """Return the codec and encoded payload for a value."""
+        if isinstance(value, dict):
+            try:
+                return cls.codec_json, json.dumps(value).encode()
+            except (TypeError, ValueError):
+                # dict contains a non JSON value (e.g., fileContent callable)
+                pass
+        return cls.codec_pickle, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @abstractmethod
+    def close(self, delete: bool = True):
+        """Close the store and optionally remove the backing file."""
+
+    @abstractmethod
+    def items(self) -> Iterator[tuple[str, Any]]:  # type: ignore
+        """Yield all xid and value pairs sequentially in insertion order."""
+
+    def set_many(self, records: Iterable[tuple[str, Any]]):
+        """Write many xid and value pairs, implementations may write the records in one batch."""
+        for xid, value in records:
+            self[xid] = value
+
+    def keys(self) -> Iterator[str]:  # type: ignore
+        """Yield all xids sequentially in insertion order."""
+        for xid, _ in self.items():
+            yield xid
+
+    def values(self) -> Iterator[Any]:  # type: ignore
+        """Yield all values sequentially in insertion order."""
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator of xids."""
+        return self.keys()
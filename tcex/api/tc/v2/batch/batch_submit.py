@@ -4,7 +4,7 @@
 import gzip
 import json
 import logging
-import math
+import os
 import re
 import time
 
@@ -12,6 +12,8 @@ import time
 from requests import Session
 
 # first-party
+from tcex.api.tc.v2.batch.poll_strategy import AdaptivePollStrategy
+from tcex.api.tc.v2.batch.poll_strategy_abc import PollStrategyABC
 from tcex.exit.error_code import handle_error
 from tcex.input.input import Input
 from tcex.logger.trace_logger import TraceLogger
@@ -34,6 +36,7 @@ class BatchSubmit:
         playbook_triggers_enabled: bool = False,
         tag_write_type: str = 'Replace',
         security_label_write_type: str = 'Replace',
+        poll_strategy: PollStrategyABC | None = None,
     ):
         """Initialize instance properties.
 
@@ -47,6 +50,8 @@ class BatchSubmit:
             playbook_triggers_enabled: Enables firing of playbooks.
             security_label_write_type: Write type for labels ['Append', 'Replace'].
             tag_write_type: Write type for tags ['Append', 'Replace'].
+            poll_strategy: The strategy used to schedule batch status requests. Defaults to an
+                AdaptivePollStrategy with the model persisted in the App temp directory.
         """
         self.inputs = inputs
         self.session_tc = session_tc
@@ -55,6 +60,7 @@ class BatchSubmit:
         self._halt_on_error = halt_on_error
         self._owner = owner
         self._playbook_triggers_enabled = playbook_triggers_enabled
+        self._poll_strategy = poll_strategy
         self._security_label_write_type = security_label_write_type
         self._tag_write_type = tag_write_type
 
@@ -69,8 +75,6 @@ class BatchSubmit:
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
         self._poll_timeout = 3600
 
     @property
@@ -258,6 +262,7 @@ class BatchSubmit:
         back_off: float | None = None,
         timeout: int | None = None,
         halt_on_error: bool = True,
+        count: int | None = None,
     ) -> dict:
         """Poll Batch status to ThreatConnect API.
 
@@ -276,13 +281,17 @@ class BatchSubmit:
                 }
             }
 
+        The wait before each status request is provided by the poll strategy. The poll state
+        for a batch job is local to this method, so concurrent polls can share the strategy.
+
         Args:
             batch_id: The ID returned from the ThreatConnect API for the current batch job.
             retry_seconds: The base number of seconds used for retries when job is not completed.
-            back_off: A multiplier to use for backing off on
-                each poll attempt when job has not completed.
+            back_off: The seconds added to the wait on each poll attempt when the job has
+                not completed (e.g., 2.5 waits retry_seconds + 2.5, + 5.0, ...).
             timeout: The number of seconds before the poll should timeout.
             halt_on_error: If True any exception will raise an error.
+            count: The number of entities (groups and indicators) in the batch job.
 
         Returns:
             dict: The batch status returned from the ThreatConnect API.
@@ -291,20 +300,8 @@ class BatchSubmit:
         if self.halt_on_poll_error is not None:
             halt_on_error = self.halt_on_poll_error
 
-        # initial poll interval
-        if self._poll_interval is None and self._batch_data_count is not None:
-            # calculate poll_interval base off the number of entries in the batch data
-            # with a minimum value of 5 seconds.
-            self._poll_interval = max(math.ceil(self._batch_data_count / 300), 5)
-        elif self._poll_interval is None:
-            # if not able to calculate poll_interval default to 15 seconds
-            self._poll_interval = 15
-
-        # poll retry back_off factor
-        poll_interval_back_off = float(2.5 if back_off is None else back_off)
-
-        # poll retry seconds
-        poll_retry_seconds = int(5 if retry_seconds is None else retry_seconds)
+        if count is None:
+            count = self._batch_data_count
 
         # poll timeout
         if timeout is None:
@@ -314,13 +311,14 @@ class BatchSubmit:
         params = {'includeAdditional': 'true'}
 
         poll_count = 0
-        poll_time_total = 0
+        poll_time_previous = 0.0
+        poll_start = time.monotonic()
         data = {}
-        while True:
+        for poll_interval in self.poll_strategy.intervals(count, retry_seconds, back_off):
             poll_count += 1
-            poll_time_total += self._poll_interval
-            time.sleep(self._poll_interval)
-            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total}')
+            time.sleep(poll_interval)
+            poll_time_total = time.monotonic() - poll_start
+            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total:.2f}')
             try:
                 # retrieve job status
                 r = self.session_tc.get(f'/v2/batch/{batch_id}', params=params)
@@ -342,40 +340,33 @@ class BatchSubmit:
                 handle_error(code=540, message_values=[e], raise_error=halt_on_error)
 
             if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
-                # store last 5 poll times to use in calculating average poll time
-                modifier = poll_time_total * 0.7
-                self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
-
-                weights: list[float | int] = [1]
-                poll_interval_time_weighted_sum = 0
-                for poll_interval_time in self._poll_interval_times:
-                    poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
-                    # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
-                    # on how many poll times are available.
-                    weights.append(weights[-1] * 1.5)
-
-                # pop off the last weight so its not added in to the sum
-                weights.pop()
-
-                # calculate the weighted average of the last 5 poll times
-                self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
-
-                if poll_count == 1:
-                    # if completed on first poll, reduce poll interval.
-                    self._poll_interval = self._poll_interval * 0.85
+                # update the poll strategy with the completed job
+                self.poll_strategy.complete(count, poll_time_total, poll_time_previous, poll_count)
 
-                self.log.debug(f'feature=batch, poll-time={poll_time_total}, status={data}')
+                self.log.debug(f'feature=batch, poll-time={poll_time_total:.2f}, status={data}')
                 return data
-
-            # update poll_interval for retry with max poll time of 20 seconds
-            self._poll_interval = min(
-                poll_retry_seconds + int(poll_count * poll_interval_back_off), 20
-            )
+            poll_time_previous = poll_time_total
 
             # time out poll to prevent App running indefinitely
             if poll_time_total >= timeout:
                 handle_error(code=550, message_values=[timeout], raise_error=True)
 
+        return data
+
+    @property
+    def poll_strategy(self) -> PollStrategyABC:
+        """Return the poll strategy used to schedule batch status requests."""
+        if self._poll_strategy is None:
+            self._poll_strategy = AdaptivePollStrategy(
+                model_file=os.path.join(self.inputs.model.tc_temp_path, 'batch-poll-model.json')
+            )
+        return self._poll_strategy
+
+    @poll_strategy.setter
+    def poll_strategy(self, poll_strategy: PollStrategyABC):
+        """Set the poll strategy used to schedule batch status requests."""
+        self._poll_strategy = poll_strategy
+
     @property
     def poll_timeout(self) -> int:
         """Return current poll timeout value."""
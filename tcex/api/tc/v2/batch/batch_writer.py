@@ -1,17 +1,14 @@
 """TcEx Framework Module"""
 
 # standard library
-import gzip
 import hashlib
+import inspect
 import json
 import logging
 import os
-import re
-import shelve  # nosec
-import sys
-import time
 import uuid
 from collections import deque
+from collections.abc import Generator, Iterable, Mapping
 from typing import Any
 
 # third-party
@@ -19,7 +16,13 @@ from requests import Session  # TYPE-CHECKING
 
 # first-party
 from tcex.api.tc.util.threat_intel_util import ThreatIntelUtil
+from tcex.api.tc.util.ti_catalog import ti_catalog
+from tcex.api.tc.v2.batch.batch_json_writer import BatchJsonWriter
+from tcex.api.tc.v2.batch.batch_store import SegmentStore, SqliteStore
+from tcex.api.tc.v2.batch.batch_store_abc import BatchStoreABC
 from tcex.api.tc.v2.batch.group import (
+    GROUP_DATETIME_FIELDS,
+    GROUP_METADATA_MAP,
     Adversary,
     AttackPattern,
     Campaign,
@@ -41,6 +44,8 @@ from tcex.api.tc.v2.batch.group import (
 from tcex.api.tc.v2.batch.indicator import (
     ASN,
     CIDR,
+    INDICATOR_DATETIME_FIELDS,
+    INDICATOR_METADATA_MAP,
     URL,
     Address,
     EmailAddress,
@@ -62,6 +67,9 @@ module = __import__(__name__)
 # get tcex logger
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
+# custom indicator classes keyed on type name and value fields, generated once per process
+_custom_indicator_classes: dict[tuple[str, tuple[str, ...]], type] = {}
+
 # define GroupType
 GroupType = (
     Adversary
@@ -99,6 +107,20 @@ IndicatorType = (
 )
 
 
+class BatchContent(dict):
+    """Batch Content
+
+    A dict of group, indicator, and file data that also holds the JSON encoded bytes of each
+    group and indicator. The encoded bytes are collected as the content is built, so that each
+    entity is only serialized once to track the chunk size and to build the request body.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize instance properties."""
+        super().__init__(*args, **kwargs)
+        self.encoded: dict[str, list[bytes]] = {'group': [], 'indicator': []}
+
+
 class BatchWriter:
     """ThreatConnect Batch Import Module
 
@@ -106,14 +128,35 @@ class BatchWriter:
         inputs: The App inputs.
         session_tc: The ThreatConnect API session.
         output_dir: The directory to write the batch JSON data.
+        **kwargs: Additional keyword arguments.
+
+    Keyword Args:
+        output_compression (str): The compression for output files ("gzip", "zstd", "lz4", or
+            None). The zstd and lz4 types require the zstandard and lz4 packages. Defaults to
+            "gzip".
+        output_compression_level (int): The compression level for output files. Defaults to the
+            default level of the compression type.
+        output_extension (str): Append this extension to output files.
+        output_max_size (int): Start a new output file when the uncompressed size in bytes
+            reaches this value. Defaults to the max batch size.
+        store_type (str|type): The on-disk store used for saved TI data ("segment" or
+            "sqlite") or a BatchStoreABC subclass. Defaults to "segment".
+        write_callback (Callable): A callback method to call when a batch json file is written.
+            If the callback accepts a "stats" argument (or **kwargs) the file stats (e.g., entity
+            counts, uncompressed and compressed size) are also provided.
+        write_callback_kwargs (dict): Additional values to send to callback method.
     """
 
     def __init__(self, inputs: Input, session_tc: Session, output_dir: str, **kwargs):
         """Initialize instance properties."""
         self.inputs = inputs
         self.output_dir = output_dir
+        self.output_compression: str | None = kwargs.get('output_compression', 'gzip')
+        self.output_compression_level: int | None = kwargs.get('output_compression_level')
         self.output_extension = kwargs.get('output_extension')
+        self.output_max_size: int | None = kwargs.get('output_max_size')
         self.session_tc = session_tc
+        self.store_type: str | type[BatchStoreABC] = kwargs.get('store_type', 'segment')
         self.write_callback = kwargs.get('write_callback')
         self.write_callback_kwargs = kwargs.get('write_callback_kwargs', {})
 
@@ -122,11 +165,18 @@ class BatchWriter:
         self._batch_max_chunk = 100_000
         self._batch_size = 0  # track current batch size
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._bulk_datetime_cache_size = 10_000
+        self._progress_log_interval = 10_000  # log count/size every n entities
+        self._progress_log_level = logging.DEBUG
         self.log = _logger
         self.tic = ThreatIntelUtil(self.session_tc)
         self.util = Util()
 
-        # shelf settings
+        # persist the shared type catalog so the next batch (or App run) skips the download
+        if ti_catalog.cache_file is None:
+            ti_catalog.cache_file = os.path.join(self.inputs.model.tc_temp_path, 'ti-catalog.json')
+
+        # store settings
         self._group_shelf_fqfn = None
         self._indicator_shelf_fqfn = None
 
@@ -161,10 +211,15 @@ class BatchWriter:
                 value_fields.append(entry['value3Label'])
             value_count = len(value_fields)
 
-            class_data = {}
-            # Add Class for each Custom Indicator type to this module
-            custom_class = custom_indicator_class_factory(name, Indicator, class_data, value_fields)
-            setattr(module, class_name, custom_class)
+            # Add Class for each Custom Indicator type to this module (once per process)
+            custom_class = _custom_indicator_classes.get((name, tuple(value_fields)))
+            if custom_class is None:
+                class_data = {}
+                custom_class = custom_indicator_class_factory(
+                    name, Indicator, class_data, value_fields
+                )
+                setattr(module, class_name, custom_class)
+                _custom_indicator_classes[(name, tuple(value_fields))] = custom_class
 
             # Add Custom Indicator Method
             self._gen_indicator_method(name, custom_class, value_count)
@@ -204,6 +259,195 @@ class BatchWriter:
         method = locals()[f'method_{value_count}']
         setattr(self, method_name, method)
 
+    def _gen_store(self, fqfn: str) -> BatchStoreABC:
+        """Return an instance of the configured batch store.
+
+        Args:
+            fqfn: The fully qualified filename for the store file.
+        """
+        if isinstance(self.store_type, type) and issubclass(self.store_type, BatchStoreABC):
+            return self.store_type(fqfn)
+
+        store_types: dict[str, type[BatchStoreABC]] = {
+            'segment': SegmentStore,
+            'sqlite': SqliteStore,
+        }
+        if self.store_type not in store_types:
+            raise RuntimeError(f'Invalid store type provided ({self.store_type}).')
+        return store_types[self.store_type](fqfn)
+
+    def _drain_group_association(
+        self, xid: str
+    ) -> Generator[tuple[str, dict, dict, bytes], None, None]:
+        """Yield a group and all associated groups, removing them from memory and store.
+
+        Args:
+            xid: The xid of the group to retrieve associations.
+
+        Yields:
+            tuple: The xid, file data, group data, and JSON encoded group data.
+        """
+        xids = deque()
+        xids.append(xid)
+
+        while xids:
+            xid = xids.popleft()  # remove current xid
+            group_data = None
+
+            if xid in self.groups:
+                group_data = self.groups.get(xid)
+                del self.groups[xid]
+            elif xid in self.groups_shelf:
+                group_data = self.groups_shelf.get(xid)
+                del self.groups_shelf[xid]
+
+            if group_data:
+                # the file content is not part of the encoded data of a GroupType, for a dict
+                # it is removed by data_group_type before the data is encoded
+                file_data, group_dict = self.data_group_type(group_data)
+                encoded = self._encoded(group_data)
+                yield xid, file_data, group_dict, encoded
+
+                # extend xids with any groups associated with the same GroupType
+                xids.extend(group_dict.get('associatedGroupXid', []))
+
+    def _drain_indicators(
+        self, indicators: dict | BatchStoreABC
+    ) -> Generator[tuple[str, dict, bytes], None, None]:
+        """Yield indicators, removing them from memory or store.
+
+        Args:
+            indicators: The indicators in memory or store.
+
+        Yields:
+            tuple: The xid, indicator data, and JSON encoded indicator data.
+        """
+        # convert indicators.items() to a list to prevent dictionary change error. the store
+        # items are a sequential read of the store file that skips deleted xids.
+        items = (
+            indicators.items()
+            if isinstance(indicators, BatchStoreABC)
+            else list(indicators.items())
+        )
+
+        for xid, indicator_data in items:
+            encoded = self._encoded(indicator_data)
+            if not isinstance(indicator_data, dict):
+                indicator_data = indicator_data.data
+            del indicators[xid]
+            yield xid, indicator_data, encoded
+
+    @staticmethod
+    def _bulk_indicator_summary(data: dict) -> dict:
+        """Build the indicator summary from the value fields if not provided."""
+        if 'summary' not in data:
+            data['summary'] = Indicator.build_summary(
+                data.pop('value1', None), data.pop('value2', None), data.pop('value3', None)
+            )
+        return data
+
+    def _bulk_records(
+        self,
+        records: Iterable[dict] | dict[str, list],
+        defaults: dict,
+        metadata_map: Mapping[str, str],
+        datetime_fields: frozenset[str],
+    ) -> Generator[dict, None, None]:
+        """Yield batch formatted dicts for bulk added group or indicator records.
+
+        Field names are mapped and values are normalized the same as the Group and Indicator
+        objects, without creating an object per record. Parsed datetime values are cached for
+        the duration of the call as feeds commonly repeat the same datetime values.
+
+        Args:
+            records: An iterable of dicts or a dict of equal length lists (columnar) keyed on
+                field name.
+            defaults: Field values that apply to all records unless set in the record.
+            metadata_map: The map of snake case field names to batch field names.
+            datetime_fields: The (batch) field names that hold a datetime value.
+        """
+        if isinstance(records, dict):
+            # columnar input, e.g., {'summary': ['1.1.1.1', ...], 'rating': [5, ...]}
+            lengths = {field: len(values) for field, values in records.items()}
+            if len(set(lengths.values())) > 1:
+                raise ValueError(f'Columnar values must be equal length lists ({lengths}).')
+
+            fields = list(records)
+            records = (dict(zip(fields, values)) for values in zip(*records.values()))
+
+        datetimes: dict[Any, str] = {}
+
+        def normalize(record: dict, data: dict) -> dict:
+            """Add the normalized record fields to data."""
+            for key, value in record.items():
+                if value is None:
+                    continue
+
+                key = metadata_map.get(key, key)
+                if key in datetime_fields:
+                    formatted = datetimes.get(value)
+                    if formatted is None:
+                        if len(datetimes) >= self._bulk_datetime_cache_size:
+                            datetimes.clear()
+                        formatted = self.util.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ')
+                        datetimes[value] = formatted
+                    value = formatted
+                elif key == 'confidence':
+                    value = int(value)
+                elif key == 'rating':
+                    value = float(value)
+                data[key] = value
+            return data
+
+        defaults = normalize(defaults, {})
+        for record in records:
+            data = normalize(record, dict(defaults))
+
+            # set xid to random and unique uuid4 value if not provided
+            if 'xid' not in data:
+                data['xid'] = str(uuid.uuid4())
+            yield data
+
+    def _bulk_store(self, records: Iterable[dict], memory: dict, store: BatchStoreABC) -> int:
+        """Write records to the on-disk store in chunks, returning the number of records stored.
+
+        As with add_group/add_indicator the first record for a xid is kept, records with a xid
+        already in memory, in the store, or earlier in the same call are skipped (not counted).
+        """
+        count = 0
+        chunk: dict[str, dict] = {}
+        for data in records:
+            xid = data['xid']
+            if xid in chunk or xid in memory or xid in store:
+                continue
+
+            chunk[xid] = data
+            count += 1
+            if len(chunk) >= self._batch_max_chunk:
+                store.set_many(chunk.items())
+                chunk.clear()
+        if chunk:
+            store.set_many(chunk.items())
+        return count
+
+    @staticmethod
+    def _encoded(data: dict | GroupType | IndicatorType) -> bytes:
+        """Return the JSON encoded group or indicator data.
+
+        GroupType and IndicatorType objects cache the encoded data until they are modified, so
+        the data encoded to track the batch size is reused when the object is drained. Dicts are
+        encoded on each call as they can be modified by the caller at any time.
+
+        Args:
+            data: The Group or Indicator dict or object.
+        """
+        if isinstance(data, dict):
+            if 'fileContent' in data:
+                # file content is uploaded separately and is not part of the batch data
+                data = {k: v for k, v in data.items() if k != 'fileContent'}
+            return json.dumps(data).encode()
+        return data.encoded
+
     def _group(self, group_data: dict | GroupType, store: bool = True) -> dict | GroupType:
         """Return previously stored group or new group.
 
@@ -224,18 +468,15 @@ class BatchWriter:
         if self.groups.get(xid) is not None:
             # return existing group from memory
             group_data = self.groups[xid]
-        elif self.groups_shelf.get(xid) is not None:
-            # return existing group from shelf
+        elif xid in self.groups_shelf:
+            # return existing group from store
             group_data = self.groups_shelf[xid]
         else:
             # store new group
             self.groups[xid] = group_data
 
             # track total batch job data size as TI gets added
-            if isinstance(group_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(group_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(group_data.data))
+            self._batch_size += len(self._encoded(group_data))
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -264,18 +505,15 @@ class BatchWriter:
         if self.indicators.get(xid) is not None:
             # return existing indicator from memory
             indicator_data = self.indicators[xid]
-        elif self.indicators_shelf.get(xid) is not None:
-            # return existing indicator from shelf
+        elif xid in self.indicators_shelf:
+            # return existing indicator from store
             indicator_data = self.indicators_shelf[xid]
         else:
             # store new indicators
             self.indicators[xid] = indicator_data
 
             # track total batch job data size as TI gets added
-            if isinstance(indicator_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data.data))
+            self._batch_size += len(self._encoded(indicator_data))
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -292,28 +530,7 @@ class BatchWriter:
         Returns:
             list: The list of indicators split on " : ".
         """
-        indicator_list = [indicator]
-        if indicator.count(' : ') > 0:
-            # handle all multi-valued indicators types (file hashes and custom indicators)
-            indicator_list = []
-
-            # group 1 - lazy capture everything to first <space>:<space> or end of line
-            iregx_pattern = r'^(.*?(?=\s\:\s|$))?'
-            iregx_pattern += r'(?:\s\:\s)?'  # remove <space>:<space>
-            # group 2 - look behind for <space>:<space>, lazy capture everything
-            #           to look ahead (optional <space>):<space> or end of line
-            iregx_pattern += r'((?<=\s\:\s).*?(?=(?:\s)?\:\s|$))?'
-            iregx_pattern += r'(?:(?:\s)?\:\s)?'  # remove (optional <space>):<space>
-            # group 3 - look behind for <space>:<space>, lazy capture everything
-            #           to look ahead end of line
-            iregx_pattern += r'((?<=\s\:\s).*?(?=$))?$'
-            iregx = re.compile(iregx_pattern)
-
-            indicators = iregx.search(indicator)
-            if indicators is not None:
-                indicator_list = list(indicators.groups())
-
-        return indicator_list
+        return ThreatIntelUtil.expand_indicators(indicator)
 
     def add_group(self, group_data: dict, **kwargs) -> dict | GroupType:
         """Add a group to Batch Job.
@@ -349,6 +566,46 @@ class BatchWriter:
         """
         return self._group(group_data, kwargs.get('store', True))
 
+    def add_groups(
+        self, groups: Iterable[dict] | dict[str, list], save: bool = False, **kwargs
+    ) -> int:
+        """Add many groups to the Batch Job without creating a GroupType object per group.
+
+        Each group can use the batch field names (e.g., "dateAdded") or the snake case field
+        names supported by the group methods (e.g., "date_added"). Datetime values are
+        normalized and None values are dropped. The group type can be provided once as a
+        keyword argument for all groups.
+
+        .. code-block:: python
+
+            batch.add_groups(
+                {'name': ['Incident 1', 'Incident 2'], 'event_date': ['2024-01-01', 'now']},
+                type='Incident',
+            )
+
+        Args:
+            groups: An iterable of group dicts or a dict of equal length lists (columnar)
+                keyed on field name.
+            save: If True the groups are written directly to the on-disk store (in chunks)
+                instead of being held in memory.
+            **kwargs: Field values that apply to all groups unless set on the group.
+
+        Returns:
+            int: The number of groups added (groups skipped as a duplicate xid are not counted).
+        """
+        # file content is held in the group dict until the batch data is built
+        metadata_map = {**GROUP_METADATA_MAP, 'file_content': 'fileContent'}
+        records = self._bulk_records(groups, kwargs, metadata_map, GROUP_DATETIME_FIELDS)
+        if save is True:
+            return self._bulk_store(records, self.groups, self.groups_shelf)
+
+        count = 0
+        for data in records:
+            # a previously stored group is returned for a duplicate xid
+            if self._group(data) is data:
+                count += 1
+        return count
+
     def add_indicator(self, indicator_data: dict, **kwargs) -> dict | IndicatorType:
         """Add an indicator to Batch Job.
 
@@ -419,6 +676,56 @@ class BatchWriter:
 
         return self._indicator(indicator_data, kwargs.get('store', True))
 
+    def add_indicators(
+        self, indicators: Iterable[dict] | dict[str, list], save: bool = False, **kwargs
+    ) -> int:
+        """Add many indicators to the Batch Job without creating an IndicatorType per indicator.
+
+        Each indicator can use the batch field names (e.g., "dateAdded") or the snake case field
+        names supported by the indicator methods (e.g., "date_added"). Datetime, confidence, and
+        rating values are normalized and None values are dropped. If no summary is provided the
+        summary is built from the value1, value2, and value3 fields. The indicator type can be
+        provided once as a keyword argument for all indicators.
+
+        .. code-block:: python
+
+            batch.add_indicators(
+                {
+                    'value1': ['<md5 1>', '<md5 2>'],
+                    'value2': ['<sha1 1>', None],
+                    'rating': [5, 3],
+                },
+                type='File',
+                confidence=50,
+            )
+
+        Args:
+            indicators: An iterable of indicator dicts or a dict of equal length lists
+                (columnar) keyed on field name.
+            save: If True the indicators are written directly to the on-disk store (in chunks)
+                instead of being held in memory.
+            **kwargs: Field values that apply to all indicators unless set on the indicator.
+
+        Returns:
+            int: The number of indicators added (indicators skipped as a duplicate xid are not
+                counted).
+        """
+        records = (
+            self.add_indicator(self._bulk_indicator_summary(data), store=False)
+            for data in self._bulk_records(
+                indicators, kwargs, INDICATOR_METADATA_MAP, INDICATOR_DATETIME_FIELDS
+            )
+        )
+        if save is True:
+            return self._bulk_store(records, self.indicators, self.indicators_shelf)
+
+        count = 0
+        for data in records:
+            # a previously stored indicator is returned for a duplicate xid
+            if self._indicator(data) is data:
+                count += 1
+        return count
+
     def address(self, ip: str, **kwargs) -> Address | dict:
         """Add Address data to Batch.
 
@@ -535,17 +842,15 @@ class BatchWriter:
         """Cleanup batch job."""
         self.dump()
 
-        # cleanup shelf files
+        # cleanup store files
         try:
-            self.groups_shelf.close()
-            os.unlink(self.group_shelf_fqfn)
+            self.groups_shelf.close(delete=True)
         except Exception as ex:
             self.log.warning(f'action=batch-close, filename={self.group_shelf_fqfn} exception={ex}')
 
-        # cleanup shelf files
+        # cleanup store files
         try:
-            self.indicators_shelf.close()
-            os.unlink(self.indicator_shelf_fqfn)
+            self.indicators_shelf.close(delete=True)
         except Exception as ex:
             self.log.warning(
                 f'action=batch-close, filename={self.indicator_shelf_fqfn} exception={ex}'
@@ -574,23 +879,28 @@ class BatchWriter:
 
         **Processing Order:**
         * Process groups in memory up to max batch size.
-        * Process groups in shelf to max batch size.
+        * Process groups in store to max batch size.
         * Process indicators in memory up to max batch size.
-        * Process indicators in shelf up to max batch size.
+        * Process indicators in store up to max batch size.
 
-        This method will remove the group/indicator from memory and/or shelf.
+        Each call returns a single chunk bounded by the max chunk count and the max batch size
+        in bytes. Groups are always returned together with all of their associated groups, so
+        a chunk may exceed the limits by the size of a single association closure. Use
+        data_chunks to iterate over all chunks.
+
+        This method will remove the group/indicator from memory and/or store.
 
         Returns:
             dict: A dictionary of group, indicators, and/or file data.
         """
-        data = {'file': {}, 'group': [], 'indicator': []}
-        tracker = {'count': 0}
+        data = BatchContent({'file': {}, 'group': [], 'indicator': []})
+        tracker = {'count': 0, 'bytes': 0}
 
         # process group from memory, returning if max values have been reached
         if self.data_groups(data, self.groups, tracker) is True:
             return data
 
-        # process group from shelf file, returning if max values have been reached
+        # process group from store file, returning if max values have been reached
         if self.data_groups(data, self.groups_shelf, tracker) is True:
             return data
 
@@ -598,12 +908,24 @@ class BatchWriter:
         if self.data_indicators(data, self.indicators, tracker) is True:
             return data
 
-        # process indicator from shelf file, returning if max values have been reached
+        # process indicator from store file, returning if max values have been reached
         if self.data_indicators(data, self.indicators_shelf, tracker) is True:
             return data
 
         return data
 
+    def data_chunks(self) -> Generator[dict, None, None]:
+        """Yield bounded chunks of batch data until all groups and indicators are processed.
+
+        Yields:
+            dict: A dictionary of group, indicators, and/or file data.
+        """
+        while True:
+            content = self.data
+            if not content.get('group') and not content.get('indicator'):
+                break
+            yield content
+
     def data_group_association(self, data: dict, tracker: dict, xid: str):
         """Return group dict array following all associations.
 
@@ -612,34 +934,20 @@ class BatchWriter:
 
         Args:
             data: The data dict to update with group and file data.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
             xid: The xid of the group to retrieve associations.
         """
-        xids = deque()
-        xids.append(xid)
-
-        while xids:
-            xid = xids.popleft()  # remove current xid
-            group_data = None
-
-            if xid in self.groups:
-                group_data = self.groups.get(xid)
-                del self.groups[xid]
-            elif xid in self.groups_shelf:
-                group_data = self.groups_shelf.get(xid)
-                del self.groups_shelf[xid]
-
-            if group_data:
-                file_data, group_data = self.data_group_type(group_data)
-                data['group'].append(group_data)
-                if file_data:
-                    data['file'][xid] = file_data
+        for xid_, file_data, group_data, encoded in self._drain_group_association(xid):
+            data['group'].append(group_data)
+            if isinstance(data, BatchContent):
+                data.encoded['group'].append(encoded)
+            if file_data:
+                data['file'][xid_] = file_data
 
-                # update entity trackers
-                tracker['count'] += 1
-
-                # extend xids with any groups associated with the same GroupType
-                xids.extend(group_data.get('associatedGroupXid', []))
+            # update entity trackers
+            tracker['count'] += 1
+            tracker['bytes'] += len(encoded)
 
     @staticmethod
     def data_group_type(group_data: dict | GroupType) -> tuple[dict, dict]:
@@ -669,65 +977,120 @@ class BatchWriter:
 
         return file_data, group_data
 
-    def data_groups(self, data: dict, groups: dict | shelve.Shelf[Any], tracker: dict) -> bool:
+    def data_groups(self, data: dict, groups: dict | BatchStoreABC, tracker: dict) -> bool:
         """Process Group data.
 
         Args:
             data: The data dict to update with group and file data.
             groups: The list of groups to process.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
 
         Returns:
             bool: True if max values have been hit, else False.
         """
         # convert groups.keys() to a list to prevent dictionary change error caused by
-        # the data_group_association function deleting items from the GroupType.
+        # the data_group_association function deleting items from the GroupType. the store
+        # keys are a sequential read of the store file that skips deleted xids.
+        xids = groups.keys() if isinstance(groups, BatchStoreABC) else list(groups.keys())
 
         # process the group
-        for xid in list(groups.keys()):
+        for xid in xids:
             # get association from group data
             self.data_group_association(data, tracker, xid)
 
-            if tracker['count'] % 10_000 == 0:
+            if tracker['count'] % self._progress_log_interval == 0:
                 # log count/size at a sane level
-                self.log.debug(
-                    '''feature=batch, action=data-groups, ''' f'''count={tracker.get('count'):,}'''
+                self.log.log(
+                    self._progress_log_level,
+                    '''feature=batch, action=data-groups, '''
+                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}''',
                 )
 
+            if self.data_max_reached(tracker) is True:
+                return True
         return False
 
-    def data_indicators(
-        self, data: dict, indicators: dict | shelve.Shelf[Any], tracker: dict
-    ) -> bool:
+    def data_indicators(self, data: dict, indicators: dict | BatchStoreABC, tracker: dict) -> bool:
         """Process Indicator data.
 
         Args:
             data: The data dict to update with group and file data.
             indicators: The list of indicators to process.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
 
         Returns:
             bool: True if max values have been hit, else False.
         """
         # process the indicator
-        for xid, indicator_data in list(indicators.items()):
-            if not isinstance(indicator_data, dict):
-                indicator_data = indicator_data.data
+        for _, indicator_data, encoded in self._drain_indicators(indicators):
             data['indicator'].append(indicator_data)
-            del indicators[xid]
+            if isinstance(data, BatchContent):
+                data.encoded['indicator'].append(encoded)
 
             # update entity trackers
             tracker['count'] += 1
+            tracker['bytes'] += len(encoded)
 
-            if tracker['count'] % 10_000 == 0:
+            if tracker['count'] % self._progress_log_interval == 0:
                 # log count/size at a sane level
-                self.log.debug(
+                self.log.log(
+                    self._progress_log_level,
                     '''feature=batch, action=data-indicators, '''
-                    f'''count={tracker.get('count'):,}'''
+                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}''',
                 )
 
+            if self.data_max_reached(tracker) is True:
+                return True
+        return False
+
+    def data_max_reached(self, tracker: dict) -> bool:
+        """Return True if the max chunk count or max batch size has been reached.
+
+        Args:
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
+        """
+        if tracker['count'] >= self._batch_max_chunk or tracker['bytes'] >= self._batch_max_size:
+            # stop processing xid once max limit are reached
+            self.log.info(
+                '''feature=batch, event=max-value-reached, '''
+                f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
+            )
+            return True
         return False
 
+    @staticmethod
+    def encode_content(content: dict) -> bytes:
+        """Return the JSON encoded batch content.
+
+        For BatchContent the previously encoded group and indicator bytes are joined, so no
+        entity is serialized a second time. Any other content (e.g., a dict provided to
+        submit_callback or content with file data) is serialized with json.dumps.
+
+        Args:
+            content: The dict of groups and indicator data.
+        """
+        encoded = getattr(content, 'encoded', None)
+        if (
+            encoded is None
+            or not set(content).issubset({'group', 'indicator'})
+            or len(encoded['group']) != len(content.get('group', []))
+            or len(encoded['indicator']) != len(content.get('indicator', []))
+        ):
+            return json.dumps(content).encode()
+
+        return b''.join(
+            [
+                b'{"group": [',
+                b', '.join(encoded['group']),
+                b'], "indicator": [',
+                b', '.join(encoded['indicator']),
+                b']}',
+            ]
+        )
+
     def document(self, name: str, file_name: str, **kwargs) -> Document:
         """Add Document data to Batch.
 
@@ -735,8 +1098,8 @@ class BatchWriter:
             name: The name for this Group.
             file_name: The name for the attached file for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or
-                callback method to retrieve file content.
+            file_content (str;method, kwargs): The file contents (bytes, str, file object, or
+                iterable of chunks) or callback method to retrieve file content.
             malware (bool, kwargs): If true the file is considered malware.
             password (bool, kwargs): If malware is true a password for the zip archive is
             xid (str, kwargs): The external id for this Group.
@@ -751,22 +1114,35 @@ class BatchWriter:
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
     def dump(self):
-        """Process Batch request to ThreatConnect API."""
-        content = self.data
-        content.pop('file', {})
-        if not content.get('group') and not content.get('indicator'):
-            return
-
-        # special code for debugging App using batchV2.
-        self.write_batch_json(content)
+        """Write all batch data to disk.
 
-        # store the length of the batch data to use for poll interval calculations
-        self.log.info(
-            '''feature=batch, event=dump, type=group, ''' f'''count={len(content['group']):,}'''
-        )
+        Groups and indicators are streamed from memory and store directly into the output
+        files, so memory usage does not grow with the amount of batch data. A new file is
+        started when the max chunk count or output max size is reached, but a group and its
+        associated groups are always written to the same file.
+        """
+        counts = {'group': 0, 'indicator': 0}
+        with self.json_writer(
+            max_count=self._batch_max_chunk, max_size=self.output_max_size or self._batch_max_size
+        ) as writer:
+            for groups in [self.groups, self.groups_shelf]:
+                # the store keys are a sequential read of the store file that skips deleted xids
+                xids = groups.keys() if isinstance(groups, BatchStoreABC) else list(groups.keys())
+                for xid in xids:
+                    for *_, encoded in self._drain_group_association(xid):
+                        writer.write('group', encoded)
+                        counts['group'] += 1
+                    writer.rollover()
+
+            for indicators in [self.indicators, self.indicators_shelf]:
+                for *_, encoded in self._drain_indicators(indicators):
+                    writer.write('indicator', encoded)
+                    counts['indicator'] += 1
+                    writer.rollover()
+
+        self.log.info(f'''feature=batch, event=dump, type=group, count={counts['group']:,}''')
         self.log.info(
-            '''feature=batch, event=dump, type=indicator, '''
-            f'''count={len(content['indicator']):,}'''
+            f'''feature=batch, event=dump, type=indicator, count={counts['indicator']:,}'''
         )
         self.log.info(f'''feature=batch, event=dump, type=batch, size={self._batch_size:,}''')
 
@@ -906,13 +1282,13 @@ class BatchWriter:
 
     @property
     def group_shelf_fqfn(self) -> str:
-        """Return groups shelf fully qualified filename.
+        """Return groups store fully qualified filename.
 
-        For testing/debugging a previous shelf file can be copied into the tc_temp_path directory
-        instead of creating a new shelf file.
+        For testing/debugging a previous store file can be copied into the tc_temp_path directory
+        instead of creating a new store file.
         """
         if self._group_shelf_fqfn is None:
-            # new shelf file
+            # new store file
             self._group_shelf_fqfn = os.path.join(
                 self.inputs.model.tc_temp_path, f'groups-{str(uuid.uuid4())}'
             )
@@ -926,10 +1302,10 @@ class BatchWriter:
         return self._groups
 
     @property
-    def groups_shelf(self) -> shelve.Shelf[Any]:
-        """Return dictionary of all Groups data."""
+    def groups_shelf(self) -> BatchStoreABC:
+        """Return on-disk store of all saved Groups data."""
         if self._groups_shelf is None:
-            self._groups_shelf = shelve.open(self.group_shelf_fqfn, writeback=False)  # nosec
+            self._groups_shelf = self._gen_store(self.group_shelf_fqfn)
         return self._groups_shelf
 
     def host(self, hostname: str, **kwargs) -> Host:
@@ -996,13 +1372,13 @@ class BatchWriter:
 
     @property
     def indicator_shelf_fqfn(self) -> str:
-        """Return indicator shelf fully qualified filename.
+        """Return indicator store fully qualified filename.
 
-        For testing/debugging a previous shelf file can be copied into the tc_temp_path directory
-        instead of creating a new shelf file.
+        For testing/debugging a previous store file can be copied into the tc_temp_path directory
+        instead of creating a new store file.
         """
         if self._indicator_shelf_fqfn is None:
-            # new shelf file
+            # new store file
             self._indicator_shelf_fqfn = os.path.join(
                 self.inputs.model.tc_temp_path, f'indicators-{str(uuid.uuid4())}'
             )
@@ -1017,12 +1393,10 @@ class BatchWriter:
         return self._indicators
 
     @property
-    def indicators_shelf(self) -> shelve.Shelf[Any]:
-        """Return dictionary of all Indicator data."""
+    def indicators_shelf(self) -> BatchStoreABC:
+        """Return on-disk store of all saved Indicator data."""
         if self._indicators_shelf is None:
-            self._indicators_shelf = shelve.open(  # nosec
-                self.indicator_shelf_fqfn, writeback=False
-            )
+            self._indicators_shelf = self._gen_store(self.indicator_shelf_fqfn)
         return self._indicators_shelf
 
     def intrusion_set(self, name: str, **kwargs) -> IntrusionSet:
@@ -1042,6 +1416,21 @@ class BatchWriter:
         group_obj = IntrusionSet(name, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
+    def json_writer(self, **kwargs) -> BatchJsonWriter:
+        """Return a streaming batch JSON writer for the output directory.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to BatchJsonWriter (e.g., max_count).
+        """
+        return BatchJsonWriter(
+            self.output_dir,
+            compression=self.output_compression,
+            compression_level=self.output_compression_level,
+            output_extension=self.output_extension,
+            callback=self._write_complete,
+            **kwargs,
+        )
+
     def malware(self, name: str, **kwargs) -> Malware:
         """Add Malware data to Batch object.
 
@@ -1110,8 +1499,8 @@ class BatchWriter:
             name: The name for this Group.
             file_name (str): The name for the attached file for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
-                file content.
+            file_content (str;method, kwargs): The file contents (bytes, str, file object, or
+                iterable of chunks) or callback method to retrieve file content.
             publish_date (str, kwargs): The publish datetime expression for this Group.
             xid (str, kwargs): The external id for this Group.
             store: (bool, kwargs): Advanced - Defaults to True. If True
@@ -1125,7 +1514,7 @@ class BatchWriter:
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
     def save(self, resource: dict | GroupType | IndicatorType):
-        """Save group|indicator dict, GroupType, or IndicatorTypes to shelve.
+        """Save group|indicator dict, GroupType, or IndicatorTypes to the on-disk store.
 
         Best effort to save group/indicator data to disk.  If for any reason the save fails
         the data will still be accessible from list in memory.
@@ -1317,20 +1706,35 @@ class BatchWriter:
         group_obj = Vulnerability(name, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
+    def _write_complete(self, fqfn: str, stats: dict):
+        """Track a completed batch json file and send the callback the filename (and stats)."""
+        self._batch_files.append(os.path.basename(fqfn))
+
+        if callable(self.write_callback):
+            kwargs = dict(self.write_callback_kwargs)
+            try:
+                parameters = inspect.signature(self.write_callback).parameters.values()
+            except (TypeError, ValueError):  # pragma: no cover
+                parameters = []
+            if any(p.name == 'stats' or p.kind == p.VAR_KEYWORD for p in parameters):
+                kwargs['stats'] = stats
+            self.write_callback(fqfn, **kwargs)
+
     def write_batch_json(self, content: dict):
-        """Write batch json data to a file."""
+        """Write batch json data to a file.
+
+        A file is written for any non-empty content dict, even when it has no groups or
+        indicators (e.g., {"group": [], "indicator": []}).
+        """
         if content:
-            # get timestamp as a string without decimal place and consistent length
-            filename = f'{str(round(time.time() * 10000000))}.json.gz'
-            if self.output_extension is not None:
-                # add any additional extension provided
-                filename += self.output_extension
-            # TODO: is this needed
-            self._batch_files.append(filename)
-            fqfn = os.path.join(self.output_dir, filename)
-            with gzip.open(fqfn, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
-
-            # send callback the filename
-            if callable(self.write_callback):
-                self.write_callback(fqfn, **self.write_callback_kwargs)
+            encoded = getattr(content, 'encoded', None)
+            with self.json_writer() as writer:
+                writer.open()
+                for section in ['group', 'indicator']:
+                    entities = content.get(section, [])
+                    if encoded is not None and len(encoded[section]) == len(entities):
+                        entities = encoded[section]
+                    else:
+                        entities = [json.dumps(e).encode() for e in entities]
+                    for entity in entities:
+                        writer.write(section, entity)
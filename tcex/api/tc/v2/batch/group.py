@@ -4,6 +4,7 @@
 import json
 import uuid
 from collections.abc import Callable
+from types import MappingProxyType
 from typing import Any
 
 # first-party
@@ -12,12 +13,49 @@ from tcex.api.tc.v2.batch.security_label import SecurityLabel
 from tcex.api.tc.v2.batch.tag import Tag
 from tcex.util import Util
 
+# group fields that hold a datetime value
+GROUP_DATETIME_FIELDS = frozenset(
+    {
+        'dateAdded',
+        'eventDate',
+        'firstSeen',
+        'lastSeen',
+        'externalDateCreated',
+        'externalDateExpires',
+        'externalLastModified',
+        'publishDate',
+    }
+)
+
+# map of snake case group field names to batch field names
+GROUP_METADATA_MAP = MappingProxyType(
+    {
+        'date_added': 'dateAdded',
+        'event_date': 'eventDate',
+        'file_name': 'fileName',
+        'file_text': 'fileText',
+        'file_type': 'fileType',
+        'first_seen': 'firstSeen',
+        'last_seen': 'lastSeen',
+        'external_date_created': 'externalDateCreated',
+        'external_date_expires': 'externalDateExpires',
+        'external_last_modified': 'externalLastModified',
+        'from_addr': 'from',
+        'publish_date': 'publishDate',
+        'to_addr': 'to',
+    }
+)
+
+# the Util methods are stateless so a single instance is shared by all Group objects
+util = Util()
+
 
 class Group:
     """ThreatConnect Batch Group Object"""
 
     __slots__ = [
         '_attributes',
+        '_encoded',
         '_file_content',
         '_group_data',
         '_labels',
@@ -49,11 +87,12 @@ class Group:
 
         # properties
         self._attributes = []
+        self._encoded: bytes | None = None
         self._labels = []
         self._file_content = None
         self._tags = []
         self._processed = False
-        self.util = Util()
+        self.util = util
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -62,24 +101,14 @@ class Group:
         if kwargs.get('xid') is None:
             self._group_data['xid'] = str(uuid.uuid4())
 
+    def _clear_encoded(self):
+        """Clear the encoded data when the Group or one of its child objects is modified."""
+        self._encoded = None
+
     @property
-    def _metadata_map(self) -> dict:
+    def _metadata_map(self) -> MappingProxyType:
         """Return metadata map for Group objects."""
-        return {
-            'date_added': 'dateAdded',
-            'event_date': 'eventDate',
-            'file_name': 'fileName',
-            'file_text': 'fileText',
-            'file_type': 'fileType',
-            'first_seen': 'firstSeen',
-            'last_seen': 'lastSeen',
-            'external_date_created': 'externalDateCreated',
-            'external_date_expires': 'externalDateExpires',
-            'external_last_modified': 'externalLastModified',
-            'from_addr': 'from',
-            'publish_date': 'publishDate',
-            'to_addr': 'to',
-        }
+        return GROUP_METADATA_MAP
 
     def add_file(self, filename: str, file_content: bytes | Callable[[str], Any] | str):
         """Add a file for Document and Report types.
@@ -93,6 +122,7 @@ class Group:
             filename: The name of the file.
             file_content: The contents of the file or callback to get contents.
         """
+        self._encoded = None
         self._group_data['fileName'] = filename
         self._file_content = file_content
 
@@ -110,17 +140,9 @@ class Group:
             key: The field key to add to the JSON batch data.
             value: The field value to add to the JSON batch data.
         """
+        self._encoded = None
         key = self._metadata_map.get(key, key)
-        if key in {
-            'dateAdded',
-            'eventDate',
-            'firstSeen',
-            'lastSeen',
-            'externalDateCreated',
-            'externalDateExpires',
-            'externalLastModified',
-            'publishDate',
-        }:
+        if key in GROUP_DATETIME_FIELDS:
             if value is not None:
                 self._group_data[key] = self.util.any_to_datetime(value).strftime(
                     '%Y-%m-%dT%H:%M:%SZ'
@@ -137,6 +159,7 @@ class Group:
         Args:
             group_xid: The external id of the Group to associate.
         """
+        self._encoded = None
         self._group_data.setdefault('associatedGroupXid', []).append(group_xid)  # type: ignore
 
     def attribute(
@@ -167,7 +190,8 @@ class Group:
         Returns:
             Attribute: An instance of the Attribute class.
         """
-        attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        self._encoded = None
+        attr = Attribute(attr_type, attr_value, displayed, source, formatter, self._clear_encoded)
         if unique == 'Type':
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type:
@@ -215,6 +239,7 @@ class Group:
     @date_added.setter
     def date_added(self, date_added: str):
         """Set Indicator dateAdded."""
+        self._encoded = None
         self._group_data['dateAdded'] = self.util.any_to_datetime(date_added).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -227,6 +252,7 @@ class Group:
     @first_seen.setter
     def first_seen(self, first_seen: str):
         """Set Indicator firstSeen."""
+        self._encoded = None
         self._group_data['firstSeen'] = self.util.any_to_datetime(first_seen).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -239,6 +265,7 @@ class Group:
     @last_seen.setter
     def last_seen(self, last_seen: str):
         """Set Indicator lastSeen."""
+        self._encoded = None
         self._group_data['lastSeen'] = self.util.any_to_datetime(last_seen).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -251,6 +278,7 @@ class Group:
     @external_date_created.setter
     def external_date_created(self, external_date_created: str):
         """Set Indicator externalDateCreated."""
+        self._encoded = None
         external_date_created = self.util.any_to_datetime(external_date_created).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -264,6 +292,7 @@ class Group:
     @external_date_expires.setter
     def external_date_expires(self, external_date_expires: str):
         """Set Indicator externalDateExpires."""
+        self._encoded = None
         external_date_expires = self.util.any_to_datetime(external_date_expires).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -277,11 +306,24 @@ class Group:
     @external_last_modified.setter
     def external_last_modified(self, external_date_last_modified: str):
         """Set Indicator externalLastModified."""
+        self._encoded = None
         external_date_last_modified = self.util.any_to_datetime(
             external_date_last_modified
         ).strftime('%Y-%m-%dT%H:%M:%SZ')
         self._group_data['externalLastModified'] = external_date_last_modified
 
+    @property
+    def encoded(self) -> bytes:
+        """Return the JSON encoded Group data.
+
+        The encoded data is cached until the Group or one of its attributes or security labels
+        is modified and is used to both track the batch size and build the batch request body.
+        Changes made directly to the data dict are not tracked.
+        """
+        if self._encoded is None:
+            self._encoded = json.dumps(self.data).encode()
+        return self._encoded
+
     @property
     def file_data(self) -> dict:
         """Return Group file (only supported for Document and Report)."""
@@ -325,7 +367,8 @@ class Group:
         Returns:
             SecurityLabel: An instance of the SecurityLabel class.
         """
-        label = SecurityLabel(name, description, color)
+        self._encoded = None
+        label = SecurityLabel(name, description, color, self._clear_encoded)
         for label_data in self._labels:
             if label_data.name == name:
                 label = label_data
@@ -344,6 +387,7 @@ class Group:
         Returns:
             Tag: An instance of the Tag class.
         """
+        self._encoded = None
         tag = Tag(name, formatter)
         for tag_data in self._tags:
             if tag_data.name == name:
@@ -460,8 +504,8 @@ class Document(Group):
 
         Keyword Args:
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
-                file content.
+            file_content (str;method, kwargs): The file contents (bytes, str, file object, or
+                iterable of chunks) or callback method to retrieve file content.
             malware (bool, kwargs): If true the file is considered malware.
             password (bool, kwargs): If malware is true a password for the zip archive is required.
             xid (str, kwargs): The external id for this Group.
@@ -488,6 +532,7 @@ class Document(Group):
     @malware.setter
     def malware(self, malware: bool):
         """Set Document malware."""
+        self._encoded = None
         self._group_data['malware'] = malware  # type: ignore
 
     @property
@@ -498,6 +543,7 @@ class Document(Group):
     @password.setter
     def password(self, password: str):
         """Set Document password."""
+        self._encoded = None
         self._group_data['password'] = password
 
 
@@ -536,6 +582,7 @@ class Email(Group):
     @from_addr.setter
     def from_addr(self, from_addr: str):
         """Set Email from."""
+        self._encoded = None
         self._group_data['from'] = from_addr
 
     @property
@@ -546,6 +593,7 @@ class Email(Group):
     @score.setter
     def score(self, score: str):
         """Set Email from."""
+        self._encoded = None
         self._group_data['score'] = score
 
     @property
@@ -556,6 +604,7 @@ class Email(Group):
     @to_addr.setter
     def to_addr(self, to_addr: str):
         """Set Email to."""
+        self._encoded = None
         self._group_data['to'] = to_addr
 
 
@@ -593,6 +642,7 @@ class Event(Group):
     @event_date.setter
     def event_date(self, event_date: str):
         """Set the Events "event date" value."""
+        self._encoded = None
         self._group_data['eventDate'] = self.util.any_to_datetime(event_date).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -605,6 +655,7 @@ class Event(Group):
     @status.setter
     def status(self, status: str):
         """Set the Events status value."""
+        self._encoded = None
         self._group_data['status'] = status
 
 
@@ -647,6 +698,7 @@ class Incident(Group):
     @event_date.setter
     def event_date(self, event_date: str):
         """Set Incident event_date."""
+        self._encoded = None
         self._group_data['eventDate'] = self.util.any_to_datetime(event_date).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -671,6 +723,7 @@ class Incident(Group):
         + Rejected
         + Deleted
         """
+        self._encoded = None
         self._group_data['status'] = status
 
 
@@ -727,8 +780,8 @@ class Report(Group):
         Keyword Args:
             date_added (str, kwargs): The date timestamp the Indicator was created.
             file_name (str, kwargs): The name for the attached file for this Group.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
-                file content.
+            file_content (str;method, kwargs): The file contents (bytes, str, file object, or
+                iterable of chunks) or callback method to retrieve file content.
             publish_date (str, kwargs): The publish datetime expression for this Group.
             xid (str, kwargs): The external id for this Group.
         """
@@ -753,6 +806,7 @@ class Report(Group):
     @publish_date.setter
     def publish_date(self, publish_date: str):
         """Set Report publish date"""
+        self._encoded = None
         self._group_data['publishDate'] = self.util.any_to_datetime(publish_date).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -4,6 +4,7 @@
 import json
 import uuid
 from collections.abc import Callable
+from types import MappingProxyType
 from typing import ForwardRef
 
 # first-party
@@ -14,6 +15,36 @@ from tcex.util import Util
 
 FileOccurrences = ForwardRef('FileOccurrences')
 
+# indicator fields that hold a datetime value
+INDICATOR_DATETIME_FIELDS = frozenset(
+    {
+        'dateAdded',
+        'lastModified',
+        'firstSeen',
+        'lastSeen',
+        'externalDateCreated',
+        'externalDateExpires',
+        'externalLastModified',
+    }
+)
+
+# map of snake case (or legacy) indicator field names to batch field names
+INDICATOR_METADATA_MAP = MappingProxyType(
+    {
+        'date_added': 'dateAdded',
+        'dnsActive': 'flag1',
+        'dns_active': 'flag1',
+        'last_modified': 'lastModified',
+        'private_flag': 'privateFlag',
+        'size': 'intValue1',
+        'whoisActive': 'flag2',
+        'whois_active': 'flag2',
+    }
+)
+
+# the Util methods are stateless so a single instance is shared by all Indicator objects
+util = Util()
+
 # import local modules for dynamic reference
 module = __import__(__name__)
 
@@ -58,6 +89,7 @@ class Indicator:
 
     __slots__ = [
         '_attributes',
+        '_encoded',
         '_file_actions',
         '_indicator_data',
         '_labels',
@@ -94,11 +126,12 @@ class Indicator:
 
         # properties
         self._attributes = []
+        self._encoded: bytes | None = None
         self._file_actions = []
         self._labels = []
         self._occurrences = []
         self._tags = []
-        self.util = Util()
+        self.util = util
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -107,19 +140,14 @@ class Indicator:
         if kwargs.get('xid') is None:
             self._indicator_data['xid'] = str(uuid.uuid4())
 
+    def _clear_encoded(self):
+        """Clear the encoded data when the Indicator or one of its child objects is modified."""
+        self._encoded = None
+
     @property
-    def _metadata_map(self) -> dict:
+    def _metadata_map(self) -> MappingProxyType:
         """Return metadata map for Indicator objects."""
-        return {
-            'date_added': 'dateAdded',
-            'dnsActive': 'flag1',
-            'dns_active': 'flag1',
-            'last_modified': 'lastModified',
-            'private_flag': 'privateFlag',
-            'size': 'intValue1',
-            'whoisActive': 'flag2',
-            'whois_active': 'flag2',
-        }
+        return INDICATOR_METADATA_MAP
 
     def add_key_value(self, key: str, value: str):
         """Add custom field to Indicator object.
@@ -135,17 +163,10 @@ class Indicator:
             key: The field key to add to the JSON batch data.
             value: The field value to add to the JSON batch data.
         """
+        self._encoded = None
         key = self._metadata_map.get(key, key)
 
-        if key in {
-            'dateAdded',
-            'lastModified',
-            'firstSeen',
-            'lastSeen',
-            'externalDateCreated',
-            'externalDateExpires',
-            'externalLastModified',
-        }:
+        if key in INDICATOR_DATETIME_FIELDS:
             self._indicator_data[key] = self.util.any_to_datetime(value).strftime(
                 '%Y-%m-%dT%H:%M:%SZ'
             )
@@ -164,6 +185,7 @@ class Indicator:
     @active.setter
     def active(self, active: bool):
         """Set Indicator active."""
+        self._encoded = None
         self._indicator_data['active'] = self.util.to_bool(active)
 
     def association(self, group_xid: str):
@@ -172,6 +194,7 @@ class Indicator:
         Args:
             group_xid (str): The external id of the Group to associate.
         """
+        self._encoded = None
         association = {'groupXid': group_xid}
         self._indicator_data.setdefault('associatedGroups', []).append(association)  # type: ignore
 
@@ -203,7 +226,8 @@ class Indicator:
         Returns:
             Attribute: An instance of the Attribute class.
         """
-        attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        self._encoded = None
+        attr = Attribute(attr_type, attr_value, displayed, source, formatter, self._clear_encoded)
         if unique == 'Type':
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type:
@@ -244,6 +268,7 @@ class Indicator:
     @confidence.setter
     def confidence(self, confidence: int):
         """Set Indicator confidence."""
+        self._encoded = None
         self._indicator_data['confidence'] = int(confidence)
 
     @property
@@ -255,17 +280,16 @@ class Indicator:
             for attr in self._attributes:
                 if attr.valid:
                     self._indicator_data['attribute'].append(attr.data)
-        # add file actions
+        # add file actions (rebuilt on each call so repeated access does not duplicate children)
         if self._file_actions:
-            self._indicator_data.setdefault('fileAction', {})
-            self._indicator_data['fileAction'].setdefault('children', [])  # type: ignore
-            for action in self._file_actions:
-                self._indicator_data['fileAction']['children'].append(action.data)  # type: ignore
+            self._indicator_data['fileAction'] = {
+                'children': [action.data for action in self._file_actions]
+            }
         # add file occurrences
         if self._occurrences:
-            self._indicator_data.setdefault('fileOccurrence', [])
-            for occurrence in self._occurrences:
-                self._indicator_data['fileOccurrence'].append(occurrence.data)  # type: ignore
+            self._indicator_data['fileOccurrence'] = [
+                occurrence.data for occurrence in self._occurrences
+            ]
         # add security labels
         if self._labels:
             self._indicator_data['securityLabel'] = []
@@ -287,10 +311,23 @@ class Indicator:
     @date_added.setter
     def date_added(self, date_added: str):
         """Set Indicator dateAdded."""
+        self._encoded = None
         self._indicator_data['dateAdded'] = self.util.any_to_datetime(date_added).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
 
+    @property
+    def encoded(self) -> bytes:
+        """Return the JSON encoded Indicator data.
+
+        The encoded data is cached until the Indicator or one of its attributes, file actions,
+        file occurrences, or security labels is modified and is used to both track the batch size
+        and build the batch request body. Changes made directly to the data dict are not tracked.
+        """
+        if self._encoded is None:
+            self._encoded = json.dumps(self.data).encode()
+        return self._encoded
+
     @property
     def last_modified(self) -> str:
         """Return Indicator lastModified."""
@@ -299,6 +336,7 @@ class Indicator:
     @last_modified.setter
     def last_modified(self, last_modified: str):
         """Set Indicator lastModified."""
+        self._encoded = None
         self._indicator_data['lastModified'] = self.util.any_to_datetime(last_modified).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -311,6 +349,7 @@ class Indicator:
     @first_seen.setter
     def first_seen(self, first_seen: str):
         """Set Indicator firstSeen."""
+        self._encoded = None
         self._indicator_data['firstSeen'] = self.util.any_to_datetime(first_seen).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -323,6 +362,7 @@ class Indicator:
     @last_seen.setter
     def last_seen(self, last_seen: str):
         """Set Indicator lastSeen."""
+        self._encoded = None
         self._indicator_data['lastSeen'] = self.util.any_to_datetime(last_seen).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -335,6 +375,7 @@ class Indicator:
     @external_date_created.setter
     def external_date_created(self, external_date_created: str):
         """Set Indicator externalDateCreated."""
+        self._encoded = None
         external_date_created = self.util.any_to_datetime(external_date_created).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -348,6 +389,7 @@ class Indicator:
     @external_date_expires.setter
     def external_date_expires(self, external_date_expires: str):
         """Set Indicator externalDateExpires."""
+        self._encoded = None
         external_date_expires = self.util.any_to_datetime(external_date_expires).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -361,6 +403,7 @@ class Indicator:
     @external_last_modified.setter
     def external_last_modified(self, external_date_last_modified: str):
         """Set Indicator externalLastModified."""
+        self._encoded = None
         external_date_last_modified = self.util.any_to_datetime(
             external_date_last_modified
         ).strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -386,7 +429,8 @@ class Indicator:
             # Indicator object has no logger to output warning
             return None
 
-        occurrence_obj = FileOccurrence(file_name, path, date)
+        self._encoded = None
+        occurrence_obj = FileOccurrence(file_name, path, date, self._clear_encoded)
         self._occurrences.append(occurrence_obj)
         return occurrence_obj
 
@@ -398,6 +442,7 @@ class Indicator:
     @private_flag.setter
     def private_flag(self, private_flag: bool):
         """Set Indicator private flag."""
+        self._encoded = None
         self._indicator_data['privateFlag'] = self.util.to_bool(private_flag)
 
     @property
@@ -408,6 +453,7 @@ class Indicator:
     @rating.setter
     def rating(self, rating: float):
         """Set Indicator rating."""
+        self._encoded = None
         self._indicator_data['rating'] = float(rating)
 
     @property
@@ -431,7 +477,8 @@ class Indicator:
         Returns:
             SecurityLabel: An instance of the SecurityLabel class.
         """
-        label = SecurityLabel(name, description, color)
+        self._encoded = None
+        label = SecurityLabel(name, description, color, self._clear_encoded)
         for label_data in self._labels:
             if label_data.name == name:
                 label = label_data
@@ -450,6 +497,7 @@ class Indicator:
         Returns:
             Tag: An instance of the Tag class.
         """
+        self._encoded = None
         tag = Tag(name, formatter)
         for tag_data in self._tags:
             if tag_data.name == name:
@@ -606,7 +654,10 @@ class File(Indicator):
 
     def action(self, relationship: str) -> 'FileAction':
         """Add a File Action."""
-        action_obj = FileAction(self._indicator_data['xid'], relationship)  # type: ignore
+        self._encoded = None
+        action_obj = FileAction(
+            self._indicator_data['xid'], relationship, self._clear_encoded  # type: ignore
+        )
         self._file_actions.append(action_obj)
         return action_obj
 
@@ -618,6 +669,7 @@ class File(Indicator):
     @md5.setter
     def md5(self, md5: str):
         """Set Indicator md5."""
+        self._encoded = None
         self._indicator_data['md5'] = md5
 
     @property
@@ -628,6 +680,7 @@ class File(Indicator):
     @sha1.setter
     def sha1(self, sha1: str):
         """Set Indicator sha1."""
+        self._encoded = None
         self._indicator_data['sha1'] = sha1
 
     @property
@@ -638,6 +691,7 @@ class File(Indicator):
     @sha256.setter
     def sha256(self, sha256: str):
         """Set Indicator sha256."""
+        self._encoded = None
         self._indicator_data['sha256'] = sha256
 
     @property
@@ -648,6 +702,7 @@ class File(Indicator):
     @size.setter
     def size(self, size: int):
         """Set Indicator size."""
+        self._encoded = None
         self._indicator_data['intValue1'] = size
 
 
@@ -684,6 +739,7 @@ class Host(Indicator):
     @dns_active.setter
     def dns_active(self, dns_active: bool):
         """Set Indicator dns active."""
+        self._encoded = None
         self._indicator_data['flag1'] = self.util.to_bool(dns_active)
 
     @property
@@ -694,6 +750,7 @@ class Host(Indicator):
     @whois_active.setter
     def whois_active(self, whois_active: bool):
         """Set Indicator whois active."""
+        self._encoded = None
         self._indicator_data['flag2'] = self.util.to_bool(whois_active)
 
 
@@ -799,9 +856,9 @@ class UserAgent(Indicator):
 class FileAction:
     """ThreatConnect Batch FileAction Object"""
 
-    __slots__ = ['_action_data', '_children', 'xid']
+    __slots__ = ['_action_data', '_children', '_on_change', 'xid']
 
-    def __init__(self, parent_xid: str, relationship):
+    def __init__(self, parent_xid: str, relationship, on_change: Callable[[], None] | None = None):
         """Initialize instance properties.
 
         .. warning:: This code is not complete and may require some update to the API.
@@ -809,7 +866,9 @@ class FileAction:
         Args:
             parent_xid: The external id of the parent Indicator.
             relationship: ???
+            on_change: A callable that is called when the File Action is modified.
         """
+        self._on_change = on_change
         self.xid = str(uuid.uuid4())
         self._action_data = {
             'indicatorXid': self.xid,
@@ -822,14 +881,15 @@ class FileAction:
     def data(self) -> dict:
         """Return File Occurrence data."""
         if self._children:
-            for child in self._children:
-                self._action_data.setdefault('children', []).append(child.data)
+            self._action_data['children'] = [child.data for child in self._children]
         return self._action_data
 
     def action(self, relationship):
         """Add a nested File Action."""
-        action_obj = FileAction(self.xid, relationship)
+        action_obj = FileAction(self.xid, relationship, self._on_change)
         self._children.append(action_obj)
+        if self._on_change is not None:
+            self._on_change()
 
     def __str__(self) -> str:
         """Return string representation of object."""
@@ -839,13 +899,14 @@ class FileAction:
 class FileOccurrence:
     """ThreatConnect Batch FileAction Object."""
 
-    __slots__ = ['_occurrence_data', 'util']
+    __slots__ = ['_occurrence_data', '_on_change', 'util']
 
     def __init__(
         self,
         file_name: str | None = None,
         path: str | None = None,
         date: str | None = None,
+        on_change: Callable[[], None] | None = None,
     ):
         """Initialize instance properties
 
@@ -853,11 +914,13 @@ class FileOccurrence:
             file_name (str, optional): The file name for this occurrence.
             path (str, optional): The file path for this occurrence.
             date (str, optional): The datetime expression for this occurrence.
+            on_change: A callable that is called when the File Occurrence is modified.
         """
         self._occurrence_data = {}
+        self._on_change = on_change
 
         # properties
-        self.util = Util()
+        self.util = util
 
         if file_name is not None:
             self._occurrence_data['fileName'] = file_name
@@ -868,6 +931,11 @@ class FileOccurrence:
                 '%Y-%m-%dT%H:%M:%SZ'
             )
 
+    def _modified(self):
+        """Notify the owner Indicator that the File Occurrence was modified."""
+        if self._on_change is not None:
+            self._on_change()
+
     @property
     def data(self) -> dict:
         """Return File Occurrence data."""
@@ -881,6 +949,7 @@ class FileOccurrence:
     @date.setter
     def date(self, date: str):
         """Set File Occurrence date."""
+        self._modified()
         self._occurrence_data['date'] = self.util.any_to_datetime(date).strftime(
             '%Y-%m-%dT%H:%M:%SZ'
         )
@@ -893,6 +962,7 @@ class FileOccurrence:
     @file_name.setter
     def file_name(self, file_name: str):
         """Set File Occurrence file name."""
+        self._modified()
         self._occurrence_data['fileName'] = file_name
 
     @property
@@ -903,6 +973,7 @@ class FileOccurrence:
     @path.setter
     def path(self, path: str):
         """Set File Occurrence path."""
+        self._modified()
         self._occurrence_data['path'] = path
 
     def __str__(self) -> str:
@@ -0,0 +1,279 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import math
+import os
+import random
+import threading
+from collections import deque
+from collections.abc import Iterator
+
+# first-party
+from tcex.api.tc.v2.batch.poll_strategy_abc import PollStrategyABC
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class AdaptivePollStrategy(PollStrategyABC):
+    """Adaptive Batch Poll Strategy
+
+    The time to complete a batch job is learned for each entity count band (counts are banded
+    by powers of 2) as an exponentially weighted moving average. When a model file is provided
+    the model is loaded from and saved to disk, so the model is shared across App runs.
+
+    For each batch job the first poll is made just before the predicted completion time. Jobs
+    with a prediction shorter than the min interval (e.g., small jobs) get an early short poll.
+    Any following polls use a jittered exponential back-off starting at the min interval and
+    capped at the max interval. When a back_off is passed to intervals (e.g., by
+    BatchSubmit.poll) the back-off is linear instead, adding back_off seconds on each poll as
+    in the original poll behavior. Until a count band has been learned, the prediction is
+    based on the nearest learned band or the prior throughput.
+
+    Args:
+        model_file: The JSON file used to persist the model. If None the model is only kept
+            in memory.
+        min_interval: The shortest wait in seconds between status requests.
+        max_interval: The longest wait in seconds between status requests.
+        growth: The multiplier applied to the interval after each incomplete status request.
+        jitter: The fraction of each back-off interval that is randomized (+/-).
+        smoothing: The weight given to the most recent job when updating the model.
+        prior_throughput: The entities per second used to predict jobs with no learned data.
+    """
+
+    history_size = 100
+
+    def __init__(
+        self,
+        model_file: str | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 20.0,
+        growth: float = 2.0,
+        jitter: float = 0.2,
+        smoothing: float = 0.3,
+        prior_throughput: float = 300.0,
+    ):
+        """Initialize instance properties."""
+        self.model_file = model_file
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.prior_throughput = prior_throughput
+
+        # properties
+        self._lock = threading.RLock()
+        self._metrics = {'error_seconds': 0.0, 'jobs': 0, 'polls': 0, 'seconds': 0.0}
+        self._history: deque[dict] = deque(maxlen=self.history_size)
+        self._model: dict | None = None
+        self.log = _logger
+
+    @staticmethod
+    def _band(count: int) -> int:
+        """Return the count band (a count between 2^(n-1) and 2^n - 1 is in band n)."""
+        return max(count, 1).bit_length()
+
+    def _save(self):
+        """Write the model to the model file (the caller must hold the lock)."""
+        if self.model_file is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.model_file) or '.', exist_ok=True)
+            temp_file = f'{self.model_file}.{os.getpid()}.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as fh:
+                json.dump(self._model, fh)
+            # atomic replace so that concurrent Apps never read a partial file
+            os.replace(temp_file, self.model_file)
+        except OSError as ex:
+            self.log.warning(f'feature=batch, event=poll-model-save-failed, error={ex}')
+
+    def complete(self, count: int | None, seconds: float, seconds_previous: float, polls: int):
+        """Update the model and metrics with a completed batch job."""
+        predicted = self.predict(count)
+
+        # the job completed between the last two status requests
+        observed = seconds if polls == 1 else (seconds + seconds_previous) / 2
+
+        with self._lock:
+            if count is not None:
+                bands = self.model['bands']
+                band = bands.get(str(self._band(count)))
+                if band is None:
+                    bands[str(self._band(count))] = {'samples': 1, 'seconds': observed}
+                else:
+                    band['samples'] += 1
+                    band['seconds'] += self.smoothing * (observed - band['seconds'])
+                self._save()
+
+            self._metrics['jobs'] += 1
+            self._metrics['polls'] += polls
+            self._metrics['seconds'] += seconds
+            if predicted is not None:
+                self._metrics['error_seconds'] += abs(observed - predicted)
+            self._history.append(
+                {'count': count, 'polls': polls, 'predicted': predicted, 'seconds': seconds}
+            )
+
+        self.log.info(
+            f'feature=batch, event=poll-complete, count={count}, polls={polls}, '
+            f'predicted={None if predicted is None else round(predicted, 2)}, '
+            f'seconds={round(seconds, 2)}'
+        )
+
+    def intervals(
+        self,
+        count: int | None,
+        retry_seconds: int | None = None,
+        back_off: float | None = None,
+    ) -> Iterator[float]:
+        """Yield the number of seconds to wait before each status request of a batch job.
+
+        Args:
+            count: The number of entities (groups and indicators) in the batch job, if known.
+            retry_seconds: The seconds to wait for the early short poll, defaults to the min
+                interval.
+            back_off: The seconds added to the wait on each poll attempt (linear back-off),
+                defaults to an exponential back-off using the growth multiplier.
+        """
+        retry_seconds_ = float(self.min_interval if retry_seconds is None else retry_seconds)
+
+        predicted = self.predict(count)
+        if predicted is not None and predicted > retry_seconds_:
+            # first poll just before the job is expected to be completed
+            yield predicted * 0.9
+
+        poll_count = 0
+        while True:
+            # early short poll followed by jittered (linear or exponential) back-off
+            if back_off is None:
+                interval = retry_seconds_ * self.growth**poll_count
+            else:
+                interval = retry_seconds_ + poll_count * back_off
+            yield min(interval, self.max_interval) * random.uniform(  # nosec
+                1 - self.jitter, 1 + self.jitter
+            )
+            poll_count += 1
+
+    @property
+    def metrics(self) -> dict:
+        """Return poll metrics (e.g., jobs, polls, and predicted vs actual completion time)."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['history'] = list(self._history)
+        metrics['error_seconds_mean'] = (
+            metrics['error_seconds'] / metrics['jobs'] if metrics['jobs'] else 0.0
+        )
+        return metrics
+
+    @property
+    def model(self) -> dict:
+        """Return the model, loading it from the model file on first access."""
+        with self._lock:
+            if self._model is None:
+                self._model = {'bands': {}}
+                if self.model_file is not None and os.path.isfile(self.model_file):
+                    try:
+                        with open(self.model_file, encoding='utf-8') as fh:
+                            model = json.load(fh)
+                        if isinstance(model.get('bands'), dict):
+                            self._model = model
+                    except (AttributeError, OSError, ValueError) as ex:
+                        self.log.warning(f'feature=batch, event=poll-model-load-failed, error={ex}')
+            return self._model
+
+    def predict(self, count: int | None) -> float | None:
+        """Return the predicted seconds to complete a batch job with the provided count.
+
+        Args:
+            count: The number of entities (groups and indicators) in the batch job.
+        """
+        if count is None:
+            return None
+
+        band = self._band(count)
+        with self._lock:
+            bands = self.model['bands']
+            if not bands:
+                return count / self.prior_throughput
+
+            # scale the nearest learned band, each band is double the count of the previous
+            nearest = min(bands, key=lambda b: abs(int(b) - band))
+            return bands[nearest]['seconds'] * 2 ** (band - int(nearest))
+
+
+class IntervalPollStrategy(PollStrategyABC):
+    """Interval Batch Poll Strategy
+
+    The original BatchSubmit poll behavior. The first poll waits for a weighted average of
+    the last 5 job times (or 1 second per 300 entities with a min of 5 seconds), and later
+    polls use a linear back-off capped at 20 seconds.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self._lock = threading.Lock()
+        self._poll_interval: float | None = None
+        self._poll_interval_times: list[float] = []
+
+    def complete(self, count: int | None, seconds: float, seconds_previous: float, polls: int):
+        """Update the weighted average of the last 5 job times."""
+        with self._lock:
+            # store last 5 poll times to use in calculating average poll time
+            modifier = seconds * 0.7
+            self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
+
+            weights: list[float | int] = [1]
+            poll_interval_time_weighted_sum = 0
+            for poll_interval_time in self._poll_interval_times:
+                poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
+                # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
+                # on how many poll times are available.
+                weights.append(weights[-1] * 1.5)
+
+            # pop off the last weight so its not added in to the sum
+            weights.pop()
+
+            # calculate the weighted average of the last 5 poll times
+            self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
+
+            if polls == 1:
+                # if completed on first poll, reduce poll interval.
+                self._poll_interval = self._poll_interval * 0.85
+
+    def intervals(
+        self,
+        count: int | None,
+        retry_seconds: int | None = None,
+        back_off: float | None = None,
+    ) -> Iterator[float]:
+        """Yield the number of seconds to wait before each status request of a batch job."""
+        with self._lock:
+            interval = self._poll_interval
+
+        # initial poll interval
+        if interval is None and count is not None:
+            # calculate poll_interval base off the number of entries in the batch data
+            # with a minimum value of 5 seconds.
+            interval = max(math.ceil(count / 300), 5)
+        elif interval is None:
+            # if not able to calculate poll_interval default to 15 seconds
+            interval = 15
+
+        # poll retry back_off factor
+        poll_interval_back_off = float(2.5 if back_off is None else back_off)
+
+        # poll retry seconds
+        poll_retry_seconds = int(5 if retry_seconds is None else retry_seconds)
+
+        poll_count = 0
+        while True:
+            poll_count += 1
+            yield interval
+
+            # update poll_interval for retry with max poll time of 20 seconds
+            interval = min(poll_retry_seconds + int(poll_count * poll_interval_back_off), 20)
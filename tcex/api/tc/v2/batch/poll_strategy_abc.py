@@ -0,0 +1,42 @@
+"""TcEx Framework Module"""
+
+# standard library
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+
+class PollStrategyABC(ABC):
+    """Batch Poll Strategy Abstract Base Class
+
+    A poll strategy controls how long BatchSubmit.poll waits before each status request. The
+    intervals method is called once per batch job and the returned iterator holds all state
+    for that job, so a single strategy can be shared by concurrent polls (e.g., pipelined
+    submissions). Any state shared across jobs must be protected by the implementation.
+    """
+
+    def complete(self, count: int | None, seconds: float, seconds_previous: float, polls: int):
+        """Record a completed batch job.
+
+        Args:
+            count: The number of entities (groups and indicators) in the batch job, if known.
+            seconds: The seconds from the start of polling until the completed status was seen.
+            seconds_previous: The seconds from the start of polling until the last poll that did
+                not return a completed status (0 if completed on the first poll).
+            polls: The number of status requests made.
+        """
+
+    @abstractmethod
+    def intervals(
+        self,
+        count: int | None,
+        retry_seconds: int | None = None,
+        back_off: float | None = None,
+    ) -> Iterator[float]:
+        """Yield the number of seconds to wait before each status request of a batch job.
+
+        Args:
+            count: The number of entities (groups and indicators) in the batch job, if known.
+            retry_seconds: The base number of seconds used for retries when job is not completed.
+            back_off: The seconds added to the wait on each poll attempt when the job has not
+                completed.
+        """
@@ -2,21 +2,30 @@
 
 # standard library
 import json
+from collections.abc import Callable
 
 
 class SecurityLabel:
     """ThreatConnect Batch SecurityLabel Object."""
 
-    __slots__ = ['_label_data']
+    __slots__ = ['_label_data', '_on_change']
 
-    def __init__(self, name: str, description: str | None = None, color: str | None = None):
+    def __init__(
+        self,
+        name: str,
+        description: str | None = None,
+        color: str | None = None,
+        on_change: Callable[[], None] | None = None,
+    ):
         """Initialize instance properties.
 
         Args:
             name: The value for this security label.
             description: A description for this security label.
             color: A color (hex value) for this security label.
+            on_change: A callable that is called when the security label is modified.
         """
+        self._on_change = on_change
         self._label_data = {'name': name}
         # add description if provided
         if description is not None:
@@ -24,6 +33,11 @@ class SecurityLabel:
         if color is not None:
             self._label_data['color'] = color
 
+    def _modified(self):
+        """Notify the owner (e.g., an Indicator) that the security label was modified."""
+        if self._on_change is not None:
+            self._on_change()
+
     @property
     def color(self) -> str | None:
         """Return Security Label color."""
@@ -33,6 +47,7 @@ class SecurityLabel:
     def color(self, color: str):
         """Set Security Label color."""
         self._label_data['color'] = color
+        self._modified()
 
     @property
     def data(self) -> dict:
@@ -48,6 +63,7 @@ class SecurityLabel:
     def description(self, description: str):
         """Set Security Label description."""
         self._label_data['description'] = description
+        self._modified()
 
     @property
     def name(self) -> str:
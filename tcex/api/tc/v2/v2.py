@@ -7,6 +7,7 @@ from requests import Session  # TYPE-CHECKING
 from tcex.api.tc.v2.batch.batch import Batch
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter
+from tcex.api.tc.v2.batch.poll_strategy_abc import PollStrategyABC
 from tcex.api.tc.v2.datastore.cache import Cache
 from tcex.api.tc.v2.datastore.datastore import DataStore
 from tcex.api.tc.v2.metric.metric import Metric
@@ -37,6 +38,9 @@ class V2:
         playbook_triggers_enabled: bool = False,
         tag_write_type: str = 'Replace',
         security_label_write_type: str = 'Replace',
+        store_type: str = 'segment',
+        poll_strategy: PollStrategyABC | None = None,
+        file_upload_workers: int = 4,
     ) -> Batch:
         """Return instance of Batch
 
@@ -48,6 +52,9 @@ class V2:
             playbook_triggers_enabled: Deprecated input, will not be used.
             security_label_write_type: Write type for labels ['Append', 'Replace'].
             tag_write_type: Write type for tags ['Append', 'Replace'].
+            store_type: The on-disk store used for saved TI data ("segment" or "sqlite").
+            poll_strategy: The strategy used to schedule batch status requests.
+            file_upload_workers: The max number of concurrent Document/Report file uploads.
         """
         return Batch(
             self.inputs,
@@ -59,6 +66,9 @@ class V2:
             playbook_triggers_enabled,
             tag_write_type,
             security_label_write_type,
+            store_type,
+            poll_strategy,
+            file_upload_workers,
         )
 
     def batch_submit(
@@ -102,9 +112,15 @@ class V2:
             **kwargs: Additional keyword arguments.
 
         Keyword Args:
+            output_compression (str): The compression for output files ("gzip", "zstd", "lz4",
+                or None).
+            output_compression_level (int): The compression level for output files.
             output_extension (str): Append this extension to output files.
+            output_max_size (int): Start a new output file at this uncompressed size in bytes.
+            store_type (str): The on-disk store used for saved TI data ("segment" or "sqlite").
             write_callback (Callable): A callback method to call when a batch json file is
-                written. The callback will be passed the fully qualified name of the written file.
+                written. The callback will be passed the fully qualified name of the written file
+                and, if the callback accepts a "stats" argument, the file stats.
             write_callback_kwargs (dict): Additional values to send to callback method.
         """
         return BatchWriter(self.inputs, self.session_tc, output_dir, **kwargs)
@@ -38,6 +38,7 @@ class GenerateABC(ABC):
         self.i3 = ' ' * 12  # indent level 3
         self.i4 = ' ' * 16  # indent level 4
         self.i5 = ' ' * 20  # indent level 5
+        self.i6 = ' ' * 24  # indent level 6
         self.messages = []
         self.requirements = {}
         self.util = Util()
@@ -223,16 +223,80 @@ class GenerateObjectABC(GenerateABC, ABC):
     def _gen_code_group_methods(self) -> str:
         """Return the method code.
 
-        @property
-        def filter(self) -> ArtifactFilter:
-            '''Return the type specific filter object.'''
-            return ArtifactFilter(self._session, self.tql)
+        The download, pdf, and upload methods stream the attachment content in chunks,
+        optionally reporting progress and hashes through a Transfer instance.
+
+        def download_to(self, destination, params=None, chunk_size=1_048_576, transfer=None):
+            '''Stream the document attachment for Document/Report Types to a file.'''
         """
         # BCS
         # self.requirements['type-checking'].append('''from requests import Response''')
-        self.requirements['first-party'].append('''from requests import Response''')
+        self.requirements['standard library'].extend(
+            [
+                'import os',
+                {'module': 'collections.abc', 'imports': ['Iterable']},
+                'from contextlib import closing',
+                {'module': 'typing', 'imports': ['BinaryIO']},
+            ]
+        )
+        self.requirements['first-party'].extend(
+            [
+                '''from requests import Response''',
+                '''from tcex.api.tc.v3.transfer import Transfer, UploadBody''',
+                '''from tcex.exit.error_code import handle_error''',
+            ]
+        )
         return '\n'.join(
             [
+                f'''{self.i1}def _download_to(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}url: str,''',
+                f'''{self.i2}destination: str | BinaryIO,''',
+                f'''{self.i2}params: dict | None,''',
+                f'''{self.i2}chunk_size: int,''',
+                f'''{self.i2}transfer: Transfer | None,''',
+                f'''{self.i1}) -> Transfer:''',
+                f'''{self.i2}"""Stream the response content to the destination in chunks."""''',
+                f'''{self.i2}transfer = transfer or Transfer()''',
+                f'''{self.i2}self._request(''',
+                f'''{self.i3}method='GET',''',
+                f'''{self.i3}url=url,''',
+                f'''{self.i3}headers={{'Accept': 'application/octet-stream'}},''',
+                f'''{self.i3}params=params,''',
+                f'''{self.i3}stream=True,''',
+                f'''{self.i2})''',
+                f'''{self.i2}with closing(self.request):''',
+                f'''{self.i3}if not self.request.ok:''',
+                f'''{self.i4}handle_error(''',
+                f'''{self.i5}code=952,''',
+                (
+                    f'''{self.i5}message_values=['GET', self.request.status_code, '''
+                    '''self.request.text, url],'''
+                ),
+                f'''{self.i4})''',
+                '',
+                f'''{self.i3}content_length = self.request.headers.get('Content-Length')''',
+                f'''{self.i3}transfer.total = int(content_length) if content_length else None''',
+                (
+                    f'''{self.i3}chunks = '''
+                    '''transfer.iter_chunks(self.request.iter_content(chunk_size), chunk_size)'''
+                ),
+                f'''{self.i3}if not isinstance(destination, str):''',
+                f'''{self.i4}for chunk in chunks:''',
+                f'''{self.i5}destination.write(chunk)''',
+                f'''{self.i4}return transfer''',
+                '',
+                f'''{self.i3}try:''',
+                f'''{self.i4}with open(destination, 'wb') as fh:''',
+                f'''{self.i5}for chunk in chunks:''',
+                f'''{self.i6}fh.write(chunk)''',
+                f'''{self.i3}except BaseException:''',
+                f'''{self.i4}# don't leave a partial file behind''',
+                f'''{self.i4}if os.path.isfile(destination):''',
+                f'''{self.i5}os.remove(destination)''',
+                f'''{self.i4}raise''',
+                f'''{self.i2}return transfer''',
+                '',
                 f'''{self.i1}def download(self, params: dict | None = None) -> bytes:''',
                 f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
                 f'''{self.i2}self._request(''',
@@ -243,6 +307,44 @@ class GenerateObjectABC(GenerateABC, ABC):
                 f'''{self.i2})''',
                 f'''{self.i2}return self.request.content''',
                 '',
+                f'''{self.i1}def download_to(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}destination: str | BinaryIO,''',
+                f'''{self.i2}params: dict | None = None,''',
+                f'''{self.i2}chunk_size: int = 1_048_576,''',
+                f'''{self.i2}transfer: Transfer | None = None,''',
+                f'''{self.i1}) -> Transfer:''',
+                (
+                    f'''{self.i2}"""Stream the document attachment for Document/Report Types to '''
+                    '''a file.'''
+                ),
+                '',
+                (
+                    f'''{self.i2}The attachment is written in chunks, so large attachments are '''
+                    '''never held in memory.'''
+                ),
+                '',
+                f'''{self.i2}.. code-block:: python''',
+                '',
+                f'''{self.i3}transfer = Transfer(hash_algorithms=['sha256'])''',
+                f'''{self.i3}document.download_to('/tmp/sample.bin', transfer=transfer)''',
+                '',
+                f'''{self.i2}Args:''',
+                f'''{self.i3}destination: The fully qualified filename or a binary file object.''',
+                f'''{self.i3}params: The query params for the request.''',
+                f'''{self.i3}chunk_size: The size of each chunk read from the response.''',
+                (
+                    f'''{self.i3}transfer: An optional Transfer to report progress and compute '''
+                    '''hashes.'''
+                ),
+                f'''{self.i2}"""''',
+                f'''{self.i2}return self._download_to(''',
+                (
+                    f'''{self.i3}f\'\'\'{{self.url('GET')}}/download\'\'\', destination, params, '''
+                    '''chunk_size, transfer'''
+                ),
+                f'''{self.i2})''',
+                '',
                 f'''{self.i1}def pdf(self, params: dict | None = None) -> bytes:''',
                 f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
                 f'''{self.i2}self._request(''',
@@ -255,15 +357,69 @@ class GenerateObjectABC(GenerateABC, ABC):
                 '',
                 f'''{self.i2}return self.request.content''',
                 '',
+                f'''{self.i1}def pdf_to(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}destination: str | BinaryIO,''',
+                f'''{self.i2}params: dict | None = None,''',
+                f'''{self.i2}chunk_size: int = 1_048_576,''',
+                f'''{self.i2}transfer: Transfer | None = None,''',
+                f'''{self.i1}) -> Transfer:''',
+                f'''{self.i2}"""Stream the PDF of the Group to a file (see download_to).''',
+                '',
+                f'''{self.i2}Args:''',
+                f'''{self.i3}destination: The fully qualified filename or a binary file object.''',
+                f'''{self.i3}params: The query params for the request.''',
+                f'''{self.i3}chunk_size: The size of each chunk read from the response.''',
                 (
-                    f'''{self.i1}def upload(self, content: bytes | str, '''
-                    '''params: dict | None = None) -> Response:'''
+                    f'''{self.i3}transfer: An optional Transfer to report progress and compute '''
+                    '''hashes.'''
                 ),
-                f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
+                f'''{self.i2}"""''',
+                f'''{self.i2}return self._download_to(''',
+                (
+                    f'''{self.i3}f\'\'\'{{self.url('GET')}}/pdf\'\'\', destination, params, '''
+                    '''chunk_size, transfer'''
+                ),
+                f'''{self.i2})''',
+                '',
+                f'''{self.i1}def upload(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}content: bytes | str | BinaryIO | Iterable[bytes],''',
+                f'''{self.i2}params: dict | None = None,''',
+                f'''{self.i2}chunk_size: int = 1_048_576,''',
+                f'''{self.i2}transfer: Transfer | None = None,''',
+                f'''{self.i1}) -> Response:''',
+                f'''{self.i2}"""Return the document attachment for Document/Report Types.''',
+                '',
+                (
+                    f'''{self.i2}A binary file object or an iterable of bytes is streamed rather '''
+                    '''than read into memory.'''
+                ),
+                f'''{self.i2}An iterable of bytes is sent with chunked transfer encoding.''',
+                '',
+                f'''{self.i2}Args:''',
+                (
+                    f'''{self.i3}content: The content as bytes, a string, a binary file object, '''
+                    '''or an iterable.'''
+                ),
+                f'''{self.i3}params: The query params for the request.''',
+                (
+                    f'''{self.i3}chunk_size: The size of each chunk read from a file object '''
+                    '''(with transfer only).'''
+                ),
+                (
+                    f'''{self.i3}transfer: An optional Transfer to report progress and compute '''
+                    '''hashes.'''
+                ),
+                f'''{self.i2}"""''',
+                f'''{self.i2}body = content''',
+                f'''{self.i2}if transfer is not None:''',
+                f'''{self.i3}body = UploadBody(content, transfer, chunk_size).body''',
+                '',
                 f'''{self.i2}self._request(''',
                 f'''{self.i3}method='POST',''',
                 f'''{self.i3}url=f\'\'\'{{self.url('GET')}}/upload\'\'\',''',
-                f'''{self.i3}body=content,''',
+                f'''{self.i3}body=body,''',
                 f'''{self.i3}headers={{'content-type': 'application/octet-stream'}},''',
                 f'''{self.i3}params=params,''',
                 f'''{self.i2})''',
@@ -0,0 +1,201 @@
+"""TcEx Framework Module"""
+
+# standard library
+import importlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Generator, Iterable
+from functools import lru_cache
+from itertools import islice
+from typing import Any
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.api.tc.v3.object_abc import ObjectABC
+from tcex.api.tc.v3.tql.tql_operator import TqlOperator
+from tcex.logger.trace_logger import TraceLogger
+from tcex.util import Util
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class AssociationLoader:
+    """Batched Association Loader for CM/TI Objects
+
+    The association properties on an object (e.g., indicator.associated_groups) send at least
+    one request per object. This loader retrieves the associations for up to chunk_size
+    parents with a single request, using an "id in (...)" TQL filter and the fields expansion
+    of the association (e.g., fields=associatedGroups). Results are cached in a LRU cache
+    keyed on the parent type, parent id, and association.
+
+    Expanded fields are subject to the limits the API places on nested results, use the
+    association property on the object when every association of a heavily associated object
+    is required.
+
+    .. code-block:: python
+
+        loader = tcex.api.tc.v3.association_loader()
+        indicators = tcex.api.tc.v3.indicators()
+        indicators.filter.tag(TqlOperator.EQ, 'enrich')
+        for indicator, groups in loader.iterate(indicators, 'associated_groups'):
+            ...
+
+    Args:
+        session: An configured instance of request.Session with TC API Auth.
+        cache_size: The max number of parent associations held in the cache.
+        chunk_size: The max number of parents included in a single request.
+    """
+
+    def __init__(self, session: Session, cache_size: int = 1_024, chunk_size: int = 100):
+        """Initialize instance properties."""
+        self.cache_size = cache_size
+        self.chunk_size = chunk_size
+        self.session = session
+
+        # properties
+        self._cache: OrderedDict[tuple[str, int, str], list[dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.log = _logger
+        self.util = Util()
+
+    def _cache_get(self, key: tuple[str, int, str]) -> list[dict] | None:
+        """Return the cached association data, updating the LRU order."""
+        with self._lock:
+            data = self._cache.get(key)
+            if data is None:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+                self._cache.move_to_end(key)
+            return data
+
+    def _cache_set(self, key: tuple[str, int, str], data: list[dict]):
+        """Add the association data to the cache, evicting the least recently used."""
+        if self.cache_size <= 0:
+            return
+
+        with self._lock:
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    @lru_cache
+    def _child_class(model_class: type, association: str) -> Any:
+        """Return the object class for the association (e.g., Group for associated_groups).
+
+        The class is resolved from the model of the association, following the layout of the
+        v3 modules (e.g., groups.group_model.GroupModel -> groups.group.Group).
+        """
+        field = model_class.__fields__.get(association)
+        fields = getattr(getattr(field, 'type_', None), '__fields__', {})
+        try:
+            model = fields['data'].type_
+            module = importlib.import_module(model.__module__.removesuffix('_model'))
+            return getattr(module, model.__name__.removesuffix('Model'))
+        except (AttributeError, ImportError, KeyError) as ex:
+            raise RuntimeError(
+                f'Invalid association: {association} provided for {model_class.__name__}.'
+            ) from ex
+
+    @staticmethod
+    def _collection_class(parent: ObjectABC) -> Any:
+        """Return the collection class for the parent (e.g., Indicators for Indicator)."""
+        module = importlib.import_module(type(parent).__module__)
+        return getattr(module, f'{parent.__class__.__name__}s')
+
+    def _fetch(self, parents: list[ObjectABC], association: str) -> dict[int, list[dict]]:
+        """Return the association data for the parents, retrieving any not already cached."""
+        parent = parents[0]
+        data: dict[int, list[dict]] = {}
+        missing = []
+        for id_ in {p.model.id for p in parents}:
+            cached = self._cache_get((parent._api_endpoint, id_, association))  # type: ignore
+            if cached is None:
+                missing.append(id_)
+            else:
+                data[id_] = cached  # type: ignore
+
+        if missing:
+            field_name = self.util.snake_to_camel(association)
+            collection = self._collection_class(parent)(
+                session=self.session,
+                params={'fields': [field_name], 'resultLimit': len(missing)},
+            )
+            collection.filter.id(TqlOperator.IN, missing)
+
+            for result in collection.as_dicts():
+                data[result['id']] = (result.get(field_name) or {}).get('data', [])
+            for id_ in missing:
+                # parents not returned (e.g., deleted) are cached as having no associations
+                data.setdefault(id_, [])
+                self._cache_set((parent._api_endpoint, id_, association), data[id_])
+
+            self.log.debug(
+                f'feature=api-tc-v3, event=association-load, association={association}, '
+                f'parents={len(parents)}, requested={len(missing)}'
+            )
+        return data
+
+    def iterate(
+        self, parents: Iterable[ObjectABC], association: str
+    ) -> Generator[tuple[ObjectABC, list[ObjectABC]], None, None]:
+        """Yield each parent and its associated objects.
+
+        Parents are consumed in chunks of chunk_size, so a collection can be provided
+        directly. Parents without an id use the association property of the parent.
+
+        Args:
+            parents: The parent objects (e.g., Indicator, Group, or Case).
+            association: The association property (e.g., associated_groups or tags).
+        """
+        parents = iter(parents)
+        while True:
+            chunk = list(islice(parents, self.chunk_size))
+            if not chunk:
+                break
+
+            # the parent types can be mixed (e.g., Groups and Indicators)
+            by_type: dict[type, list[ObjectABC]] = {}
+            for parent in chunk:
+                if parent.model.id is not None:
+                    by_type.setdefault(type(parent), []).append(parent)
+
+            data: dict[tuple[type, int], list[dict]] = {}
+            for parent_type, typed_parents in by_type.items():
+                # validate the association before sending any request
+                self._child_class(type(typed_parents[0].model), association)
+                for id_, association_data in self._fetch(typed_parents, association).items():
+                    data[(parent_type, id_)] = association_data
+
+            for parent in chunk:
+                if parent.model.id is None:
+                    yield parent, list(getattr(parent, association))
+                    continue
+
+                child_class = self._child_class(type(parent.model), association)
+                yield parent, [
+                    child_class(session=self.session, **child)
+                    for child in data[(type(parent), parent.model.id)]  # type: ignore
+                    # an object is not returned as an association of itself
+                    if not (isinstance(parent, child_class) and child.get('id') == parent.model.id)
+                ]
+
+    def load(self, parents: Iterable[ObjectABC], association: str) -> dict[int, list[ObjectABC]]:
+        """Return the associated objects for each parent keyed on the parent id.
+
+        Args:
+            parents: The parent objects (e.g., Indicator, Group, or Case).
+            association: The association property (e.g., associated_groups or tags).
+        """
+        return {
+            parent.model.id: children  # type: ignore
+            for parent, children in self.iterate(parents, association)
+        }
@@ -0,0 +1,211 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.api.tc.v3.object_abc import ObjectABC
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+@dataclass
+class BulkResult:
+    """The result of a single bulk create or update request."""
+
+    object: ObjectABC
+    status_code: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the request was successful."""
+        return self.error is None
+
+
+class BulkExecutor:
+    """Bulk Create/Update Executor for CM/TI Objects
+
+    Requests are sent by a bounded pool of threads that share the session (and its connection
+    pool). The body for each object is generated once in the calling thread before the
+    request is dispatched, and results are returned in the order the objects were provided.
+
+    The requests library keeps at most 10 connections per host by default, additional workers
+    will open (and discard) connections rather than reuse them.
+
+    .. code-block:: python
+
+        bulk = tcex.api.tc.v3.bulk(max_workers=8, rate_limit=20)
+        indicators = [
+            tcex.api.tc.v3.indicator(ip=ip, rating=3, type='Address') for ip in ips
+        ]
+        for result in bulk.create(indicators):
+            if not result.ok:
+                tcex.log.warning(f'error={result.error}')
+
+    Args:
+        session: An configured instance of request.Session with TC API Auth.
+        max_workers: The max number of concurrent requests.
+        rate_limit: The max number of requests per second per API endpoint.
+        update_model: If True, the model of each object is updated from the response.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        max_workers: int = 8,
+        rate_limit: float | None = None,
+        update_model: bool = True,
+    ):
+        """Initialize instance properties."""
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self.session = session
+        self.update_model = update_model
+
+        # properties
+        self._lock = threading.Lock()
+        self._next_request: dict[str, float] = {}
+        self.log = _logger
+
+    def _send(
+        self, obj: ObjectABC, method: str, url: str, body: str, params: dict | None
+    ) -> BulkResult:
+        """Send the request for a single object and return the result."""
+        self._throttle(obj._api_endpoint)
+        try:
+            obj._request(
+                method,
+                url,
+                body,
+                headers={'content-type': 'application/json'},
+                params=params,
+            )
+
+            # _request only raises for JSON error responses (e.g., not for a 502 from a proxy)
+            if not obj.success(obj.request):
+                err = obj.request.text or obj.request.reason
+                return BulkResult(obj, obj.request.status_code, err)
+
+            if self.update_model is True:
+                obj.model = obj.request.json().get('data')
+        except Exception as ex:
+            # a failed request is returned as a result instead of stopping the bulk run
+            request = getattr(obj, 'request', None)
+            return BulkResult(obj, getattr(request, 'status_code', None), str(ex))
+        return BulkResult(obj, obj.request.status_code)
+
+    def _throttle(self, endpoint: str):
+        """Wait until the next request to the endpoint is allowed by the rate limit."""
+        if not self.rate_limit:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_request.get(endpoint, now))
+            self._next_request[endpoint] = scheduled + 1 / self.rate_limit
+
+        if scheduled > now:
+            time.sleep(scheduled - now)
+
+    def create(self, objects: Iterable[ObjectABC], params: dict | None = None) -> list[BulkResult]:
+        """Create the provided objects, returning the results in order.
+
+        Args:
+            objects: The CM/TI objects (e.g., Case, Group, Indicator, or Victim) to create.
+            params: The query params sent with each request.
+        """
+        return list(self.execute(objects, 'POST', params=params))
+
+    def execute(
+        self,
+        objects: Iterable[ObjectABC],
+        method: str,
+        mode: str | None = None,
+        params: dict | None = None,
+    ) -> Generator[BulkResult, None, None]:
+        """Yield the result of the create (POST) or update (PUT) for each object in order.
+
+        Objects are consumed as requests complete, so at most twice max_workers bodies are
+        held in memory at a time.
+
+        Args:
+            objects: The CM/TI objects (e.g., Case, Group, Indicator, or Victim).
+            method: The HTTP method ("POST" or "PUT").
+            mode: The mode for nested objects on update ("append", "delete", or "replace").
+            params: The query params sent with each request.
+        """
+        method = method.upper()
+        if method not in ['POST', 'PUT']:
+            raise RuntimeError(f'Invalid method: {method} provided (valid methods: POST, PUT).')
+
+        objects = iter(objects)
+        futures: deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='v3-bulk'
+        ) as executor:
+
+            def submit() -> bool:
+                """Generate the body for the next object and submit the request."""
+                obj = next(objects, None)
+                if obj is None:
+                    return False
+
+                body = obj.model.gen_body_json(method=method, mode=mode)
+                obj_params = obj.gen_params(params) if params else None
+                unique_id = None
+                if method == 'PUT':
+                    unique_id = obj._calculate_unique_id().get('value')
+                    if not unique_id:
+                        future: Future = Future()
+                        future.set_result(BulkResult(obj, None, 'No ID provided.'))
+                        futures.append(future)
+                        return True
+
+                url = obj.url(method, unique_id)
+                futures.append(executor.submit(self._send, obj, method, url, body, obj_params))
+                return True
+
+            try:
+                while len(futures) < self.max_workers * 2 and submit():
+                    pass
+
+                while futures:
+                    result = futures.popleft().result()
+                    submit()
+                    if not result.ok:
+                        self.log.warning(
+                            f'feature=api-tc-v3, event=bulk-request-failed, method={method}, '
+                            f'status-code={result.status_code}, error={result.error}'
+                        )
+                    yield result
+            finally:
+                # consumer stopped early, don't send any queued requests
+                for future in futures:
+                    future.cancel()
+
+    def update(
+        self,
+        objects: Iterable[ObjectABC],
+        mode: str | None = None,
+        params: dict | None = None,
+    ) -> list[BulkResult]:
+        """Update the provided objects, returning the results in order.
+
+        Args:
+            objects: The CM/TI objects (e.g., Case, Group, Indicator, or Victim) to update.
+            mode: The mode for nested objects ("append", "delete", or "replace").
+            params: The query params sent with each request.
+        """
+        return list(self.execute(objects, 'PUT', mode, params))
@@ -2,8 +2,10 @@
 
 # standard library
 import json
-from collections.abc import Generator, Iterator
-from typing import TYPE_CHECKING, Self
+import os
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import closing
+from typing import TYPE_CHECKING, BinaryIO, Self
 
 # third-party
 from requests import Response
@@ -20,7 +22,9 @@ from tcex.api.tc.v3.object_abc import ObjectABC
 from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
 from tcex.api.tc.v3.security_labels.security_label_model import SecurityLabelModel
 from tcex.api.tc.v3.tags.tag_model import TagModel
+from tcex.api.tc.v3.transfer import Transfer, UploadBody
 from tcex.api.tc.v3.victim_assets.victim_asset_model import VictimAssetModel
+from tcex.exit.error_code import handle_error
 
 if TYPE_CHECKING:  # pragma: no cover
     # first-party
@@ -160,6 +164,49 @@ class Group(ObjectABC):
 
         return self.request
 
+    def _download_to(
+        self,
+        url: str,
+        destination: str | BinaryIO,
+        params: dict | None,
+        chunk_size: int,
+        transfer: Transfer | None,
+    ) -> Transfer:
+        """Stream the response content to the destination in chunks."""
+        transfer = transfer or Transfer()
+        self._request(
+            method='GET',
+            url=url,
+            headers={'Accept': 'application/octet-stream'},
+            params=params,
+            stream=True,
+        )
+        with closing(self.request):
+            if not self.request.ok:
+                handle_error(
+                    code=952,
+                    message_values=['GET', self.request.status_code, self.request.text, url],
+                )
+
+            content_length = self.request.headers.get('Content-Length')
+            transfer.total = int(content_length) if content_length else None
+            chunks = transfer.iter_chunks(self.request.iter_content(chunk_size), chunk_size)
+            if not isinstance(destination, str):
+                for chunk in chunks:
+                    destination.write(chunk)
+                return transfer
+
+            try:
+                with open(destination, 'wb') as fh:
+                    for chunk in chunks:
+                        fh.write(chunk)
+            except BaseException:
+                # don't leave a partial file behind
+                if os.path.isfile(destination):
+                    os.remove(destination)
+                raise
+        return transfer
+
     def download(self, params: dict | None = None) -> bytes:
         """Return the document attachment for Document/Report Types."""
         self._request(
@@ -170,6 +217,32 @@ class Group(ObjectABC):
         )
         return self.request.content
 
+    def download_to(
+        self,
+        destination: str | BinaryIO,
+        params: dict | None = None,
+        chunk_size: int = 1_048_576,
+        transfer: Transfer | None = None,
+    ) -> Transfer:
+        """Stream the document attachment for Document/Report Types to a file.
+
+        The attachment is written in chunks, so large attachments are never held in memory.
+
+        .. code-block:: python
+
+            transfer = Transfer(hash_algorithms=['sha256'])
+            document.download_to('/tmp/sample.bin', transfer=transfer)
+
+        Args:
+            destination: The fully qualified filename or a binary file object.
+            params: The query params for the request.
+            chunk_size: The size of each chunk read from the response.
+            transfer: An optional Transfer to report progress and compute hashes.
+        """
+        return self._download_to(
+            f'''{self.url('GET')}/download''', destination, params, chunk_size, transfer
+        )
+
     def pdf(self, params: dict | None = None) -> bytes:
         """Return the document attachment for Document/Report Types."""
         self._request(
@@ -182,12 +255,51 @@ class Group(ObjectABC):
 
         return self.request.content
 
-    def upload(self, content: bytes | str, params: dict | None = None) -> Response:
-        """Return the document attachment for Document/Report Types."""
+    def pdf_to(
+        self,
+        destination: str | BinaryIO,
+        params: dict | None = None,
+        chunk_size: int = 1_048_576,
+        transfer: Transfer | None = None,
+    ) -> Transfer:
+        """Stream the PDF of the Group to a file (see download_to).
+
+        Args:
+            destination: The fully qualified filename or a binary file object.
+            params: The query params for the request.
+            chunk_size: The size of each chunk read from the response.
+            transfer: An optional Transfer to report progress and compute hashes.
+        """
+        return self._download_to(
+            f'''{self.url('GET')}/pdf''', destination, params, chunk_size, transfer
+        )
+
+    def upload(
+        self,
+        content: bytes | str | BinaryIO | Iterable[bytes],
+        params: dict | None = None,
+        chunk_size: int = 1_048_576,
+        transfer: Transfer | None = None,
+    ) -> Response:
+        """Return the document attachment for Document/Report Types.
+
+        A binary file object or an iterable of bytes is streamed rather than read into memory.
+        An iterable of bytes is sent with chunked transfer encoding.
+
+        Args:
+            content: The content as bytes, a string, a binary file object, or an iterable.
+            params: The query params for the request.
+            chunk_size: The size of each chunk read from a file object (with transfer only).
+            transfer: An optional Transfer to report progress and compute hashes.
+        """
+        body = content
+        if transfer is not None:
+            body = UploadBody(content, transfer, chunk_size).body
+
         self._request(
             method='POST',
             url=f'''{self.url('GET')}/upload''',
-            body=content,
+            body=body,
             headers={'content-type': 'application/octet-stream'},
             params=params,
         )
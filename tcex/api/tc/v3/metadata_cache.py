@@ -0,0 +1,232 @@
+"""TcEx Framework Module"""
+
+# standard library
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.api.tc.v3.api_endpoints import ApiEndpoints
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class MetadataCache:
+    """Process-Wide Cache of V3 API Metadata
+
+    The OPTIONS requests for the fields, properties, and TQL options of an API endpoint return
+    the same data for every object, so the results are cached for all objects, collections,
+    and threads. Entries are keyed on the session base URL, API endpoint, and metadata kind
+    and expire after ttl seconds. Failed requests are not cached.
+
+    When cache_file is set the cache is loaded from and saved to the file, so that the next
+    run of the App can skip the requests. The file is ignored if server_version does not
+    match the version it was saved with.
+
+    .. code-block:: python
+
+        metadata_cache = tcex.api.tc.v3.metadata_cache
+        metadata_cache.cache_file = os.path.join(tc_temp_path, 'v3-metadata.json')
+        metadata_cache.warm(tcex.session.tc, ['/v3/groups', '/v3/indicators'])
+
+    Args:
+        ttl: The number of seconds a cached entry is valid.
+        cache_file: The optional fully qualified filename used to persist the cache.
+        server_version: The optional ThreatConnect server version, used to invalidate the file.
+    """
+
+    kinds = ('fields', 'properties', 'tql_options')
+
+    def __init__(
+        self, ttl: int = 3_600, cache_file: str | None = None, server_version: str | None = None
+    ):
+        """Initialize instance properties."""
+        self.cache_file = cache_file
+        self.server_version = server_version
+        self.ttl = ttl
+
+        # properties
+        self._data: dict[tuple[str, str, str], tuple[float, Any]] = {}
+        self._key_locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self._loaded_file: str | None = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.log = _logger
+        self.misses = 0
+
+    @classmethod
+    def _fetch(cls, session: Session, endpoint: str, kind: str) -> tuple[bool, Any]:
+        """Return the success status and metadata retrieved using an OPTIONS request."""
+        if kind == 'fields':
+            r = session.options(f'{endpoint}/fields', params={})
+            return r.ok, r.json().get('data', []) if r.ok else []
+
+        if kind == 'properties':
+            r = session.options(
+                endpoint,
+                params={'show': 'readOnly'},
+                headers={'content-type': 'application/json'},
+            )
+            return r.ok, r.json() if r.ok else {}
+
+        if kind == 'tql_options':
+            r = session.options(f'{endpoint}/tql', params={})
+            return r.ok, r.json()['data'] if r.ok else []
+
+        raise RuntimeError(f'Invalid metadata kind: {kind} (valid kinds: {", ".join(cls.kinds)}).')
+
+    def _get(self, session: Session, endpoint: str, kind: str, save: bool) -> Any:
+        """Return the metadata for the endpoint, sending the OPTIONS request if not cached."""
+        key = self._key(session, endpoint, kind)
+        with self._lock:
+            self._load()
+            value = self._value(key)
+            if value is not None:
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # only one thread sends the request for a key, other threads wait for the result
+        with key_lock:
+            with self._lock:
+                value = self._value(key)
+                if value is not None:
+                    return value
+                self.misses += 1
+
+            ok, value = self._fetch(session, endpoint, kind)
+            if ok:
+                with self._lock:
+                    self._data[key] = (time.time() + self.ttl, value)
+                    if save is True:
+                        self._save()
+            return value
+
+    def _key(self, session: Session, endpoint: str, kind: str) -> tuple[str, str, str]:
+        """Return the cache key."""
+        return getattr(session, 'base_url', None) or '', endpoint, kind
+
+    def _load(self):
+        """Load the cache file once, skipping expired entries or a server version mismatch."""
+        if self.cache_file is None or self._loaded_file == self.cache_file:
+            return
+
+        self._loaded_file = self.cache_file
+        if not os.path.isfile(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, encoding='utf-8') as fh:
+                contents = json.load(fh)
+        except (OSError, ValueError):
+            self.log.warning(
+                f'feature=api-tc-v3, event=metadata-cache-invalid, file={self.cache_file}'
+            )
+            return
+
+        if contents.get('server_version') != self.server_version:
+            return
+
+        now = time.time()
+        for entry in contents.get('entries', []):
+            if entry['expires'] > now:
+                key = (entry['base_url'], entry['endpoint'], entry['kind'])
+                self._data.setdefault(key, (entry['expires'], entry['value']))
+
+    def _save(self):
+        """Write the cache to the cache file."""
+        if self.cache_file is None:
+            return
+
+        entries = [
+            {'base_url': k[0], 'endpoint': k[1], 'kind': k[2], 'expires': e, 'value': v}
+            for k, (e, v) in self._data.items()
+        ]
+        temp_file = f'{self.cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as fh:
+                json.dump({'server_version': self.server_version, 'entries': entries}, fh)
+            os.replace(temp_file, self.cache_file)
+        except OSError as ex:
+            # the cache file is an optimization, the metadata is still cached in memory
+            self.log.warning(
+                f'feature=api-tc-v3, event=metadata-cache-save-failed, file={self.cache_file}, '
+                f'error={ex}'
+            )
+
+    def _value(self, key: tuple[str, str, str]) -> Any:
+        """Return the cached value if present and not expired (caller must hold the lock)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if expires <= time.time():
+            del self._data[key]
+            return None
+
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """Remove all entries from the cache (the cache file is left in place)."""
+        with self._lock:
+            self._data.clear()
+
+    def get(self, session: Session, endpoint: str, kind: str) -> Any:
+        """Return the metadata for the endpoint, sending the OPTIONS request if not cached.
+
+        A copy of the cached metadata is returned, so a caller can't modify the metadata of
+        other objects.
+
+        Args:
+            session: An configured instance of request.Session with TC API Auth.
+            endpoint: The API endpoint (e.g., /v3/indicators).
+            kind: The metadata kind ("fields", "properties", or "tql_options").
+        """
+        return copy.deepcopy(self._get(session, endpoint, kind, save=True))
+
+    def warm(
+        self,
+        session: Session,
+        endpoints: Iterable[str] | None = None,
+        kinds: Iterable[str] | None = None,
+        max_workers: int = 4,
+    ):
+        """Retrieve the metadata for the endpoints in parallel (e.g., on App startup).
+
+        Args:
+            session: An configured instance of request.Session with TC API Auth.
+            endpoints: The API endpoints, defaults to all V3 API endpoints.
+            kinds: The metadata kinds, defaults to all kinds.
+            max_workers: The max number of concurrent requests.
+        """
+        endpoints = endpoints or [e.value for e in ApiEndpoints]
+        kinds = kinds or self.kinds
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='metadata-cache'
+        ) as executor:
+            futures = [
+                executor.submit(self._get, session, endpoint, kind, False)
+                for endpoint in endpoints
+                for kind in kinds
+            ]
+            for future in futures:
+                future.result()
+
+        with self._lock:
+            self._save()
+
+
+# the metadata cache shared by all V3 objects and collections
+metadata_cache = MetadataCache()
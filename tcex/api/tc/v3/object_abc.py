@@ -3,7 +3,7 @@
 # standard library
 import logging
 from abc import ABC
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from typing import Self
 
 # third-party
@@ -11,12 +11,12 @@ from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.metadata_cache import metadata_cache
 from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
 from tcex.exit.error_code import handle_error
 from tcex.logger.trace_logger import TraceLogger
-from tcex.pleb.cached_property import cached_property
 from tcex.util import Util
 
 # get tcex logger
@@ -108,14 +108,15 @@ class ObjectABC(ABC):
         self,
         method: str,
         url: str,
-        body: bytes | str | None = None,
+        body: bytes | str | Iterable[bytes] | None = None,
         params: dict | None = None,
         headers: dict | None = None,
+        stream: bool = False,
     ):
         """Handle standard request with error checking."""
         try:
             self.request = self._session.request(
-                method, url, data=body, headers=headers, params=params
+                method, url, data=body, headers=headers, params=params, stream=stream
             )
             if isinstance(self.request.request.body, str) and len(self.request.request.body) < 1000:
                 self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
@@ -203,14 +204,10 @@ class ObjectABC(ABC):
 
         return self.request
 
-    @cached_property
+    @property
     def fields(self) -> list[dict[str, str]]:
-        """Return the field data for this object."""
-        _fields = []
-        r = self._session.options(f'{self._api_endpoint}/fields', params={})
-        if r.ok:
-            _fields = r.json().get('data', [])
-        return _fields
+        """Return the field data for this object (cached for all objects)."""
+        return metadata_cache.get(self._session, self._api_endpoint, 'fields')
 
     def gen_params(self, params: dict) -> dict:
         """Return appropriate params values."""
@@ -292,21 +289,15 @@ class ObjectABC(ABC):
         else:
             raise RuntimeError(f'Invalid data type: {type(data)} provided.')
 
-    @cached_property
+    @property
     def properties(self) -> dict[str, dict | list]:
-        """Return defined API properties for the current object.
+        """Return defined API properties for the current object (cached for all objects).
 
         This property is used in testing API consistency.
         """
         _properties = {}
         try:
-            r = self._session.options(
-                self._api_endpoint,
-                params={'show': 'readOnly'},
-                headers={'content-type': 'application/json'},
-            )
-            if r.ok:
-                _properties = r.json()
+            _properties = metadata_cache.get(self._session, self._api_endpoint, 'properties')
         except (ConnectionError, ProxyError):
             handle_error(
                 code=951,
@@ -1,9 +1,15 @@
 """TcEx Framework Module"""
 
 # standard library
+import json
 import logging
+import threading
 from abc import ABC
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from queue import Full, Queue
 from typing import Any
 
 # third-party
@@ -11,10 +17,11 @@ from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.metadata_cache import metadata_cache
+from tcex.api.tc.v3.object_record import ObjectRecord
 from tcex.api.tc.v3.tql.tql import Tql
 from tcex.exit.error_code import handle_error
 from tcex.logger.trace_logger import TraceLogger
-from tcex.pleb.cached_property import cached_property
 from tcex.util import Util
 
 # get tcex logger
@@ -30,6 +37,12 @@ class ObjectCollectionABC(ABC):
     methods are used.
     """
 
+    # the supported values for result_type (see iterate for details)
+    _result_types = frozenset({'dict', 'object', 'record'})
+
+    # pagination parameters that are replaced on each request when fetching pages in parallel
+    _page_keys = frozenset({'result_limit', 'resultLimit', 'result_start', 'resultStart'})
+
     def __init__(
         self,
         session: Session,
@@ -46,26 +59,35 @@ class ObjectCollectionABC(ABC):
         self.request: Response
         self.tql = Tql()
         self._model = None
+        self._counts: dict[str, int] = {}
         self.type_ = None  # defined in child class
         self.util = Util()
 
+        # pagination settings (see iterate for details)
+        self.page_size = 100
+        self.page_workers = 0
+        self.prefetch = 0
+
+        # result settings (see iterate for details)
+        self.result_type = 'object'
+
     def __len__(self) -> int:
-        """Return the length of the collection."""
-        parameters = self._params.copy()
-        parameters['resultLimit'] = 1
+        """Return the length of the collection (see count)."""
+        return self.count()
+
+    @property
+    def _api_endpoint(self):  # pragma: no cover
+        """Return filter method."""
+        raise NotImplementedError('Child class must implement this method.')
+
+    def _count(self, tql_string: str | None, approximate: bool = False) -> int:
+        """Return the count of results for the provided TQL string."""
+        parameters = self._query_params(tql_string)
         parameters['count'] = True
-        tql_string = self.tql.raw_tql
-        if not self.tql.raw_tql:
-            tql_string = self.tql.as_str
-        if tql_string:
-            parameters['tql'] = tql_string
 
-        # convert all keys to camel case
-        for k, v in list(parameters.items()):
-            k = self.util.snake_to_camel(k)
-            # if result_limit and resultLimit both show up use the proper cased version
-            if k not in parameters:
-                parameters[k] = v
+        cache_key = json.dumps(parameters, sort_keys=True, default=str)
+        if approximate is True and cache_key in self._counts:
+            return self._counts[cache_key]
 
         self._request(
             'GET',
@@ -74,12 +96,174 @@ class ObjectCollectionABC(ABC):
             params=parameters,
             headers={'content-type': 'application/json'},
         )
-        return self.request.json().get('count', len(self.request.json().get('data', [])))
+        response = self.request.json()
+        self._counts[cache_key] = response.get('count', len(response.get('data', [])))
+        return self._counts[cache_key]
 
-    @property
-    def _api_endpoint(self):  # pragma: no cover
-        """Return filter method."""
-        raise NotImplementedError('Child class must implement this method.')
+    def _fetch_page(self, url: str, params: dict) -> dict:
+        """Return the JSON for a single page of results.
+
+        Unlike _request this method does not update the request property, so it is safe to
+        call from a background thread.
+        """
+        try:
+            response = self._session.request(
+                'GET', url, headers={'content-type': 'application/json'}, params=params
+            )
+        except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
+            handle_error(
+                code=951,
+                message_values=[
+                    'GET',
+                    None,
+                    '{\"message\": \"Connection/Proxy Error/Retry\"}',
+                    url,
+                ],
+            )
+            return {}  # handle_error raises by default
+
+        self._validate_response(response)
+        self.log_response_text(response)
+        return response.json()
+
+    def _iterate_pages(self, url: str, params: dict, parallel: bool) -> Generator[list, None, None]:
+        """Yield the data for each page of each TQL chunk (see Tql.as_str_chunks)."""
+        for tql_string in self.tql.as_str_chunks():
+            chunk_params = params.copy()
+            if tql_string:
+                chunk_params['tql'] = tql_string
+
+            if self.page_workers > 0 and parallel is True:
+                yield from self._pages_parallel(url, chunk_params)
+            elif self.prefetch > 0:
+                yield from self._pages_prefetch(url, chunk_params)
+            else:
+                yield from self._pages(url, chunk_params)
+
+    def _pages(self, url: str, params: dict) -> Generator[list, None, None]:
+        """Yield the data for each page, following the next link of each page."""
+        while True:
+            self._request(
+                'GET',
+                body=None,
+                url=url,
+                headers={'content-type': 'application/json'},
+                params=params,
+            )
+
+            # reset some vars
+            params = {}
+
+            response = self.request.json()
+            url = response.pop('next', None)
+            yield response.get('data', [])
+
+            # break out of pagination if no next url present in results
+            if not url:
+                break
+
+    def _pages_parallel(self, url: str, params: dict) -> Generator[list, None, None]:
+        """Yield the data for each page, fetching pages in parallel using resultStart.
+
+        The exact count is retrieved first (a cached count may be stale) and then page_workers
+        threads fetch the pages. Pages are yielded in order and at most page_workers + prefetch
+        pages are in flight. If the last planned page is full (e.g., objects were created since
+        the count), the following pages are fetched one at a time until a page is not full.
+        """
+        count = self._count(params.get('tql'))
+        limit = int(params.get('resultLimit') or self.page_size)
+        last_start = int(params.get('resultStart') or 0)
+        starts = iter(range(last_start, count, limit))
+
+        futures: deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.page_workers, thread_name_prefix='collection-page'
+        ) as executor:
+
+            def submit(result_start: int):
+                nonlocal last_start
+                last_start = result_start
+                page_params = {k: v for k, v in params.items() if k not in self._page_keys}
+                page_params.update({'resultLimit': limit, 'resultStart': result_start})
+                futures.append(executor.submit(self._fetch_page, url, page_params))
+
+            try:
+                for result_start in islice(starts, self.page_workers + self.prefetch):
+                    submit(result_start)
+
+                while futures:
+                    data = futures.popleft().result().get('data', [])
+                    result_start = next(starts, None)
+                    if result_start is None and not futures and len(data) >= limit:
+                        # the last planned page is full, keep fetching past the count
+                        result_start = last_start + limit
+                    if result_start is not None:
+                        submit(result_start)
+                    yield data
+            finally:
+                # consumer stopped early or a page failed, don't fetch any queued pages
+                for future in futures:
+                    future.cancel()
+
+    def _pages_prefetch(self, url: str, params: dict) -> Generator[list, None, None]:
+        """Yield the data for each page, fetching the next pages in a background thread.
+
+        The next link of each page is followed by a background thread that buffers up to
+        prefetch pages while the current page is consumed.
+        """
+        pages: Queue = Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item: Any):
+            """Add an item to the queue unless the consumer has stopped."""
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except Full:
+                    continue
+
+        def fetch():
+            """Fetch all pages following the next link of each page."""
+            next_url, next_params = url, params
+            try:
+                while next_url and not stop.is_set():
+                    response = self._fetch_page(next_url, next_params)
+                    next_url, next_params = response.get('next'), {}
+                    put(response.get('data', []))
+            except Exception as ex:
+                put(ex)
+            put(None)
+
+        thread = threading.Thread(target=fetch, name='collection-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stop.set()
+
+    def _query_params(self, tql_string: str | None) -> dict:
+        """Return the params for a single result query (count or exists)."""
+        parameters = self._params.copy()
+        # field expansions don't change the count, but do add to the response time
+        parameters.pop('fields', None)
+        parameters['resultLimit'] = 1
+        if tql_string:
+            parameters['tql'] = tql_string
+
+        # convert all keys to camel case
+        for k, v in list(parameters.items()):
+            k = self.util.snake_to_camel(k)
+            # if result_limit and resultLimit both show up use the proper cased version
+            if k not in parameters:
+                parameters[k] = v
+        return parameters
 
     def _request(
         self,
@@ -106,21 +290,25 @@ class ObjectCollectionABC(ABC):
                 ],
             )
 
-        if not self.success(self.request):
-            err = self.request.text or self.request.reason
+        self._validate_response(self.request)
+
+        # log content for debugging
+        self.log_response_text(self.request)
+
+    def _validate_response(self, response: Response):
+        """Raise an error if the response is not successful."""
+        if not self.success(response):
+            err = response.text or response.reason
             handle_error(
                 code=950,
                 message_values=[
-                    self.request.request.method,
-                    self.request.status_code,
+                    response.request.method,
+                    response.status_code,
                     err,
-                    self.request.url,
+                    response.url,
                 ],
             )
 
-        # log content for debugging
-        self.log_response_text(self.request)
-
     @property
     def filter(self):  # pragma: no cover
         """Return filter method."""
@@ -142,13 +330,19 @@ class ObjectCollectionABC(ABC):
     def model(self, data):
         self._model = type(self.model)(**data)
 
-    def iterate(
-        self,
-        base_class: Any,
-        api_endpoint: str | None = None,
-        params: dict | None = None,
+    def _iter_result_type(self, result_type: str) -> Iterator:
+        """Return the collection iterator for the provided result type."""
+        result_type_, self.result_type = self.result_type, result_type
+        try:
+            # the result type is captured when the iterator is created
+            return iter(self)  # type: ignore
+        finally:
+            self.result_type = result_type_
+
+    def _iterate(
+        self, base_class: Any, api_endpoint: str | None, params: dict | None, result_type: str
     ) -> Generator:
-        """Iterate over CM/TI objects."""
+        """Yield the results of each page as the requested result type."""
         url = api_endpoint or self._api_endpoint
         params = params or self.params
 
@@ -162,33 +356,133 @@ class ObjectCollectionABC(ABC):
             k = self.util.snake_to_camel(k)
             params[k] = v
 
-        tql_string = self.tql.raw_tql or self.tql.as_str
+        pages = self._iterate_pages(url, params, api_endpoint is None)
 
-        if tql_string:
-            params['tql'] = tql_string
+        if result_type == 'dict':
+            for data in pages:
+                yield from data
+        elif result_type == 'record':
+            for data in pages:
+                for result in data:
+                    yield ObjectRecord(base_class, self._session, result)
+        else:
+            for data in pages:
+                for result in data:
+                    yield base_class(session=self._session, **result)  # type: ignore
 
-        while True:
+    def as_dicts(self) -> Iterator[dict]:
+        """Iterate over the collection yielding the raw API result for each object.
+
+        .. code-block:: python
+
+            for indicator in tcex.api.tc.v3.indicators().as_dicts():
+                print(indicator['summary'])
+        """
+        return self._iter_result_type('dict')
+
+    def as_records(self) -> Iterator[ObjectRecord]:
+        """Iterate over the collection yielding a lightweight record for each object.
+
+        The record Mapping methods (e.g., get) return raw field values, use record.object to
+        call the object methods with the same name (see ObjectRecord).
+
+        .. code-block:: python
+
+            for indicator in tcex.api.tc.v3.indicators().as_records():
+                print(indicator['summary'], indicator.model.rating)
+        """
+        return self._iter_result_type('record')
+
+    def count(self, approximate: bool = False) -> int:
+        """Return the number of objects that match the current filters.
+
+        The count of each query is cached on the collection. When approximate is True a
+        cached count is returned without sending a request, which may be stale if objects
+        were created or deleted since the count was retrieved (e.g., for progress reporting).
+        Iterating with page_workers retrieves the exact count to plan the page requests, which
+        also refreshes the cached count. The len() of a collection is always the exact count.
+
+        .. code-block:: python
+
+            indicators = tcex.api.tc.v3.indicators()
+            indicators.filter.tag(TqlOperator.EQ, 'enrich')
+            total = indicators.count()
+            for i, indicator in enumerate(indicators, start=1):
+                tcex.log.info(f'processing indicator {i} of {total}')
+
+        Args:
+            approximate: If True, a cached count is returned when available.
+        """
+        return sum(self._count(tql_string, approximate) for tql_string in self.tql.as_str_chunks())
+
+    def exists(self) -> bool:
+        """Return True if at least one object matches the current filters.
+
+        Unlike count, the server is not required to count all matching objects and a single
+        result is requested. When the TQL is chunked (see Tql.as_str_chunks) no further
+        requests are sent after the first chunk that returns a result.
+
+        .. code-block:: python
+
+            indicators = tcex.api.tc.v3.indicators()
+            indicators.filter.summary(TqlOperator.EQ, '1.1.1.1')
+            if not indicators.exists():
+                ...
+        """
+        for tql_string in self.tql.as_str_chunks():
             self._request(
                 'GET',
+                self._api_endpoint,
                 body=None,
-                url=url,
+                params=self._query_params(tql_string),
                 headers={'content-type': 'application/json'},
-                params=params,
             )
+            if self.request.json().get('data'):
+                return True
+        return False
 
-            # reset some vars
-            params = {}
+    def iterate(
+        self,
+        base_class: Any,
+        api_endpoint: str | None = None,
+        params: dict | None = None,
+        result_type: str | None = None,
+    ) -> Generator:
+        """Iterate over CM/TI objects.
 
-            response = self.request.json()
-            data = response.get('data', [])
-            url = response.pop('next', None)
+        By default pages are retrieved one at a time, following the "next" link of each page.
 
-            for result in data:
-                yield base_class(session=self._session, **result)  # type: ignore
+        * prefetch - When set, a background thread retrieves up to this number of pages ahead
+          while the current page is consumed.
+        * page_workers - When set, the total count is retrieved and pages of page_size results
+          are retrieved in parallel by this number of threads using resultStart. Results can be
+          missed or duplicated if the collection changes during iteration, so this mode is best
+          suited to exports of data that is not being modified.
 
-            # break out of pagination if no next url present in results
-            if not url:
-                break
+        The result_type (defaults to the result_type property) controls what is yielded for
+        each result. Building the object and its model dominates the runtime of large exports,
+        so the read-only types skip or defer it.
+
+        * object - The CM/TI object (e.g., Indicator).
+        * dict - The raw API result.
+        * record - An ObjectRecord that provides the raw API result and builds the CM/TI
+          object on first attribute access.
+
+        .. code-block:: python
+
+            indicators = tcex.api.tc.v3.indicators()
+            indicators.page_size = 1_000
+            indicators.page_workers = 4
+            for indicator in indicators:
+                ...
+        """
+        result_type = result_type or self.result_type
+        if result_type not in self._result_types:
+            raise RuntimeError(
+                f'Invalid result type: {result_type} provided '
+                f'(valid types: {", ".join(sorted(self._result_types))}).'
+            )
+        return self._iterate(base_class, api_endpoint, params, result_type)
 
     @property
     def params(self) -> dict:
@@ -231,14 +525,10 @@ class ObjectCollectionABC(ABC):
         """Set the timeout of the case management object collection."""
         self._timeout = timeout
 
-    @cached_property
+    @property
     def tql_options(self):
-        """Return TQL data keywords."""
-        _data = []
-        r = self._session.options(f'{self._api_endpoint}/tql', params={})
-        if r.ok:
-            _data = r.json()['data']
-        return _data
+        """Return TQL data keywords (cached for all collections)."""
+        return metadata_cache.get(self._session, self._api_endpoint, 'tql_options')
 
     @property
     def tql_keywords(self):
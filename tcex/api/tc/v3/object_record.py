@@ -0,0 +1,77 @@
+"""TcEx Framework Module"""
+
+# standard library
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# third-party
+from requests import Session  # TYPE-CHECKING
+
+
+class ObjectRecord(Mapping):
+    """Lightweight Read-Only View of a CM/TI Object
+
+    The record wraps the raw API result and only builds the object (and its pydantic model)
+    the first time an object attribute is accessed. Raw field values are available without
+    building the object using item access (e.g., record['summary']).
+
+    The record is a Mapping of the raw fields, so the Mapping methods (get, items, keys, and
+    values) return raw field values and are not delegated to the object. Use the object
+    property for object methods with the same name (e.g., record.object.get()).
+
+    .. code-block:: python
+
+        for record in tcex.api.tc.v3.indicators().as_records():
+            if record.get('rating', 0) > 3:
+                record.model.tags  # the Indicator object is built on first attribute access
+                record.object.get(params={'fields': ['tags']})  # Indicator.get()
+
+    Args:
+        base_class: The CM/TI object class (e.g., Indicator) to build on first access.
+        session: An configured instance of request.Session with TC API Auth.
+        data: The raw API result for the object.
+    """
+
+    __slots__ = ('_base_class', '_data', '_object', '_session')
+
+    def __init__(self, base_class: Any, session: Session, data: dict):
+        """Initialize instance properties."""
+        self._base_class = base_class
+        self._data = data
+        self._object = None
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute from the object, building the object on first access."""
+        if name.startswith('__'):
+            # prevent building the object for protocol lookups (e.g., copy or pickle)
+            raise AttributeError(name)
+        return getattr(self.object, name)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the raw field value."""
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the raw field names."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of raw fields."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Return the representation of the record."""
+        return f'{self.__class__.__name__}({self._base_class.__name__}, {self._data!r})'
+
+    @property
+    def data(self) -> dict:
+        """Return the raw API result."""
+        return self._data
+
+    @property
+    def object(self) -> Any:
+        """Return the CM/TI object, building it on first access."""
+        if self._object is None:
+            self._object = self._base_class(session=self._session, **self._data)
+        return self._object
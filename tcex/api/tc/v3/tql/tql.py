@@ -3,6 +3,8 @@
 # standard library
 from datetime import datetime
 from enum import Enum
+from typing import cast
+from urllib.parse import quote_plus
 
 # third-party
 from arrow import Arrow
@@ -13,36 +15,142 @@ from tcex.api.tc.v3.tql.tql_type import TqlType
 
 
 class Tql:
-    """ThreatConnect TQL"""
+    """ThreatConnect TQL
+
+    The TQL string is rendered once and cached until a filter (or a nested filter) is added.
+    When the URL encoded TQL string is longer than max_length, the largest "in" list of a
+    single-valued keyword can be split over multiple TQL strings (see as_str_chunks).
+    """
+
+    # keywords (without underscores, lower case) that have a single value per object. an object
+    # matches at most one chunk of an "in" list on these keywords, so the results of the chunks
+    # don't overlap. multi-valued keywords (e.g., tag or hasGroup) are never chunked.
+    chunk_keywords = frozenset(
+        [
+            'caseid',
+            'id',
+            'name',
+            'owner',
+            'ownername',
+            'summary',
+            'type',
+            'typename',
+            'value1',
+            'value2',
+            'value3',
+            'xid',
+        ]
+    )
+
+    # the max URL encoded length of a TQL string before a large "in" list is chunked
+    max_length = 6_000
 
     def __init__(self):
         """Initialize instance properties"""
         self._filters = []
+        self._rendered: tuple[tuple, str] | None = None
+        self._version = 0
         self.raw_tql = None
 
+    def _cache_key(self) -> tuple:
+        """Return a key that changes when this TQL or any nested TQL changes."""
+        return (
+            self._version,
+            len(self._filters),
+            tuple(
+                tql_filter['value']._tql._cache_key()
+                for tql_filter in self._filters
+                if isinstance(tql_filter['value'], FilterABC)
+            ),
+        )
+
+    @staticmethod
+    def _format_value(value: int | float | list | str | Arrow | datetime, type_: TqlType | None):
+        """Return the TQL formatted value."""
+        if isinstance(value, list):
+            if type_ in (TqlType.FLOAT, TqlType.INTEGER):
+                value = [str(int_) for int_ in value]
+            elif type_ == TqlType.STRING:
+                value = [f'"{str(str_)}"' for str_ in value]
+            value = ','.join(value)
+            return f'({value})'
+
+        if type_ == TqlType.STRING:
+            return f'"{value}"'
+        return value
+
+    def _render_filter(self, tql_filter: dict, value: list | None = None) -> str:
+        """Return the TQL string for a single filter, optionally overriding the value."""
+        # keywords are all one work (e.g. task_id should be taskid)
+        keyword = tql_filter['keyword'].replace('_', '')
+        value_ = tql_filter['value'] if value is None else value
+        if isinstance(value_, FilterABC):
+            return f'''{keyword}({value_._tql.as_str})'''
+
+        formatted = self._format_value(value_, tql_filter.get('type'))
+        return f'''{keyword} {tql_filter['operator'].value} {formatted}'''
+
     @property
     def as_str(self):
         """Convert the TQL obj to a string"""
-        filters = []
-        for tql_filter in self.filters:
-            # keywords are all one work (e.g. task_id should be taskid)
-            keyword = tql_filter['keyword'].replace('_', '')
-            value = tql_filter['value']
-            try:
-                filters.append(f'''{keyword}({value._tql.as_str})''')
-            except Exception:
-                if isinstance(value, list):
-                    if tql_filter.get('type') in (TqlType.FLOAT, TqlType.INTEGER):
-                        value = [str(int_) for int_ in value]
-                    elif tql_filter.get('type') == TqlType.STRING:
-                        value = [f'"{str(str_)}"' for str_ in value]
-                    value = ','.join(value)
-                    value = f'({value})'
-                elif tql_filter.get('type') == TqlType.STRING:
-                    value = f'"{value}"'
-                filters.append(f'''{keyword} {tql_filter['operator'].value} {value}''')
-
-        return ' and '.join(filters)
+        cache_key = self._cache_key()
+        if self._rendered is None or self._rendered[0] != cache_key:
+            tql = ' and '.join(self._render_filter(tql_filter) for tql_filter in self.filters)
+            self._rendered = (cache_key, tql)
+        return self._rendered[1]
+
+    def as_str_chunks(self, max_length: int | None = None) -> list[str]:
+        """Return the TQL as one or more strings that do not exceed max_length.
+
+        When the URL encoded TQL is too long, the values of the largest top level "in" list on a
+        single-valued keyword (see chunk_keywords) are deduplicated and split over multiple TQL
+        strings, each including all other filters. Each object matches at most one string, so
+        the results (and counts) of the strings can be combined. A raw TQL string or TQL
+        without an "in" list on a single-valued keyword is always returned as a single string.
+
+        Args:
+            max_length: The max URL encoded length, defaults to the max_length property.
+        """
+        max_length = max_length or self.max_length
+        tql = self.raw_tql or self.as_str
+        if self.raw_tql or len(quote_plus(tql)) <= max_length:
+            return [tql]
+
+        in_filters = [
+            tql_filter
+            for tql_filter in self.filters
+            if isinstance(tql_filter['value'], list)
+            and getattr(tql_filter['operator'], 'value', tql_filter['operator']) == 'IN'
+            and tql_filter['keyword'].replace('_', '').lower() in self.chunk_keywords
+        ]
+        if not in_filters:
+            return [tql]
+
+        chunk_filter = max(in_filters, key=lambda f: len(f['value']))
+        chunk_values = cast(list, chunk_filter['value'])
+        type_ = chunk_filter.get('type')
+
+        def render(values: list) -> str:
+            """Return the TQL string using the provided values for the chunked filter."""
+            return ' and '.join(
+                self._render_filter(f, values if f is chunk_filter else None) for f in self.filters
+            )
+
+        # the length of the TQL string without any values and of a single value with delimiter
+        base_length = len(quote_plus(render([])))
+        delimiter_length = len(quote_plus(','))
+
+        chunks, values, length = [], [], base_length
+        for value in dict.fromkeys(chunk_values):
+            value_length = len(quote_plus(str(self._format_value([value], type_))[1:-1]))
+            if values and length + value_length + delimiter_length > max_length:
+                chunks.append(render(values))
+                values, length = [], base_length
+            values.append(value)
+            length += value_length + delimiter_length
+        if values:
+            chunks.append(render(values))
+        return chunks
 
     @property
     def filters(self) -> list[dict]:
@@ -53,6 +161,7 @@ class Tql:
     def filters(self, filters: list[dict]):
         """Set the filters"""
         self._filters = filters
+        self._version += 1
 
     def add_filter(
         self,
@@ -63,15 +172,20 @@ class Tql:
     ):
         """Add a filter to the current obj
 
+        Filters that are identical to an existing filter are ignored.
+
         Args:
             keyword: the field to search on
             operator: the operator to use
             value: the value to compare
             type_: How to treat the value (defaults to String)
         """
-        self.filters.append(
-            {'keyword': keyword, 'operator': operator, 'value': value, 'type': type_}
-        )
+        tql_filter = {'keyword': keyword, 'operator': operator, 'value': value, 'type': type_}
+        if tql_filter in self.filters:
+            return
+
+        self.filters.append(tql_filter)
+        self._version += 1
 
     def set_raw_tql(self, tql: str):
         """Set a raw TQL filter"""
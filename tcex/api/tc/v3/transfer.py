@@ -0,0 +1,121 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+from collections.abc import Callable, Generator, Iterable
+from typing import BinaryIO
+
+# third-party
+from requests.utils import super_len
+
+
+class Transfer:
+    """Progress and Hash Tracking for a Streamed Upload or Download
+
+    Each chunk is counted and added to the requested hashes as it is sent or received, so
+    the content is never held in memory as a whole. The progress callback is called with the
+    number of bytes transferred and the total number of bytes (None if not known).
+
+    .. code-block:: python
+
+        transfer = Transfer(progress=lambda done, total: ..., hash_algorithms=['sha256'])
+        document.download_to('/tmp/sample.bin', transfer=transfer)
+        print(transfer.hashes['sha256'])
+
+    Args:
+        progress: The optional callback called after each chunk.
+        hash_algorithms: The hashlib algorithms (e.g., md5, sha1, sha256) to compute.
+    """
+
+    def __init__(
+        self,
+        progress: Callable[[int, int | None], None] | None = None,
+        hash_algorithms: Iterable[str] | None = None,
+    ):
+        """Initialize instance properties."""
+        self.progress = progress
+
+        # properties
+        self._hashes = {algorithm: hashlib.new(algorithm) for algorithm in hash_algorithms or []}
+        self.bytes = 0
+        self.total: int | None = None
+
+    @property
+    def hashes(self) -> dict[str, str]:
+        """Return the hex digest of the content transferred so far for each algorithm."""
+        return {algorithm: hash_.hexdigest() for algorithm, hash_ in self._hashes.items()}
+
+    def iter_chunks(
+        self, content: bytes | str | BinaryIO | Iterable[bytes], chunk_size: int
+    ) -> Generator[bytes, None, None]:
+        """Yield the content in chunks, updating the transfer for each chunk.
+
+        Args:
+            content: The content as bytes, a string, a binary file object, or an iterable.
+            chunk_size: The max size of each chunk read from bytes or a file object.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+
+        if isinstance(content, bytes):
+            chunks = (content[i : i + chunk_size] for i in range(0, len(content), chunk_size))
+        elif hasattr(content, 'read'):
+            chunks = iter(lambda: content.read(chunk_size), b'')  # type: ignore
+        else:
+            chunks = iter(content)  # type: ignore
+
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+    def update(self, chunk: bytes):
+        """Count the chunk, add it to the hashes, and report progress."""
+        self.bytes += len(chunk)
+        for hash_ in self._hashes.values():
+            hash_.update(chunk)
+        if self.progress is not None:
+            self.progress(self.bytes, self.total)
+
+
+class UploadBody:
+    """Iterable Upload Body
+
+    The requests library sends an iterable body using chunked transfer encoding unless the
+    body has a length, so the length is provided when it is known (bytes, strings, and files).
+
+    Args:
+        content: The content as bytes, a string, a binary file object, or an iterable.
+        transfer: The transfer that tracks the progress and hashes of the upload.
+        chunk_size: The max size of each chunk read from bytes or a file object.
+    """
+
+    def __init__(
+        self,
+        content: bytes | str | BinaryIO | Iterable[bytes],
+        transfer: Transfer,
+        chunk_size: int = 1_048_576,
+    ):
+        """Initialize instance properties."""
+        if isinstance(content, str):
+            content = content.encode()
+
+        self.chunk_size = chunk_size
+        self.content = content
+        self.transfer = transfer
+        if isinstance(content, bytes) or hasattr(content, 'read'):
+            self.transfer.total = super_len(content)
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        """Yield the chunks of the content."""
+        yield from self.transfer.iter_chunks(self.content, self.chunk_size)
+
+    def __len__(self) -> int:
+        """Return the length of the content."""
+        return self.transfer.total or 0
+
+    @property
+    def body(self) -> Iterable[bytes]:
+        """Return the body for the request, a generator is sent with chunked encoding."""
+        if self.transfer.total is None:
+            return iter(self)
+        return self
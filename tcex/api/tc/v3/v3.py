@@ -1,9 +1,12 @@
 """TcEx Framework Module"""
 
 # first-party
+from tcex.api.tc.v3.association_loader import AssociationLoader
 from tcex.api.tc.v3.attribute_types.attribute_type import AttributeType, AttributeTypes
+from tcex.api.tc.v3.bulk_executor import BulkExecutor
 from tcex.api.tc.v3.case_management.case_management import CaseManagement
 from tcex.api.tc.v3.intel_requirement.ir import IR
+from tcex.api.tc.v3.metadata_cache import MetadataCache, metadata_cache
 from tcex.api.tc.v3.security.security import Security
 from tcex.api.tc.v3.threat_intelligence.threat_intelligence import ThreatIntelligence
 from tcex.pleb.cached_property import cached_property
@@ -16,6 +19,17 @@ class V3(CaseManagement, Security, ThreatIntelligence, IR):
         session: An configured instance of request.Session with TC API Auth.
     """
 
+    def association_loader(
+        self, cache_size: int = 1_024, chunk_size: int = 100
+    ) -> AssociationLoader:
+        """Return a instance of Association Loader object.
+
+        Args:
+            cache_size: The max number of parent associations held in the cache.
+            chunk_size: The max number of parents included in a single request.
+        """
+        return AssociationLoader(self.session, cache_size, chunk_size)
+
     def attribute_type(self, **kwargs) -> AttributeType:
         """Return a instance of Attribute Types object."""
         return AttributeType(session=self.session, **kwargs)
@@ -24,6 +38,18 @@ class V3(CaseManagement, Security, ThreatIntelligence, IR):
         """Return a instance of Attribute Types object."""
         return AttributeTypes(session=self.session, **kwargs)
 
+    def bulk(
+        self, max_workers: int = 8, rate_limit: float | None = None, update_model: bool = True
+    ) -> BulkExecutor:
+        """Return a instance of Bulk Executor object.
+
+        Args:
+            max_workers: The max number of concurrent requests.
+            rate_limit: The max number of requests per second per API endpoint.
+            update_model: If True, the model of each object is updated from the response.
+        """
+        return BulkExecutor(self.session, max_workers, rate_limit, update_model)
+
     @cached_property
     def cm(self) -> CaseManagement:
         """Return Case Management API collection."""
@@ -34,6 +60,11 @@ class V3(CaseManagement, Security, ThreatIntelligence, IR):
         """Return Intel Requirement API collection."""
         return IR(self.session)
 
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        """Return the API metadata cache shared by all objects and collections."""
+        return metadata_cache
+
     @cached_property
     def security(self) -> Security:
         """Return Security API collection."""
@@ -11,6 +11,7 @@ from typing import Any, Self
 
 # third-party
 from pydantic.v1 import BaseModel, PrivateAttr
+from pydantic.v1.fields import SHAPE_SINGLETON, ModelField, Undefined
 
 # first-party
 from tcex.logger.trace_logger import TraceLogger
@@ -19,6 +20,9 @@ from tcex.logger.trace_logger import TraceLogger
 
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
+# field descriptors keyed by model class, built on first use by V3ModelABC._field_descriptors
+_field_descriptors: dict[type, dict[str, dict]] = {}
+
 
 class CustomJSONEncoder(JSONEncoder):
     """Format object in JSON data."""
@@ -40,9 +44,9 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
-    _dict_hash: str = PrivateAttr()
     _log = _logger
     _shared_type = PrivateAttr(False)
+    _snapshot: dict[str, tuple] = PrivateAttr(default_factory=dict)
     _staged = PrivateAttr(False)
     id: int | None = None
 
@@ -63,8 +67,67 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         ):
             self._staged = True
 
-        # store initial dict hash of model
-        self._dict_hash = self.gen_model_hash(self.json(sort_keys=True))
+        # field assignments are snapshot in __setattr__, but in place changes (e.g., appending to
+        # a list or updating a nested container model) require a shallow snapshot of the field
+        for name, value in self.__dict__.items():
+            if value is None:
+                continue
+            if isinstance(value, dict | list) or self._is_container_model(value):
+                self._snapshot[name] = self._snapshot_value(value)
+
+    def __setattr__(self, name: str, value: Any):
+        """Set the attribute value, taking a snapshot of the field value on first assignment."""
+        if name in self.__fields__ and name not in self._snapshot:
+            self._snapshot[name] = self._snapshot_value(self.__dict__.get(name))
+        super().__setattr__(name, value)
+
+    @staticmethod
+    def _is_container_model(value: Any) -> bool:
+        """Return True if value is a nested model that does not track changes (e.g., TagsModel)."""
+        return isinstance(value, BaseModel) and not isinstance(value, V3ModelABC)
+
+    @classmethod
+    def _snapshot_value(cls, value: Any) -> tuple:
+        """Return the value and a shallow copy of its contents."""
+        if isinstance(value, list):
+            return value, list(value)
+        if isinstance(value, dict):
+            return value, dict(value)
+        if cls._is_container_model(value):
+            return value, {n: cls._snapshot_value(v) for n, v in value.__dict__.items()}
+        return value, None
+
+    @staticmethod
+    def _model_updated(value: Any) -> bool:
+        """Return True if the value is a nested model that has been updated."""
+        return isinstance(value, V3ModelABC) and value.updated
+
+    @classmethod
+    def _value_updated(cls, value: Any, snapshot: tuple) -> bool:
+        """Return True if the value has changed since the snapshot was taken."""
+        original, copy = snapshot
+        if original is not value and original != value:
+            return True
+
+        if isinstance(value, dict):
+            items = list(value.values())
+            if len(copy) != len(value) or any(
+                copy.get(k, Undefined) is not v and copy.get(k, Undefined) != v
+                for k, v in value.items()
+            ):
+                return True
+        elif isinstance(value, list):
+            items = value
+            if len(copy) != len(value) or any(a is not b and a != b for a, b in zip(copy, value)):
+                return True
+        elif cls._is_container_model(value):
+            return value.__dict__.keys() != copy.keys() or any(
+                cls._value_updated(v, copy[n]) for n, v in value.__dict__.items()
+            )
+        else:
+            items = [value]
+
+        return any(cls._model_updated(item) for item in items)
 
     def _calculate_field_inclusion(
         self, field: str, method: str, mode: str | None, nested: bool, property_: dict, value: Any
@@ -297,7 +360,7 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
               are create using **kwargs they are not updated.
         """
         _data = []
-        for model in nested_object.data:  # type: ignore
+        for model in nested_object.data or []:  # type: ignore
             if self._calculate_nested_inclusion(method, mode, model):
                 data = model.gen_body(method, mode, nested=True)
                 if data:
@@ -322,6 +385,58 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                 return data
         return None
 
+    @staticmethod
+    def _field_descriptor(field: ModelField) -> dict:
+        """Return the descriptor for a single model field.
+
+        The title, methods, and read_only values match the properties in the model schema. For
+        writable nested models the kind of nesting is resolved from the field type:
+
+        * array -> the nested model "data" field contains a list of models (e.g., TagsModel).
+        * object -> the nested model "data" field contains a model (e.g., AssigneeModel).
+        * model -> the field contains a model (e.g., CaseModel -> workflowTemplate field).
+        """
+        descriptor = {
+            'methods': field.field_info.extra.get('methods', []),
+            'mode_support': False,
+            'nested': None,
+            'read_only': field.field_info.extra.get('read_only'),
+            'title': field.field_info.title or field.alias.title().replace('_', ' '),
+        }
+
+        type_ = field.type_
+        if (
+            descriptor['read_only'] is False
+            and field.shape == SHAPE_SINGLETON
+            and isinstance(type_, type)
+            and issubclass(type_, BaseModel)
+        ):
+            data_field = type_.__fields__.get('data')
+            if data_field is None:
+                descriptor['nested'] = 'model'
+            elif data_field.shape != SHAPE_SINGLETON:
+                descriptor['nested'] = 'array'
+                mode_support = type_.__private_attributes__.get('_mode_support')
+                descriptor['mode_support'] = bool(getattr(mode_support, 'default', False))
+            else:
+                descriptor['nested'] = 'object'
+        return descriptor
+
+    @classmethod
+    def _field_descriptors(cls) -> dict[str, dict]:
+        """Return the field descriptors for the model class, keyed on field name.
+
+        Generating the model schema is expensive, so the descriptors used by gen_body are built
+        once per model class from the field definitions and reused for every instance.
+        """
+        descriptors = _field_descriptors.get(cls)
+        if descriptors is None:
+            descriptors = {
+                name: cls._field_descriptor(field) for name, field in cls.__fields__.items()
+            }
+            _field_descriptors[cls] = descriptors
+        return descriptors
+
     def _properties(self) -> dict[str, dict[str, str]]:
         """Return properties of the current model."""
         schema = self.schema(by_alias=False)
@@ -352,13 +467,14 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         but should be added for a PUT on a nested object.
         """
         _body = {}
-        schema_properties = self._properties()
+        descriptors = self._field_descriptors()
         for name, value in self:
             if exclude_none is True and value is None:
                 continue
 
-            # get the current field from the schema to us in validating method membership.
-            if schema_properties.get(name) is None:
+            # get the current field descriptor to use in validating method membership.
+            descriptor = descriptors.get(name)
+            if descriptor is None:
                 # a field not being available does not indicate a failure, it could simple
                 # be the incorrect field was passed to the object, which will be dropped.
                 self._log.warning(
@@ -367,25 +483,25 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                 )
                 continue
 
-            property_ = schema_properties.get(name, {})
-            key = property_['title']
-            if isinstance(value, BaseModel) and property_.get('read_only') is False:
+            key = descriptor['title']
+            nested_kind = descriptor['nested']
+            if nested_kind is not None and isinstance(value, BaseModel):
                 value: Self  # type: ignore
                 # Handle nested model that should be included in the body (non-read-only).
 
-                if hasattr(value, 'data') and isinstance(value.data, list):  # type: ignore
+                if nested_kind == 'array':
                     # Handle nested object types where the "data" field contains an array of model.
                     _data = self._process_nested_data_array(method, mode, value)  # type: ignore
                     if _data:
                         _body.setdefault(key, {})['data'] = _data
 
                         # value as a model can be ArtifactTypeModel, ArtifactModel, etc.
-                        if value._mode_support:  # type: ignore
+                        if descriptor['mode_support']:
                             # Use the default mode defined in the model ("append") or the
                             # mode passed into this method as an override.
                             _body.setdefault(key, {})['mode'] = mode or value.mode  # type: ignore
 
-                elif hasattr(value, 'data'):
+                elif nested_kind == 'object':
                     # Handle "non-standard" condition for Assignee where the nested "data"
                     # field contains an object instead of an Array.
                     _data = self._process_nested_data_object(method, mode, value)  # type: ignore
@@ -405,7 +521,7 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                         if _data:
                             _body[key] = _data
 
-            elif self._calculate_field_inclusion(key, method, mode, nested, property_, value):
+            elif self._calculate_field_inclusion(key, method, mode, nested, descriptor, value):
                 # Handle non-nested fields and their values based on well defined rules.
                 if value and isinstance(value, list) and isinstance(value[0], BaseModel):
                     value: list[Self]
@@ -442,6 +558,19 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         )
 
     @property
-    def updated(self):
-        """Return True if model values have changed, else False."""
-        return self._dict_hash != self.gen_model_hash(self.json(sort_keys=True))
+    def updated(self) -> bool:
+        """Return True if model values have changed, else False.
+
+        Assigned fields, list/dict fields, and nested container models (e.g., TagsModel) are
+        compared to the shallow snapshot taken on first assignment or creation, so assigning an
+        unchanged value is not an update. Nested models are checked recursively. The model is
+        never serialized.
+        """
+        for name, value in self.__dict__.items():
+            snapshot = self._snapshot.get(name)
+            if snapshot is not None:
+                if self._value_updated(value, snapshot):
+                    return True
+            elif self._model_updated(value):
+                return True
+        return False
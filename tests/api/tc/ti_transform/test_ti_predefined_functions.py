@@ -0,0 +1,123 @@
+"""TcEx Framework Module"""
+
+# standard library
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.ti_transform import ProcessingFunctions, TiTransforms, transform_builder_to_model
+
+
+@pytest.mark.parametrize(
+    'name,kwargs,values',
+    [
+        ('append', {'suffix': '-x'}, ['a', 'b']),
+        ('hash', {}, ['a', 1]),
+        ('prepend', {'prefix': 'x-'}, ['a', 'b']),
+        ('remove_surrounding_whitespace', {}, [' a ', 'b ']),
+        ('replace', {'old_value': 'a', 'new_value': 'b'}, ['aaa', 'cab']),
+        ('split', {'delimiter': ';'}, ['a; b', 'c']),
+        ('static_map', {'mapping': '{"high": "5", "1": "one"}'}, ['high', 'low', 1]),
+        ('static_map', {'mapping': {'High': '5'}}, ['High', 'high']),
+        ('to_lowercase', {}, ['A', 'b']),
+        ('to_titlecase', {}, ['foo bar', 'b']),
+        ('to_uppercase', {}, ['a', 'B']),
+        ('uuid5', {}, ['example.com', 'foo']),
+        ('value_in', {'values': 'a, b ,c'}, ['a', 'b', 'd', ['a']]),
+        ('value_in', {'values': 'a|b', 'delimiter': '|'}, ['a', 'a|b']),
+    ],
+)
+def test_processing_functions_batch_fn(name: str, kwargs: dict, values: list):
+    """Test the batch and parsed variants of each function return the same results."""
+    processing_functions = ProcessingFunctions(None)
+    fn = getattr(processing_functions, name)
+    batch_fn = processing_functions.batch_fn(fn, kwargs)
+    assert batch_fn is not None
+    assert batch_fn(values) == [fn(value, **kwargs) for value in values]
+
+    parsed_fn = processing_functions.parsed_fn(fn, kwargs)
+    assert parsed_fn is not None
+    assert [parsed_fn(value) for value in values] == [fn(value, **kwargs) for value in values]
+
+
+def test_processing_functions_batch_fn_unsupported():
+    """Test functions without a batch variant and batch_fn are handled."""
+    processing_functions = ProcessingFunctions(None)
+    assert processing_functions.batch_fn(processing_functions.custom) is None
+    assert processing_functions.batch_fn(str.lower) is None
+    assert processing_functions.parsed_fn(processing_functions.custom) is None
+
+    names = [d['name'] for d in processing_functions.get_function_definitions()]
+    assert 'batch_fn' not in names and 'parsed_fn' not in names
+    assert not [name for name in names if name.startswith('_')]
+
+
+def test_processing_functions_batch_convert_to_mitre_tag(monkeypatch: pytest.MonkeyPatch):
+    """Test the MITRE tag cache is bounded and unhashable values are not cached."""
+    tcex = MagicMock()
+    tcex.api.tc.v3.mitre_tags.get_by_id_regex.side_effect = lambda value, default: f'tag-{value}'
+    get_by_id_regex = tcex.api.tc.v3.mitre_tags.get_by_id_regex
+    processing_functions = ProcessingFunctions(tcex)
+    monkeypatch.setattr(processing_functions, '_parsed_cache_size', 2)
+    batch_fn = processing_functions.batch_fn(processing_functions.convert_to_MITRE_tag)
+    assert batch_fn is not None
+
+    assert batch_fn(['T1', 'T1', 'T2']) == ['tag-T1', 'tag-T1', 'tag-T2']
+    assert get_by_id_regex.call_count == 2
+
+    # the full cache is cleared before T3 is cached
+    assert batch_fn(['T3', 'T1']) == ['tag-T3', 'tag-T1']
+    assert get_by_id_regex.call_count == 4
+
+    assert batch_fn([['T1'], ['T1']]) == ["tag-['T1']", "tag-['T1']"]
+    assert get_by_id_regex.call_count == 6
+
+
+def test_processing_functions_ti_transforms():
+    """Test TiTransforms uses the parsed variant of the predefined functions."""
+    processing_functions = ProcessingFunctions(None)
+    transform = transform_builder_to_model(
+        {
+            'type': 'indicator',
+            'transform': {
+                'value1': {'path': 'indicator'},
+                'type': {'path': 'type'},
+                'rating': {
+                    'path': 'severity',
+                    'transform': [
+                        {'method': 'static_map', 'kwargs': {'mapping': '{"high": 5, "low": 1}'}}
+                    ],
+                },
+                'tags': [
+                    {
+                        'value': {
+                            'path': 'labels',
+                            'transform': [
+                                {'for_each': 'value_in', 'kwargs': {'values': 'apt, bad'}},
+                                {'for_each': 'to_uppercase'},
+                            ],
+                        }
+                    }
+                ],
+            },
+        },
+        processing_functions,
+    )
+    ti_transforms = TiTransforms(
+        [
+            {'indicator': '1.1.1.1', 'labels': ['apt', 'good', 'bad'], 'severity': 'high'},
+            {'indicator': '2.2.2.2', 'labels': ['good'], 'severity': 'low'},
+        ],
+        [transform],
+    )
+    for ti_dict in ti_transforms.ti_dicts:
+        ti_dict['type'] = 'Address'
+
+    assert len(ti_transforms.plan._parsed_fns) == 3
+    indicators = ti_transforms.batch['indicator']
+    assert indicators[0]['rating'] == 5.0
+    assert indicators[0]['tag'] == [{'name': 'APT'}, {'name': 'BAD'}]
+    assert indicators[1]['rating'] == 1.0
+    assert 'tag' not in indicators[1]
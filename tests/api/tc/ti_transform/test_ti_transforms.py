@@ -0,0 +1,136 @@
+"""TcEx Framework Module"""
+
+# standard library
+import os
+import time
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.ti_transform import TiTransforms, TransformException
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+from tcex.api.tc.ti_transform.transform_abc import _format_datetime
+from tcex.util.datetime_operation import DatetimeOperation
+
+
+def _ti_dicts(count: int):
+    """Yield TI dicts."""
+    for i in range(count):
+        yield {'indicator': f'1.1.1.{i}', 'labels': ['bad', 'worse'], 'type': 'Address'}
+
+
+def _transform() -> IndicatorTransformModel:
+    """Return an indicator transform with a lambda (not picklable) callable."""
+    return IndicatorTransformModel(
+        **{
+            'value1': {'path': 'indicator'},
+            'type': {'path': 'type'},
+            'tags': [
+                {'value': {'path': 'labels[]', 'transform': {'for_each': lambda v: v.title()}}}
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize('processes', [0, 2])
+def test_ti_transforms_stream(processes: int):
+    """Test the streamed batch data matches the batch data."""
+    transforms = TiTransforms(list(_ti_dicts(25)), [_transform()])
+    batch = transforms.batch
+
+    chunks = list(transforms.stream(_ti_dicts(25), chunk_size=10, processes=processes))
+    assert [len(chunk['indicator']) for chunk in chunks] == [10, 10, 5]
+    assert [i for chunk in chunks for i in chunk['indicator']] == batch['indicator']
+    assert chunks[0]['indicator'][0]['tag'] == [{'name': 'Bad'}, {'name': 'Worse'}]
+
+
+def test_ti_transforms_stream_error():
+    """Test transform errors are raised from a worker process."""
+    transforms = TiTransforms([], [_transform()], raise_exceptions=True)
+    ti_dicts = [{'indicator': '1.1.1.1', 'labels': [1], 'type': 'Address'}]
+    with pytest.raises(TransformException, match='Tags'):
+        list(transforms.stream(ti_dicts, processes=1))
+
+
+def _datetime_transform() -> IndicatorTransformModel:
+    """Return an indicator transform with all datetime fields."""
+    return IndicatorTransformModel(
+        **{
+            'value1': {'path': 'indicator'},
+            'type': {'default': 'Address'},
+            'date_added': {'path': 'created'},
+            'external_date_added': {'path': 'created'},
+            'external_date_expires': {'path': 'expires'},
+            'external_last_modified': {'path': 'modified'},
+            'first_seen': {'path': 'first_seen'},
+            'last_modified': {'path': 'modified'},
+            'last_seen': {'path': 'last_seen'},
+        }
+    )
+
+
+def test_ti_transforms_datetime():
+    """Test each datetime field is processed from its own path."""
+    ti_dict = {
+        'created': 1_700_000_000,
+        'expires': '2030-01-01T00:00:00Z',
+        'first_seen': 'Jan 12 2002',
+        'indicator': '1.1.1.1',
+        'last_seen': '2024-02-03T04:05:06+00:00',
+        'modified': '2024-01-01',
+    }
+    indicator = TiTransforms([ti_dict], [_datetime_transform()]).batch['indicator'][0]
+    assert indicator['dateAdded'] == '2023-11-14T22:13:20Z'
+    assert indicator['externalDateExpires'] == '2030-01-01T00:00:00Z'
+    assert indicator['firstSeen'] == '2002-01-12T00:00:00Z'
+    assert indicator['lastModified'] == '2024-01-01T00:00:00Z'
+    assert indicator['lastSeen'] == '2024-02-03T04:05:06Z'
+
+    # relative datetime expressions are not cached
+    ti_dict['first_seen'] = 'now'
+    indicator = TiTransforms([ti_dict], [_datetime_transform()]).batch['indicator'][0]
+    assert indicator['firstSeen'] > '2024'
+
+    # only ISO 8601 and numeric epoch values are cached, others may depend on the current date
+    _format_datetime.cache_clear()
+    for value in ('2024', 'Monday 2024', 'Jan 12 2002', '2020-06-01', 1_600_000_000):
+        ti_dict['first_seen'] = value
+        assert TiTransforms([ti_dict], [_datetime_transform()]).batch['indicator']
+    # the 4 values of the other datetime fields and the 2 absolute first_seen values
+    assert _format_datetime.cache_info().currsize == 6
+
+
+@pytest.mark.skipif(not os.getenv('TCEX_BENCHMARK'), reason='set TCEX_BENCHMARK to run')
+def test_ti_transforms_datetime_benchmark():
+    """Benchmark the datetime stage on a date heavy feed with repeated timestamps."""
+    count = 5_000
+    timestamps = [
+        f'2024-01-{day:02d}T{hour:02d}:00:00Z' for day in range(1, 29) for hour in (0, 12)
+    ]
+    ti_dicts = [
+        {
+            'created': timestamps[i % len(timestamps)],
+            'expires': timestamps[(i + 1) % len(timestamps)],
+            'first_seen': timestamps[(i + 2) % len(timestamps)],
+            'indicator': f'1.1.{i // 256 % 256}.{i % 256}',
+            'last_seen': timestamps[(i + 3) % len(timestamps)],
+            'modified': timestamps[(i + 4) % len(timestamps)],
+        }
+        for i in range(count)
+    ]
+    transforms = TiTransforms([], [_datetime_transform()])
+
+    start = time.perf_counter()
+    indicators = [i for chunk in transforms.stream(ti_dicts) for i in chunk['indicator']]
+    seconds = time.perf_counter() - start
+
+    # the uncached parse is benchmarked on a sample as it is much slower
+    sample = [ti_dict['created'] for ti_dict in ti_dicts[: count // 10]] * 7
+    start = time.perf_counter()
+    expected = [DatetimeOperation.any_to_datetime(v).strftime('%Y-%m-%dT%H:%M:%SZ') for v in sample]
+    uncached_seconds = (time.perf_counter() - start) * 10
+
+    assert seconds < uncached_seconds
+    assert len(indicators) == count
+    assert [i['dateAdded'] for i in indicators[: count // 10]] == expected[: count // 10]
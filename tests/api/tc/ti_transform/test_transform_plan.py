@@ -0,0 +1,107 @@
+"""TcEx Framework Module"""
+
+# first-party
+from tcex.api.tc.ti_transform import TiTransform, TiTransforms
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
+
+
+def test_transform_plan_compile():
+    """Test the paths and callables of the transforms are compiled once."""
+    calls = []
+
+    def tag(value: str, ti_dict: dict) -> str:
+        """Return a tag including the TI type."""
+        calls.append(ti_dict)
+        return f'{ti_dict["type"]}: {value}'
+
+    transform = IndicatorTransformModel(
+        **{
+            'value1': {'path': 'indicator'},
+            'type': {'path': 'type'},
+            'tags': [{'value': {'path': 'labels[]', 'transform': {'for_each': tag}}}],
+            'attributes': [{'value': {'path': 'id'}, 'type': 'External ID'}],
+        }
+    )
+    plan = TransformPlan([transform])
+    assert set(plan._expressions) == {'indicator', 'type', 'labels[]', 'id'}
+    assert plan.callable_params(tag) == ('ti_dict',)
+    assert plan.callable_params(str) == ()
+
+    ti_dicts = [
+        {'id': i, 'indicator': f'1.1.1.{i}', 'labels': ['bad'], 'type': 'Address'} for i in range(3)
+    ]
+    transforms = TiTransforms(ti_dicts, [transform])
+    batch = transforms.batch
+    assert [t.plan for t in transforms.transformed_collection] == [transforms.plan] * 3
+    assert len(calls) == 3
+    assert batch['indicator'][0] == {
+        'attribute': [{'type': 'External ID', 'value': 0}],
+        'summary': '1.1.1.0',
+        'tag': [{'name': 'Address: bad'}],
+        'type': 'Address',
+    }
+
+
+def test_transform_plan_dispatch():
+    """Test transforms are selected by dispatch key before the applies callables."""
+    applies_calls = []
+
+    def _applies(ti_dict: dict) -> bool:
+        """Return True for URL indicators."""
+        applies_calls.append(ti_dict)
+        return ti_dict['kind'] == 'url'
+
+    def _transform(type_: str, **kwargs) -> IndicatorTransformModel:
+        """Return an indicator transform."""
+        return IndicatorTransformModel(
+            **{'value1': {'path': 'value'}, 'type': {'default': type_}}, **kwargs
+        )
+
+    transforms = [
+        _transform('Address', dispatch={'path': 'kind', 'values': ['ipv4', 'ipv6']}),
+        _transform('Host', dispatch={'path': 'kind', 'values': 'domain'}),
+        _transform('URL', applies=_applies),
+    ]
+    ti_dicts = [
+        {'kind': 'ipv4', 'value': '1.1.1.1'},
+        {'kind': 'domain', 'value': 'example.com'},
+        {'kind': 'ipv6', 'value': '::1'},
+        {'kind': 'url', 'value': 'https://example.com'},
+        {'kind': 'email', 'value': 'bad@example.com'},
+    ]
+    ti_transforms = TiTransforms(ti_dicts, transforms)
+    batch = ti_transforms.batch
+
+    assert [i['type'] for i in batch['indicator']] == ['Address', 'Host', 'Address', 'URL']
+    assert ti_transforms.plan.dispatch_hits == 3
+    assert ti_transforms.plan.dispatch_misses == 2
+    assert [ti_dict['kind'] for ti_dict in applies_calls] == ['url', 'email']
+
+
+def test_transform_plan_lazy():
+    """Test a single TiTransform compiles only what it uses on first use."""
+    transforms = [
+        IndicatorTransformModel(
+            **{
+                'value1': {'path': 'indicator'},
+                'type': {'default': 'Address'},
+                'tags': [
+                    {'value': {'path': 'labels[]', 'transform': {'for_each': str.title}}},
+                    {'value': {'path': 'unused'}},
+                ],
+                'applies': lambda ti_dict: ti_dict.get('kind') == 'ipv4',
+            }
+        ),
+        IndicatorTransformModel(
+            **{'value1': {'path': 'host'}, 'type': {'default': 'Host'}, 'applies': lambda _: True}
+        ),
+    ]
+    ti_transform = TiTransform(
+        {'indicator': '1.1.1.1', 'kind': 'ipv4', 'labels': ['bad']}, transforms
+    )
+    assert ti_transform.plan.lazy is True
+    assert not ti_transform.plan._expressions and not ti_transform.plan._parsed_fns
+
+    assert ti_transform.batch == {'summary': '1.1.1.1', 'tag': [{'name': 'Bad'}], 'type': 'Address'}
+    assert set(ti_transform.plan._expressions) == {'indicator', 'labels[]', 'unused'}
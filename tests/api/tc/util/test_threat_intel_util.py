@@ -0,0 +1,140 @@
+"""TcEx Framework Module"""
+
+# standard library
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.util.threat_intel_util import MULTI_VALUE_PATTERN, ThreatIntelUtil
+from tcex.api.tc.util.ti_catalog import TiCatalog, ti_catalog
+
+
+class TestThreatIntelUtil:
+    """Test the TcEx Threat Intel Util Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'indicator,expected',
+        [
+            ('1.1.1.1', ['1.1.1.1']),
+            ('hash1 : hash2', ['hash1', 'hash2', None]),
+            ('hash1 : hash2 : hash3', ['hash1', 'hash2', 'hash3']),
+            ('hash1 : : hash3', ['hash1', '', 'hash3']),
+            ('hash1 : ', ['hash1', '', '']),
+            ('value1 : value2 : value3 : value4', ['value1', 'value2', 'value3 : value4']),
+            # values containing colons use the multi-value pattern
+            ('https://example.com : value2', ['https://example.com', 'value2', None]),
+            ('value1 : c:\\file.exe : value3', ['value1', 'c:\\file.exe', 'value3']),
+        ],
+    )
+    def test_expand_indicators(indicator: str, expected: list):
+        """Test expanding multi-valued indicators."""
+        assert ThreatIntelUtil.expand_indicators(indicator) == expected
+        if ' : ' in indicator:
+            assert list(MULTI_VALUE_PATTERN.search(indicator).groups()) == expected
+
+    @staticmethod
+    def test_expand_indicators_bulk():
+        """Test expanding multi-valued indicators into columnar values."""
+        values = ThreatIntelUtil.expand_indicators_bulk(
+            ['1.1.1.1', 'hash1 : hash2', 'a:b : c : d : e']
+        )
+        assert values == {
+            'value1': ['1.1.1.1', 'hash1', 'a:b'],
+            'value2': [None, 'hash2', 'c'],
+            'value3': [None, None, 'd : e'],
+        }
+
+    @staticmethod
+    @pytest.mark.skipif(not os.getenv('TCEX_BENCHMARK'), reason='set TCEX_BENCHMARK to run')
+    def test_expand_indicators_benchmark():
+        """Benchmark expanding 1M file hash summaries."""
+        count = 1_000_000
+        summaries = [f'{i:032x} : {i:040x} : {i:064x}' for i in range(count)]
+
+        start = time.perf_counter()
+        values = ThreatIntelUtil.expand_indicators_bulk(summaries)
+        bulk_seconds = time.perf_counter() - start
+
+        # the multi-value pattern is benchmarked on a sample as it is much slower
+        sample = summaries[: count // 10]
+        start = time.perf_counter()
+        expected = [list(MULTI_VALUE_PATTERN.search(s).groups()) for s in sample]
+        pattern_seconds = (time.perf_counter() - start) * 10
+
+        assert bulk_seconds < pattern_seconds
+        assert len(values['value3']) == count
+        assert [
+            [v1, v2, v3]
+            for v1, v2, v3 in zip(
+                values['value1'][: len(sample)],
+                values['value2'][: len(sample)],
+                values['value3'][: len(sample)],
+            )
+        ] == expected
+
+    @staticmethod
+    def _session() -> MagicMock:
+        """Return a session that responds with the indicator type catalog."""
+        session = MagicMock()
+        session.base_url = 'https://pytest.threatconnect.com/api'
+        session.get.return_value.ok = True
+        session.get.return_value.status_code = 200
+        session.get.return_value.headers = {'ETag': '"v1"'}
+        session.get.return_value.json.return_value = {
+            'data': {'indicatorType': [{'name': 'Address'}, {'name': 'Host'}]},
+            'status': 'Success',
+        }
+        return session
+
+    def test_ti_catalog_shared(self):
+        """Test the type catalog is downloaded once for all instances."""
+        session = self._session()
+        ti_catalog.clear()
+
+        for _ in range(3):
+            assert ThreatIntelUtil(session).indicator_types == ['Address', 'Host']
+        assert session.get.call_count == 1
+
+    def test_ti_catalog_revalidate(self, tmp_path: Path):
+        """Test the cache is persisted and expired entries are revalidated with the ETag."""
+        session = self._session()
+        cache_file = str(tmp_path / 'ti-catalog.json')
+        data = TiCatalog(cache_file=cache_file).get(session, '/v2/types/indicatorTypes')
+
+        # a new catalog (e.g., the next App run) loads the file
+        catalog = TiCatalog(cache_file=cache_file)
+        assert catalog.get(session, '/v2/types/indicatorTypes') == data
+        assert session.get.call_count == 1
+
+        # entries with a ttl of 0 are expired and revalidated on the next request
+        catalog = TiCatalog(ttl=0)
+        catalog.get(session, '/v2/types/indicatorTypes')
+        session.get.return_value.status_code = 304
+        session.get.return_value.ok = False
+        assert catalog.get(session, '/v2/types/indicatorTypes') == data
+        assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert session.get.call_count == 3
+
+    def test_ti_catalog_resolve_variables(self):
+        """Test only type catalog variables are resolved from the shared catalog."""
+        session = self._session()
+        session.get.return_value.json.return_value = {
+            'data': [{'name': 'Owner', 'userName': 'user'}],
+            'status': 'Success',
+        }
+        ti_catalog.clear()
+
+        for _ in range(2):
+            assert ThreatIntelUtil(session).resolve_variables(['${ATTRIBUTES}']) == ['Owner']
+            assert ThreatIntelUtil(session).resolve_variables(['${OWNERS}', '${USERS}']) == [
+                'Owner',
+                'user',
+            ]
+        assert session.get.call_count == 5
+        assert not [key for key in ti_catalog._data if '/security/' in key]
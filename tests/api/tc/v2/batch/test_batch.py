@@ -1,10 +1,12 @@
 """TcEx Framework Module"""
 
 # standard library
+import json
 import os
 from datetime import datetime, timedelta
 
 # third-party
+import pytest
 from _pytest.fixtures import FixtureRequest
 
 # first-party
@@ -126,3 +128,135 @@ class TestBatch:
             'b40930bbcf80744c86c46a12bc9da056641d722716c378f5659b9e555ef833e1'
         )
         assert batch._indicator_values(indicator_data) == indicator_data.split(' : ')
+
+    @staticmethod
+    def test_batch_data_chunks(request: FixtureRequest, tcex: TcEx):
+        """Test batch data is returned in bounded chunks."""
+        batch = tcex.api.tc.v2.batch(owner=os.getenv('TC_OWNER', 'TCI'))
+        batch._batch_max_chunk = 2
+
+        # a group association closure is always returned in the same chunk
+        adversary = batch.adversary(
+            name=f'{request.node.name}-adversary',
+            xid=batch.generate_xid(['pytest', 'adversary', request.node.name]),
+        )
+        campaign = batch.campaign(
+            name=f'{request.node.name}-campaign',
+            xid=batch.generate_xid(['pytest', 'campaign', request.node.name]),
+        )
+        incident = batch.incident(
+            name=f'{request.node.name}-incident',
+            xid=batch.generate_xid(['pytest', 'incident', request.node.name]),
+        )
+        adversary.association(campaign.xid)
+        campaign.association(incident.xid)
+
+        for i in range(3):
+            batch.address(ip=f'1.1.1.{i}', xid=batch.generate_xid(['pytest', 'address', str(i)]))
+
+        chunks = list(batch.data_chunks())
+        assert [len(c['group']) for c in chunks] == [3, 0, 0]
+        assert [len(c['indicator']) for c in chunks] == [0, 2, 1]
+        assert len(batch) == 0
+
+    @staticmethod
+    def test_batch_encoded_content(request: FixtureRequest, tcex: TcEx):
+        """Test batch content is built from the cached encoded TI data."""
+        batch = tcex.api.tc.v2.batch(owner=os.getenv('TC_OWNER', 'TCI'))
+        ti = batch.address(
+            ip='1.1.1.1', xid=batch.generate_xid(['pytest', 'address', request.node.name])
+        )
+        encoded = ti.encoded
+        assert ti.encoded is encoded
+
+        # any modification invalidates the cached encoded data
+        ti.tag(request.node.name)
+        assert ti.encoded != encoded
+        encoded = ti.encoded
+        ti.rating = 5
+        assert ti.encoded != encoded
+
+        # changes to a child object invalidate the cached encoded data of the parent
+        attribute = ti.attribute('Description', 'pytest')
+        encoded = ti.encoded
+        attribute.source = request.node.name
+        assert ti.encoded != encoded
+        encoded = ti.encoded
+
+        content = batch.data
+        content.pop('file')
+        assert json.loads(batch.encode_content(content)) == content
+        assert content['indicator'][0]['attribute'][0]['source'] == request.node.name
+        assert content.encoded['indicator'] == [encoded]
+
+    @staticmethod
+    def test_batch_submit_all_pipelined(request: FixtureRequest, tcex: TcEx):
+        """Test batch submit with multiple batch jobs in flight."""
+        batch = tcex.api.tc.v2.batch(owner=os.getenv('TC_OWNER', 'TCI'))
+        batch._batch_max_chunk = 2
+        for i in range(5):
+            batch.address(
+                ip=f'1.1.1.{i}',
+                xid=batch.generate_xid(['pytest', 'address', request.node.name, str(i)]),
+            )
+
+        batch_status = batch.submit_all(max_in_flight=2)
+        batch.close()
+        assert len(batch_status) == 3
+        assert [s.get('successCount') for s in batch_status] == [2, 2, 1]
+
+    @staticmethod
+    def test_batch_submit_files_concurrent(request: FixtureRequest, tcex: TcEx):
+        """Test document uploads using the file upload worker pool and streamed content."""
+        batch = tcex.api.tc.v2.batch(owner=os.getenv('TC_OWNER', 'TCI'), file_upload_workers=2)
+        for i in range(3):
+            batch.document(
+                name=f'{request.node.name}-{i}',
+                file_name='example.txt',
+                # content can be provided as an iterable of chunks
+                file_content=lambda xid: iter([b'Example ', b'file ', b'content']),
+                xid=batch.generate_xid(['pytest', 'document', request.node.name, str(i)]),
+            )
+
+        batch_status = batch.submit_all()
+        batch.close()
+        assert batch_status[0].get('successCount') == 3
+        assert batch.file_upload_report['total'] == 3
+        assert batch.file_upload_report['uploaded'] == 3
+
+    @staticmethod
+    def test_batch_add_indicators_bulk(request: FixtureRequest, tcex: TcEx):
+        """Test bulk adding columnar indicator data."""
+        batch = tcex.api.tc.v2.batch(owner=os.getenv('TC_OWNER', 'TCI'))
+        xids = [batch.generate_xid(['pytest', 'file', request.node.name, str(i)]) for i in range(3)]
+        count = batch.add_indicators(
+            {
+                'value1': [f'{i:032x}' for i in range(3)],
+                'value2': [f'{i:040x}' for i in range(3)],
+                'date_added': ['2024-01-01'] * 3,
+                'xid': xids,
+            },
+            type='File',
+            confidence='50',
+            save=True,
+        )
+        assert count == 3
+
+        indicator = batch.indicators_shelf[xids[0]]
+        assert indicator['summary'] == f'{0:032x} : {0:040x}'
+        assert indicator['confidence'] == 50
+        assert indicator['dateAdded'] == '2024-01-01T00:00:00Z'
+
+        # the first record for a xid is kept, the same as add_indicator
+        count = batch.add_indicators(
+            [{'summary': f'{9:032x}', 'xid': xids[0]}], type='File', save=True
+        )
+        assert count == 0
+        assert batch.indicators_shelf[xids[0]]['summary'] == f'{0:032x} : {0:040x}'
+
+        with pytest.raises(ValueError, match='equal length'):
+            batch.add_indicators({'value1': ['a', 'b'], 'rating': [1]}, type='File', save=True)
+
+        batch_status = batch.submit_all()
+        batch.close()
+        assert batch_status[0].get('successCount') == 3
@@ -0,0 +1,69 @@
+"""TcEx Framework Module"""
+
+# standard library
+import gzip
+import json
+from pathlib import Path
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_json_writer import BatchJsonWriter
+
+
+class TestBatchJsonWriter:
+    """Test the TcEx Batch JSON Writer Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize('compression', ['gzip', None])
+    def test_batch_json_writer_rollover(compression: str | None, tmp_path: Path):
+        """Test streaming batch json with rollover on max count."""
+        files = []
+        with BatchJsonWriter(
+            str(tmp_path),
+            compression=compression,
+            compression_level=1,
+            max_count=2,
+            callback=lambda fqfn, stats: files.append((fqfn, stats)),
+        ) as writer:
+            writer.write('group', json.dumps({'name': 'g1', 'xid': 'g1'}).encode())
+            assert writer.rollover() is False
+            for i in range(3):
+                writer.write('indicator', json.dumps({'summary': f'1.1.1.{i}'}).encode())
+                writer.rollover()
+
+        assert [(s['group'], s['indicator']) for _, s in files] == [(1, 1), (0, 2)]
+        contents = []
+        for fqfn, stats in files:
+            with (gzip.open if compression == 'gzip' else open)(fqfn, 'rb') as fh:
+                content = fh.read()
+            assert len(content) == stats['bytes']
+            contents.append(json.loads(content))
+        assert contents[0]['group'] == [{'name': 'g1', 'xid': 'g1'}]
+        assert contents[1] == {
+            'group': [],
+            'indicator': [{'summary': '1.1.1.1'}, {'summary': '1.1.1.2'}],
+        }
+
+    @staticmethod
+    def test_batch_json_writer_empty(tmp_path: Path):
+        """Test an opened file without any writes contains an empty batch."""
+        files = []
+        with BatchJsonWriter(
+            str(tmp_path), callback=lambda fqfn, stats: files.append(fqfn)
+        ) as writer:
+            writer.open()
+            writer.open()
+
+        assert len(files) == 1
+        with gzip.open(files[0], 'rb') as fh:
+            assert json.loads(fh.read()) == {'group': [], 'indicator': []}
+
+    @staticmethod
+    def test_batch_json_writer_order(tmp_path: Path):
+        """Test groups can not be written after indicators."""
+        with BatchJsonWriter(str(tmp_path)) as writer:
+            writer.write('indicator', b'{}')
+            with pytest.raises(RuntimeError):
+                writer.write('group', b'{}')
@@ -0,0 +1,75 @@
+"""TcEx Framework Module"""
+
+# standard library
+import os
+from pathlib import Path
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_store import SegmentStore, SqliteStore
+from tcex.api.tc.v2.batch.batch_store_abc import BatchStoreABC
+
+
+class TestBatchStore:
+    """Test the TcEx Batch Store Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize('store_class', [SegmentStore, SqliteStore])
+    def test_batch_store_dedup(store_class: type[BatchStoreABC], tmp_path: Path):
+        """Test batch store lookup and overwrite by xid."""
+        store = store_class(str(tmp_path / 'store'))
+        assert len(store) == 0
+        assert 'xid-1' not in store
+
+        store['xid-1'] = {'summary': '1.1.1.1', 'type': 'Address', 'xid': 'xid-1'}
+        store['xid-1'] = {'summary': '1.1.1.2', 'type': 'Address', 'xid': 'xid-1'}
+        assert 'xid-1' in store
+        assert len(store) == 1
+        assert store['xid-1']['summary'] == '1.1.1.2'
+
+        store.close(delete=True)
+        assert not os.path.isfile(store.fqfn)
+
+    @staticmethod
+    @pytest.mark.parametrize('store_class', [SegmentStore, SqliteStore])
+    def test_batch_store_drain(store_class: type[BatchStoreABC], tmp_path: Path):
+        """Test batch store sequential iteration while deleting records."""
+        store = store_class(str(tmp_path / 'store'))
+        for i in range(10):
+            store[f'xid-{i}'] = {'summary': f'1.1.1.{i}', 'type': 'Address', 'xid': f'xid-{i}'}
+
+        xids = []
+        for xid, data in store.items():
+            assert data['xid'] == xid
+            xids.append(xid)
+            del store[xid]
+            # records deleted ahead of the iterator are skipped
+            if xid == 'xid-0':
+                del store['xid-1']
+
+        assert xids == ['xid-0'] + [f'xid-{i}' for i in range(2, 10)]
+        assert len(store) == 0
+        store.close(delete=True)
+
+    @staticmethod
+    @pytest.mark.parametrize('store_class', [SegmentStore, SqliteStore])
+    def test_batch_store_object(store_class: type[BatchStoreABC], tmp_path: Path):
+        """Test batch store of non dict values."""
+        store = store_class(str(tmp_path / 'store'))
+        store['xid-1'] = {'fileContent': os.path.basename, 'xid': 'xid-1'}
+        assert store['xid-1']['fileContent'] is os.path.basename
+        store.close(delete=True)
+
+    @staticmethod
+    @pytest.mark.parametrize('store_class', [SegmentStore, SqliteStore])
+    def test_batch_store_set_many(store_class: type[BatchStoreABC], tmp_path: Path):
+        """Test batch store bulk write."""
+        store = store_class(str(tmp_path / 'store'))
+        store['xid-0'] = {'summary': '1.1.1.0', 'xid': 'xid-0'}
+        store.set_many((f'xid-{i}', {'summary': f'2.2.2.{i}', 'xid': f'xid-{i}'}) for i in range(3))
+        assert len(store) == 3
+        assert store['xid-0']['summary'] == '2.2.2.0'
+        assert [xid for xid, _ in store.items()] == ['xid-0', 'xid-1', 'xid-2']
+        store.close(delete=True)
@@ -0,0 +1,47 @@
+"""TcEx Framework Module"""
+
+# standard library
+from itertools import islice
+from pathlib import Path
+
+# first-party
+from tcex.api.tc.v2.batch.poll_strategy import AdaptivePollStrategy, IntervalPollStrategy
+
+
+class TestPollStrategy:
+    """Test the TcEx Batch Poll Strategy Module."""
+
+    @staticmethod
+    def test_poll_strategy_adaptive(tmp_path: Path):
+        """Test adaptive poll schedule, model learning, and model persistence."""
+        model_file = str(tmp_path / 'batch-poll-model.json')
+        strategy = AdaptivePollStrategy(model_file=model_file, jitter=0)
+
+        # small jobs get an early short poll followed by exponential back-off
+        assert list(islice(strategy.intervals(100), 6)) == [1, 2, 4, 8, 16, 20]
+
+        # a back_off from BatchSubmit.poll is added on each poll (linear back-off)
+        assert list(islice(strategy.intervals(100, 5, 2.5), 4)) == [5, 7.5, 10, 12.5]
+
+        # large jobs wait until just before the predicted completion
+        assert next(strategy.intervals(30_000)) == 90
+
+        strategy.complete(30_000, seconds=50, seconds_previous=40, polls=2)
+        assert strategy.predict(30_000) == 45
+        assert strategy.metrics['jobs'] == 1
+        assert strategy.metrics['error_seconds'] == 55
+
+        # the learned model is loaded by a new strategy (e.g., the next App run)
+        strategy = AdaptivePollStrategy(model_file=model_file, jitter=0)
+        assert strategy.predict(30_000) == 45
+        assert strategy.predict(60_000) == 90
+
+    @staticmethod
+    def test_poll_strategy_interval():
+        """Test interval poll schedule."""
+        strategy = IntervalPollStrategy()
+        assert list(islice(strategy.intervals(3_000), 4)) == [10, 7, 10, 12]
+        assert next(strategy.intervals(None)) == 15
+
+        strategy.complete(3_000, seconds=20, seconds_previous=10, polls=2)
+        assert next(strategy.intervals(3_000)) == 14
@@ -2,11 +2,15 @@
 
 # standard library
 import base64
+import hashlib
+import io
 import time
 from collections.abc import Callable
+from pathlib import Path
 
 # first-party
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
+from tcex.api.tc.v3.transfer import Transfer
 from tests.api.tc.v3.v3_helpers import TestV3, V3Helper
 
 
@@ -394,3 +398,25 @@ class TestGroupSnippets(TestV3):
         if not group.request.ok:
             print(f'The download failed: {group.request.reason}')
         # End Snippet
+
+    def test_document_download_to(self, tmp_path: Path):
+        """Test snippet"""
+        group = self.v3_helper.create_group(
+            file_name='example.pdf',
+            name='MyDocument',
+            type_='Document',
+        )
+        file_content = base64.b64decode(self.example_pdf)
+        _ = group.upload(io.BytesIO(file_content), transfer=Transfer())
+
+        # provide it enough time to upload the file.
+        time.sleep(1)
+
+        # Begin Snippet
+        group = self.tcex.api.tc.v3.group(id=group.model.id)
+        transfer = Transfer(hash_algorithms=['sha256'])
+        # content is written to the file in chunks
+        group.download_to(str(tmp_path / 'example.pdf'), transfer=transfer)
+        # End Snippet
+
+        assert transfer.hashes['sha256'] == hashlib.sha256(file_content).hexdigest()
@@ -259,6 +259,136 @@ class TestIndicators(TestV3):
         assert indicators_counts == indicator_count
         assert not indicator_ids, 'Not all indicators were returned.'
 
+    @pytest.mark.parametrize('prefetch,page_workers', [(2, 0), (0, 2)])
+    def test_indicator_get_many_concurrent(
+        self, prefetch: int, page_workers: int, request: FixtureRequest
+    ):
+        """Test Indicators Get Many with prefetched and parallel pages"""
+        indicator_ids = []
+        # create_indicator tags each indicator with the test function name
+        indicator_tag = request.node.originalname
+        for _ in range(0, 5):
+            indicator = self.v3_helper.create_indicator(
+                **{
+                    'active': True,
+                    'confidence': randint(0, 100),
+                    'rating': randint(1, 5),
+                    'type': 'Address',
+                }
+            )
+            indicator_ids.append(indicator.model.id)
+
+        # use a small page size to ensure multiple pages are retrieved
+        indicators = self.v3.indicators(params={'result_limit': 2})
+        indicators.filter.tag(TqlOperator.EQ, indicator_tag)
+        indicators.page_size = 2
+        indicators.page_workers = page_workers
+        indicators.prefetch = prefetch
+        assert sorted(indicator.model.id for indicator in indicators) == sorted(indicator_ids)
+
+    def test_indicator_get_many_as_dicts(self, request: FixtureRequest):
+        """Test Indicators Get Many as raw dicts and lightweight records"""
+        indicator_ids = []
+        # create_indicator tags each indicator with the test function name
+        indicator_tag = request.node.name
+        for _ in range(0, 3):
+            indicator = self.v3_helper.create_indicator(
+                **{
+                    'active': True,
+                    'rating': randint(1, 5),
+                    'type': 'Address',
+                }
+            )
+            indicator_ids.append(indicator.model.id)
+
+        indicators = self.v3.indicators()
+        indicators.filter.tag(TqlOperator.EQ, indicator_tag)
+        assert sorted(indicator['id'] for indicator in indicators.as_dicts()) == sorted(
+            indicator_ids
+        )
+
+        for record in indicators.as_records():
+            assert record['id'] in indicator_ids
+            assert record.model.id == record['id']
+
+    def test_indicator_count_exists(self, request: FixtureRequest):
+        """Test Indicators count and exists"""
+        indicators = self.v3.indicators()
+        indicators.filter.tag(TqlOperator.EQ, request.node.name)
+        assert indicators.exists() is False
+        assert indicators.count() == 0
+
+        # create_indicator tags each indicator with the test function name
+        for _ in range(0, 2):
+            self.v3_helper.create_indicator(
+                **{
+                    'active': True,
+                    'rating': randint(1, 5),
+                    'type': 'Address',
+                }
+            )
+
+        assert indicators.exists() is True
+        # the approximate count is the cached count from before the indicators were created
+        assert indicators.count(approximate=True) == 0
+        assert indicators.count() == 2
+        assert indicators.count(approximate=True) == 2
+
+    def test_indicator_bulk_create_update(self, request: FixtureRequest):
+        """Test Indicators bulk create and update"""
+        indicator_tag = request.node.name
+        indicators = [
+            self.v3.indicator(
+                ip=f'123.{randint(1, 255)}.{randint(1, 255)}.{i}',
+                rating=1,
+                tags={'data': [{'name': indicator_tag}]},
+                type='Address',
+            )
+            for i in range(1, 11)
+        ]
+
+        bulk = self.v3.bulk(max_workers=4, rate_limit=20)
+        results = bulk.create(indicators)
+        assert [result.object for result in results] == indicators
+        assert all(result.ok for result in results), [result.error for result in results]
+        assert all(indicator.model.id for indicator in indicators)
+
+        for indicator in indicators:
+            indicator.model.rating = 5
+        results = bulk.update(indicators)
+        assert all(result.ok for result in results), [result.error for result in results]
+
+        for indicator in indicators:
+            indicator.get()
+            assert indicator.model.rating == 5
+            indicator.delete()
+
+    def test_indicator_association_loader(self, request: FixtureRequest):
+        """Test batched loading of Indicator -> Group associations"""
+        group = self.v3_helper.create_group(name=request.node.name)
+        indicator_ids = []
+        for _ in range(0, 3):
+            indicator = self.v3_helper.create_indicator(
+                **{
+                    'associated_groups': {'id': group.model.id},
+                    'type': 'Address',
+                }
+            )
+            indicator_ids.append(indicator.model.id)
+
+        indicators = self.v3.indicators()
+        indicators.filter.id(TqlOperator.IN, indicator_ids)
+
+        loader = self.v3.association_loader()
+        associations = loader.load(indicators, 'associated_groups')
+        assert sorted(associations) == sorted(indicator_ids)
+        for groups in associations.values():
+            assert [g.model.id for g in groups] == [group.model.id]
+
+        # associations are served from the cache on the next load
+        loader.load(indicators, 'associated_groups')
+        assert loader.cache_hits == len(indicator_ids)
+
     def test_indicator_in_operator(self, request: FixtureRequest):
         """Test Indicators Get Many"""
         # [Pre-Requisite] - create case
@@ -0,0 +1,77 @@
+"""TcEx Framework Module"""
+
+# standard library
+import re
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.api.tc.v3.association_loader import AssociationLoader
+from tcex.api.tc.v3.groups.group import Group
+from tcex.api.tc.v3.indicators.indicator import Indicator
+
+
+class TestAssociationLoader:
+    """Test the TcEx V3 Association Loader Module."""
+
+    @staticmethod
+    def _session() -> MagicMock:
+        """Return a session that responds with the associated groups of the requested ids."""
+
+        def request(*_, **kwargs) -> MagicMock:
+            """Return associated group 10 and 100 + id for each id in the TQL filter."""
+            ids = [int(id_) for id_ in re.findall(r'\d+', kwargs['params']['tql'])]
+            response = MagicMock()
+            response.ok = True
+            response.text = ''
+            response.json.return_value = {
+                'data': [
+                    {
+                        'id': id_,
+                        'associatedGroups': {
+                            'data': [
+                                {'id': 10, 'name': 'group-10', 'type': 'Adversary'},
+                                {'id': 100 + id_, 'name': f'group-{id_}', 'type': 'Adversary'},
+                            ]
+                        },
+                    }
+                    for id_ in ids
+                ],
+                'status': 'Success',
+            }
+            return response
+
+        session = MagicMock()
+        session.request.side_effect = request
+        return session
+
+    def test_association_loader(self):
+        """Test associations are loaded in chunks and cached with LRU eviction."""
+        session = self._session()
+        loader = AssociationLoader(session, cache_size=3, chunk_size=2)
+        indicators = [Indicator(session=session, id=i, type='Address') for i in range(1, 5)]
+
+        data = loader.load(indicators, 'associated_groups')
+        assert session.request.call_count == 2
+        assert [session.request.call_args_list[i].kwargs['params']['tql'] for i in (0, 1)] == [
+            'id IN (1,2)',
+            'id IN (3,4)',
+        ]
+        assert [g.model.id for g in data[1]] == [10, 101]
+        assert all(isinstance(g, Group) for g in data[4])
+        assert (loader.cache_hits, loader.cache_misses) == (0, 4)
+
+        # the 3 most recently used parents are cached, the first was evicted
+        data = loader.load(indicators[1:], 'associated_groups')
+        assert session.request.call_count == 2
+        assert (loader.cache_hits, loader.cache_misses) == (3, 4)
+
+        data = loader.load(indicators[:1], 'associated_groups')
+        assert session.request.call_count == 3
+        assert (loader.cache_hits, loader.cache_misses) == (3, 5)
+        assert [g.model.id for g in data[1]] == [10, 101]
+
+    def test_association_loader_self(self):
+        """Test a group is not returned as an association of itself."""
+        loader = AssociationLoader(self._session())
+        group = Group(session=loader.session, id=10, name='group-10', type='Adversary')
+        assert [g.model.id for g in loader.load([group], 'associated_groups')[10]] == [110]
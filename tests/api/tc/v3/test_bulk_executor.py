@@ -0,0 +1,49 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.api.tc.v3.bulk_executor import BulkExecutor
+from tcex.api.tc.v3.indicators.indicator import Indicator
+
+
+class TestBulkExecutor:
+    """Test the TcEx V3 Bulk Executor Module."""
+
+    @staticmethod
+    def _response(body: str, status_code: int = 201) -> MagicMock:
+        """Return a response for the request body."""
+        response = MagicMock()
+        response.ok = status_code < 400
+        response.reason = 'Bad Gateway'
+        response.request.body = body
+        response.status_code = status_code
+        if status_code == 502:
+            # an error page from a proxy is not JSON
+            response.headers = {'Content-Type': 'text/html'}
+            response.json.side_effect = ValueError('Expecting value')
+            response.text = '<html>502 Bad Gateway</html>'
+        else:
+            data = json.loads(body)
+            response.headers = {'Content-Type': 'application/json'}
+            response.json.return_value = {'data': {'id': 1, **data}, 'status': 'Success'}
+        return response
+
+    def test_bulk_executor_create(self):
+        """Test a non-JSON error response is returned as a failed result."""
+        session = MagicMock()
+        session.request.side_effect = lambda method, url, data, **kwargs: self._response(
+            data, 502 if '2.2.2.2' in data else 201
+        )
+        indicators = [
+            Indicator(session=session, ip=f'{i}.{i}.{i}.{i}', type='Address') for i in range(1, 4)
+        ]
+
+        results = BulkExecutor(session, max_workers=2).create(indicators)
+        assert [r.ok for r in results] == [True, False, True]
+        assert [r.status_code for r in results] == [201, 502, 201]
+        assert results[0].object.model.id == 1
+        assert results[1].error == '<html>502 Bad Gateway</html>'
+        assert session.request.call_count == 3
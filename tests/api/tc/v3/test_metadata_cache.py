@@ -0,0 +1,79 @@
+"""TcEx Framework Module"""
+
+# standard library
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicator, Indicators
+from tcex.api.tc.v3.metadata_cache import MetadataCache, metadata_cache
+
+
+class TestMetadataCache:
+    """Test the TcEx V3 Metadata Cache Module."""
+
+    @staticmethod
+    def _session() -> MagicMock:
+        """Return a session that responds to OPTIONS requests."""
+        session = MagicMock()
+        session.base_url = 'https://pytest.threatconnect.com/api'
+        session.options.return_value.ok = True
+        session.options.return_value.json.return_value = {
+            'data': [{'keyword': 'summary', 'name': 'summary'}]
+        }
+        return session
+
+    def test_metadata_cache_shared(self):
+        """Test metadata is requested once for all objects and collections."""
+        session = self._session()
+        metadata_cache.clear()
+
+        for _ in range(3):
+            assert Indicator(session=session).available_fields == ['summary']
+            assert Indicators(session=session).tql_keywords == ['summary']
+        assert session.options.call_count == 2
+
+    def test_metadata_cache_ttl(self):
+        """Test expired entries are requested again and failures are not cached."""
+        session = self._session()
+        cache = MetadataCache(ttl=0)
+        cache.get(session, '/v3/indicators', 'fields')
+        cache.get(session, '/v3/indicators', 'fields')
+        assert session.options.call_count == 2
+
+        session.options.return_value.ok = False
+        cache = MetadataCache()
+        assert cache.get(session, '/v3/indicators', 'fields') == []
+        assert cache.misses == 1 and not cache._data
+
+    def test_metadata_cache_file(self, tmp_path: Path):
+        """Test the cache is persisted and ignored on a server version change."""
+        session = self._session()
+        cache_file = str(tmp_path / 'metadata.json')
+        MetadataCache(cache_file=cache_file, server_version='7.0').warm(
+            session, ['/v3/groups', '/v3/indicators']
+        )
+        assert session.options.call_count == 6
+
+        cache = MetadataCache(cache_file=cache_file, server_version='7.0')
+        assert cache.get(session, '/v3/groups', 'tql_options') == [
+            {'keyword': 'summary', 'name': 'summary'}
+        ]
+        assert session.options.call_count == 6
+
+        cache = MetadataCache(cache_file=cache_file, server_version='7.1')
+        cache.get(session, '/v3/groups', 'tql_options')
+        assert session.options.call_count == 7
+
+    def test_metadata_cache_copy(self, tmp_path: Path):
+        """Test callers get a copy of the metadata and an unwritable cache file is ignored."""
+        session = self._session()
+        cache = MetadataCache(cache_file=str(tmp_path / 'missing' / 'metadata.json'))
+        fields = cache.get(session, '/v3/indicators', 'fields')
+        fields[0]['name'] = 'modified'
+        fields.clear()
+
+        assert cache.get(session, '/v3/indicators', 'fields') == [
+            {'keyword': 'summary', 'name': 'summary'}
+        ]
+        assert session.options.call_count == 1
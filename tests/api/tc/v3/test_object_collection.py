@@ -0,0 +1,100 @@
+"""TcEx Framework Module"""
+
+# standard library
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicators
+from tcex.api.tc.v3.tql.tql_operator import TqlOperator
+
+
+class TestObjectCollection:
+    """Test the TcEx V3 Object Collection Module."""
+
+    @staticmethod
+    def _session(data: list[dict], count: int) -> MagicMock:
+        """Return a session that responds to GET requests."""
+        session = MagicMock()
+        session.request.return_value.ok = True
+        session.request.return_value.json.return_value = {
+            'count': count,
+            'data': data,
+            'status': 'Success',
+        }
+        return session
+
+    def test_object_collection_count(self):
+        """Test the count is cached per query and reused when approximate."""
+        session = self._session([{'id': 1}], 5)
+        indicators = Indicators(session=session, params={'fields': ['tags']})
+        indicators.filter.rating(TqlOperator.GT, 3)
+
+        assert indicators.count(approximate=True) == 5
+        assert indicators.count(approximate=True) == 5
+        assert session.request.call_count == 1
+
+        params = session.request.call_args.kwargs['params']
+        assert params == {'count': True, 'resultLimit': 1, 'tql': 'rating > 3'}
+
+        # len and the exact count always send a request
+        assert len(indicators) == 5
+        assert indicators.count() == 5
+        assert session.request.call_count == 3
+
+        # a new filter is a new query
+        indicators.filter.summary(TqlOperator.EQ, '1.1.1.1')
+        assert indicators.count(approximate=True) == 5
+        assert session.request.call_count == 4
+
+    def test_object_collection_exists(self):
+        """Test exists requests a single result without a count."""
+        session = self._session([], 0)
+        indicators = Indicators(session=session)
+        indicators.filter.summary(TqlOperator.EQ, '1.1.1.1')
+        assert indicators.exists() is False
+
+        params = session.request.call_args.kwargs['params']
+        assert params == {'resultLimit': 1, 'tql': 'summary = "1.1.1.1"'}
+
+        session.request.return_value.json.return_value['data'] = [{'id': 1}]
+        assert indicators.exists() is True
+
+    def test_object_collection_pages_parallel(self):
+        """Test parallel pages are planned from the exact count and continue past full pages."""
+        session = MagicMock()
+        total = {'count': 5}
+
+        def request(*_, **kwargs) -> MagicMock:
+            """Return the count or the page of ids for the resultStart of the request."""
+            params = kwargs['params']
+            response = MagicMock()
+            response.ok = True
+            if params.get('count') is True:
+                data = []
+            else:
+                start = params['resultStart']
+                data = [{'id': i} for i in range(start, min(start + 2, 7))]
+            response.json.return_value = {
+                'count': total['count'],
+                'data': data,
+                'status': 'Success',
+            }
+            return response
+
+        session.request.side_effect = request
+        indicators = Indicators(session=session)
+        indicators.page_size = 2
+        indicators.page_workers = 2
+
+        # the cached count is stale after 2 objects were created
+        assert indicators.count() == 5
+        total['count'] = 7
+        assert [r['id'] for r in indicators.as_dicts()] == list(range(7))
+        assert indicators.count(approximate=True) == 7
+
+        # the count is too low (e.g., objects were created during iteration)
+        with_low_count = Indicators(session=session)
+        with_low_count.page_size = 2
+        with_low_count.page_workers = 2
+        total['count'] = 4
+        assert [r['id'] for r in with_low_count.as_dicts()] == list(range(7))
@@ -0,0 +1,32 @@
+"""TcEx Framework Module"""
+
+# standard library
+import copy
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicator
+from tcex.api.tc.v3.object_record import ObjectRecord
+
+
+class TestObjectRecord:
+    """Test the TcEx V3 Object Record Module."""
+
+    @staticmethod
+    def test_object_record():
+        """Test raw field access and lazy object construction."""
+        data = {'id': 1, 'rating': 3, 'summary': '1.1.1.1', 'type': 'Address'}
+        record = ObjectRecord(Indicator, None, data)  # type: ignore
+
+        # raw field access does not build the object
+        assert record['summary'] == '1.1.1.1'
+        assert dict(record) == data
+        assert len(copy.copy(record)) == len(data)
+        assert record.get('rating') == 3
+        assert record.get('tags') is None
+        assert list(record.keys()) == list(data)
+        assert record._object is None
+
+        # attribute access builds the object once
+        assert record.model.rating == 3
+        assert isinstance(record.object, Indicator)
+        assert record.object is record.object
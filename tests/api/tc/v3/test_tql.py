@@ -0,0 +1,87 @@
+"""TcEx Framework Module"""
+
+# standard library
+from unittest.mock import MagicMock
+from urllib.parse import quote_plus
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicators
+from tcex.api.tc.v3.tql.tql_operator import TqlOperator
+
+
+class TestTql:
+    """Test the TcEx V3 TQL Module."""
+
+    def test_tql_as_str_cached(self):
+        """Test the TQL string is cached until a filter or nested filter is added."""
+        indicators = Indicators(session=MagicMock())
+        indicators.filter.rating(TqlOperator.GT, 3)
+        tql = indicators.tql.as_str
+        assert tql == 'rating > 3'
+        assert indicators.tql.as_str is tql
+
+        has_group = indicators.filter.has_group
+        assert indicators.tql.as_str == 'rating > 3 and hasGroup()'
+
+        has_group.id(TqlOperator.EQ, 12)
+        assert indicators.tql.as_str == 'rating > 3 and hasGroup(id = 12)'
+
+    def test_tql_add_filter_duplicate(self):
+        """Test identical filters are only added once."""
+        indicators = Indicators(session=MagicMock())
+        indicators.filter.summary(TqlOperator.EQ, '1.1.1.1')
+        indicators.filter.summary(TqlOperator.EQ, '1.1.1.1')
+        indicators.filter.summary(TqlOperator.EQ, '2.2.2.2')
+        assert indicators.tql.as_str == 'summary = "1.1.1.1" and summary = "2.2.2.2"'
+
+    def test_tql_as_str_chunks(self):
+        """Test a large "in" list is deduplicated and split over multiple TQL strings."""
+        indicators = Indicators(session=MagicMock())
+        indicators.filter.rating(TqlOperator.GT, 3)
+        ids = list(range(1_000, 3_000))
+        indicators.filter.id(TqlOperator.IN, ids + ids[:10])
+        assert indicators.tql.as_str_chunks(max_length=50_000) == [indicators.tql.as_str]
+
+        chunks = indicators.tql.as_str_chunks(max_length=1_000)
+        assert len(chunks) > 1
+        values = []
+        for chunk in chunks:
+            assert len(quote_plus(chunk)) <= 1_000
+            assert chunk.startswith('rating > 3 and id IN (')
+            values.extend(int(v) for v in chunk.split('(')[1].rstrip(')').split(','))
+        assert values == ids
+
+        indicators.tql.set_raw_tql('summary = "1.1.1.1"')
+        assert indicators.tql.as_str_chunks(max_length=1_000) == ['summary = "1.1.1.1"']
+
+    def test_tql_as_str_chunks_multi_valued(self):
+        """Test an "in" list on a multi-valued keyword is never chunked."""
+        indicators = Indicators(session=MagicMock())
+        indicators.filter.tag(TqlOperator.IN, [f'tag-{i}' for i in range(100)])
+        assert indicators.tql.as_str_chunks(max_length=1_000) == [indicators.tql.as_str]
+
+        # the largest "in" list on a single-valued keyword is chunked
+        indicators.filter.summary(TqlOperator.IN, [f'{i}.1.1.1' for i in range(500)])
+        chunks = indicators.tql.as_str_chunks(max_length=5_000)
+        assert 1 < len(chunks) < 10
+        assert all(chunk.count('"tag-99"') == 1 for chunk in chunks)
+
+    def test_tql_collection_chunks(self):
+        """Test the collection count and iteration send a request for each TQL chunk."""
+        session = MagicMock()
+        session.request.return_value.ok = True
+        session.request.return_value.json.return_value = {
+            'count': 2,
+            'data': [{'id': 1}],
+            'status': 'Success',
+        }
+
+        indicators = Indicators(session=session)
+        indicators.tql.max_length = 1_000
+        indicators.filter.id(TqlOperator.IN, list(range(1_000, 3_000)))
+        chunks = indicators.tql.as_str_chunks()
+
+        assert len(indicators) == 2 * len(chunks)
+        session.request.reset_mock()
+        assert len(list(indicators.as_dicts())) == len(chunks)
+        assert [c.kwargs['params']['tql'] for c in session.request.call_args_list] == chunks
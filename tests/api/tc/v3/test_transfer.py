@@ -0,0 +1,84 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import io
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.groups.group import Group
+from tcex.api.tc.v3.transfer import Transfer, UploadBody
+
+
+class TestTransfer:
+    """Test the TcEx V3 Transfer Module."""
+
+    content = b'0123456789' * 100
+
+    def _session(self, ok: bool = True) -> MagicMock:
+        """Return a session that streams the content."""
+        session = MagicMock()
+        session.request.return_value.ok = ok
+        session.request.return_value.headers = {'Content-Length': str(len(self.content))}
+        session.request.return_value.iter_content.side_effect = lambda size: (
+            self.content[i : i + size] for i in range(0, len(self.content), size)
+        )
+        return session
+
+    def test_transfer_download_to(self, tmp_path: Path):
+        """Test the attachment is streamed to a file with progress and hashes."""
+        session = self._session()
+        progress = []
+        transfer = Transfer(
+            progress=lambda done, total: progress.append((done, total)),
+            hash_algorithms=['md5', 'sha256'],
+        )
+
+        filename = tmp_path / 'sample.bin'
+        group = Group(session=session, id=1)
+        group.download_to(str(filename), chunk_size=256, transfer=transfer)
+
+        assert filename.read_bytes() == self.content
+        assert session.request.call_args.kwargs['stream'] is True
+        assert progress[0] == (256, 1_000)
+        assert progress[-1] == (1_000, 1_000)
+        assert transfer.hashes == {
+            'md5': hashlib.md5(self.content).hexdigest(),  # nosec
+            'sha256': hashlib.sha256(self.content).hexdigest(),
+        }
+
+        # file objects are written to directly
+        fh = io.BytesIO()
+        assert group.pdf_to(fh).bytes == len(self.content)
+        assert fh.getvalue() == self.content
+
+    def test_transfer_download_to_failed(self, tmp_path: Path):
+        """Test a failed download raises an error without writing a file."""
+        filename = tmp_path / 'sample.bin'
+        group = Group(session=self._session(ok=False), id=1)
+        with pytest.raises(RuntimeError):
+            group.download_to(str(filename))
+        assert not filename.exists()
+
+    def test_transfer_upload(self):
+        """Test file objects and iterables are streamed with progress and hashes."""
+        transfer = Transfer(hash_algorithms=['sha1'])
+        body = UploadBody(io.BytesIO(self.content), transfer, chunk_size=300)
+        assert len(body.body) == len(self.content)  # type: ignore
+        assert b''.join(body.body) == self.content
+        assert transfer.hashes['sha1'] == hashlib.sha1(self.content).hexdigest()  # nosec
+
+        # iterables have no length and are sent with chunked encoding
+        transfer = Transfer()
+        body = UploadBody(iter([b'abc', b'def']), transfer)
+        assert not hasattr(body.body, '__len__')
+        assert b''.join(body.body) == b'abcdef'
+        assert transfer.bytes == 6
+
+        session = self._session()
+        Group(session=session, id=1).upload('content', transfer=Transfer())
+        assert isinstance(session.request.call_args.kwargs['data'], UploadBody)
@@ -0,0 +1,110 @@
+"""TcEx Framework Module"""
+
+# standard library
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.cases.case_model import CaseModel
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.tags.tag_model import TagModel
+
+
+class TestV3Model:
+    """Test the TcEx V3 Model change tracking."""
+
+    @staticmethod
+    def _model() -> IndicatorModel:
+        """Return a model as returned from the API."""
+        return IndicatorModel(
+            **{
+                'id': 1,
+                'type': 'Address',
+                'ip': '1.1.1.1',
+                'rating': 3,
+                'tags': {'data': [{'id': 1, 'name': 'pytest'}]},
+                'attributes': {'data': [{'id': 1, 'type': 'Description', 'value': 'pytest'}]},
+            }
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'change',
+        [
+            lambda m: setattr(m, 'rating', 4),
+            lambda m: m.tags.data.append(TagModel(name='pytest-new')),
+            lambda m: setattr(m.tags, 'mode', 'replace'),
+            lambda m: setattr(m.attributes.data[0], 'value', 'pytest-updated'),
+            lambda m: m.tags.data.__setitem__(0, TagModel(name='pytest-replaced')),
+        ],
+    )
+    def test_v3_model_updated(change: Callable[[IndicatorModel], None]):
+        """Test model changes (including nested and in place changes) are tracked."""
+        model = TestV3Model._model()
+        assert model.updated is False
+        change(model)
+        assert model.updated is True
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'change',
+        [
+            lambda m: setattr(m, 'rating', m.rating),
+            lambda m: setattr(m, 'ip', '1.1.1.1'),
+            lambda m: setattr(m, 'tags', m.tags),
+            lambda m: [setattr(m, 'rating', 4), setattr(m, 'rating', 3)],
+        ],
+    )
+    def test_v3_model_not_updated(change: Callable[[IndicatorModel], None]):
+        """Test assigning an unchanged value is not tracked as a change."""
+        model = TestV3Model._model()
+        change(model)
+        assert model.updated is False
+
+    @staticmethod
+    @pytest.mark.parametrize('model_class', [CaseModel, IndicatorModel])
+    def test_v3_model_field_descriptors(model_class: type):
+        """Test the cached field descriptors match the model schema properties."""
+        descriptors = model_class._field_descriptors()
+        assert model_class._field_descriptors() is descriptors
+
+        properties = model_class(name='pytest')._properties()
+        assert descriptors.keys() == properties.keys()
+        for name, descriptor in descriptors.items():
+            property_ = properties[name]
+            assert descriptor['title'] == property_['title']
+            assert descriptor['read_only'] == property_.get('read_only')
+            assert descriptor['methods'] == property_.get('methods', [])
+
+    @staticmethod
+    def test_v3_model_gen_body():
+        """Test body generation for each kind of nested model."""
+        case = CaseModel(
+            name='pytest',
+            severity='Low',
+            status='Open',
+            assignee={'type': 'User', 'data': {'userName': 'pytest'}},
+            tags={'data': [{'name': 'pytest'}]},
+            workflow_template={'id': 1},
+        )
+        assert case.gen_body('POST') == {
+            'assignee': {'data': {'userName': 'pytest'}, 'type': 'User'},
+            'name': 'pytest',
+            'severity': 'Low',
+            'status': 'Open',
+            'tags': {'data': [{'name': 'pytest'}], 'mode': 'append'},
+            'workflowTemplate': {'id': 1},
+        }
+
+        indicator = TestV3Model._model()
+        assert indicator.gen_body('PUT', 'replace') == {
+            'attributes': {
+                'data': [{'id': 1, 'value': 'pytest'}],
+                'mode': 'replace',
+            },
+            'rating': 3,
+            'tags': {'data': [{'id': 1, 'name': 'pytest'}], 'mode': 'replace'},
+            'type': 'Address',
+        }